@@ -0,0 +1,43 @@
+"""
+Per-call overhead of position coercion: the nested _extract_position closure the
+helpers used to define on every call versus coerce_utils.to_position.
+
+Run from legacy/add-ons:  python benchmarks/coerce_benchmark.py
+"""
+
+import timeit
+import numpy as np
+from manim import Dot, Line
+from robo_manim_add_ons.coerce_utils import to_position
+
+
+def _closure_extract(obj):
+    """The nested helper every function used to define per call."""
+    def _extract_position(obj):
+        if hasattr(obj, 'get_center'):
+            return obj.get_center()
+        elif isinstance(obj, np.ndarray):
+            return obj
+        elif isinstance(obj, (list, tuple)):
+            return np.array(obj)
+        else:
+            raise TypeError(f"Expected Dot, np.array, or list, got {type(obj).__name__}")
+    return _extract_position(obj)
+
+
+def main(number: int = 100_000):
+    samples = {
+        "Dot": Dot([1, 2, 0]),
+        "Line": Line([0, 0, 0], [2, 1, 0]),
+        "ndarray": np.array([1.0, 2.0, 0.0]),
+        "list": [1.0, 2.0, 0.0],
+    }
+    print(f"{'input':<10}{'closure (us)':>14}{'to_position (us)':>18}")
+    for name, sample in samples.items():
+        before = timeit.timeit(lambda: _closure_extract(sample), number=number) / number * 1e6
+        after = timeit.timeit(lambda: to_position(sample), number=number) / number * 1e6
+        print(f"{name:<10}{before:>14.3f}{after:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,23 +5,32 @@ Robo Manim Add-ons: A collection of utilities and extensions for Manim Community
 __version__ = "0.2.1"
 
 from .geometry_utils import perp, parallel, project, reflect, extended_line, pll, xl
-from .label_utils import vertex_labels, edge_labels
+from .label_utils import vertex_labels, edge_labels, layout_labels, polygon_labels
 from .annotation_utils import distance_marker, label, hatched_region, dm, hatch
 from .intersection_utils import intersect_lines, intersect_line_circle, ill, ilc, icc, ilp
-from .vector_utils import VectorUtils, addv, subv, scalev
+from .vector_utils import VectorUtils, ArrowFactory, addv, subv, scalev
+from .field_utils import vector_field
+from . import vector_core
+from .vector3d_utils import forward3d, backward3d, shift_to3d, reverse3d, pll3d, perp3d, perpshift3d, vecsum3d, vecdiff3d, vecproject3d, chain3d, placeat3d, decompose3d, cross_product, triple_product, skew_line_distance, skew_line_closest_points, to_arrow3d, to_line3d, materialize3d
 from .point_utils import PointUtils, addp
-from .text_utils import TextUtils, text, text2
-from .transform_utils import translated, rotated, scaled
+from .text_utils import TextUtils, text, text2, MathTexIndex, tex_index, tex_part, index_overlay, index_map
+from .transform_utils import translated, rotated, scaled, TransformedView, transform_many, rotation_matrices, translation_matrices
 from .arrow_utils import ArrowUtil
 from .custom_objects import ArcDashedVMobject, ArcArrow
-from .exp_utils import Exp, x, y, st, ed, mid, mag, uv, vec, ang, slope, val, pt, m2v, v2m, x2v, vl, hl, lra, vra, r2p, a2p, ln, vt, tri, aa, aa2, rangle, rect, cr, sss, sas, ssa
+from .exp_plan import ExpPlan
+from .exp_utils import Exp, x, y, st, ed, mid, mag, uv, vec, ang, slope, x_many, y_many, mag_many, uv_many, vec_many, ang_many, slope_many, val, pt, m2v, v2m, x2v, vl, hl, lra, vra, r2p, a2p, ln, vt, tri, aa, aa2, rangle, rect, cr, sss, sas, ssa, sss_many, sas_many, ssa_many
+from .shape_utils import tri_polygons
 from .graph_utils import GraphUtils, graph
-from .style_utils import stroke, fill, sopacity, fopacity, sw, Style, style
+from .style_utils import stroke, fill, sopacity, fopacity, sw, Style, style, style_many, Theme, register_theme, get_theme, tag, apply_theme
 from .rogebra_scene import RogebraScene
 from .circle_utils import tangentc, chord, normal, sector
-from .triangle_utils import centroid, circumcenter, orthocenter, incenter, altitude
+from .triangle_utils import centroid, circumcenter, orthocenter, incenter, altitude, centroid_many, circumcenter_many, orthocenter_many, incenter_many
+from .tex_cache import TexCache, label_cache, cached_tex, prefetch_tex
+from .value_types import P2, Seg, Circ
+from .construction import Construction
+from .locus_utils import Locus, locus, circle_param, path_param
 
-__all__ = ["perp", "parallel", "project", "reflect", "extended_line", "pll", "xl", "vertex_labels", "edge_labels", "distance_marker", "label", "hatched_region", "dm", "hatch", "intersect_lines", "intersect_line_circle", "ill", "ilc", "icc", "ilp", "VectorUtils", "addv", "subv", "scalev", "PointUtils", "addp", "TextUtils", "text", "text2", "translated", "rotated", "scaled", "ArrowUtil", "ArcDashedVMobject", "ArcArrow", "Exp", "x", "y", "st", "ed", "mid", "mag", "uv", "vec", "ang", "slope", "val", "pt", "m2v", "v2m", "x2v", "vl", "hl", "lra", "vra", "r2p", "a2p", "ln", "vt", "tri", "aa", "aa2", "rangle", "rect", "cr", "sss", "sas", "ssa", "GraphUtils", "graph", "stroke", "fill", "sopacity", "fopacity", "sw", "Style", "style", "RogebraScene", "show_usage", "tangentc", "chord", "normal", "sector", "centroid", "circumcenter", "orthocenter", "incenter", "altitude"]
+__all__ = ["perp", "parallel", "project", "reflect", "extended_line", "pll", "xl", "vertex_labels", "edge_labels", "layout_labels", "polygon_labels", "distance_marker", "label", "hatched_region", "dm", "hatch", "intersect_lines", "intersect_line_circle", "ill", "ilc", "icc", "ilp", "VectorUtils", "ArrowFactory", "vector_field", "vector_core", "forward3d", "backward3d", "shift_to3d", "reverse3d", "pll3d", "perp3d", "perpshift3d", "vecsum3d", "vecdiff3d", "vecproject3d", "chain3d", "placeat3d", "decompose3d", "cross_product", "triple_product", "skew_line_distance", "skew_line_closest_points", "to_arrow3d", "to_line3d", "materialize3d", "addv", "subv", "scalev", "PointUtils", "addp", "TextUtils", "text", "text2", "MathTexIndex", "tex_index", "tex_part", "index_overlay", "index_map", "translated", "rotated", "scaled", "TransformedView", "transform_many", "rotation_matrices", "translation_matrices", "ArrowUtil", "ArcDashedVMobject", "ArcArrow", "Exp", "ExpPlan", "x", "y", "st", "ed", "mid", "mag", "uv", "vec", "ang", "slope", "x_many", "y_many", "mag_many", "uv_many", "vec_many", "ang_many", "slope_many", "val", "pt", "m2v", "v2m", "x2v", "vl", "hl", "lra", "vra", "r2p", "a2p", "ln", "vt", "tri", "aa", "aa2", "rangle", "rect", "cr", "sss", "sas", "ssa", "sss_many", "sas_many", "ssa_many", "tri_polygons", "GraphUtils", "graph", "stroke", "fill", "sopacity", "fopacity", "sw", "Style", "style", "style_many", "Theme", "register_theme", "get_theme", "tag", "apply_theme", "RogebraScene", "show_usage", "tangentc", "chord", "normal", "sector", "centroid", "circumcenter", "orthocenter", "incenter", "altitude", "centroid_many", "circumcenter_many", "orthocenter_many", "incenter_many", "TexCache", "label_cache", "cached_tex", "prefetch_tex", "P2", "Seg", "Circ", "Construction", "Locus", "locus", "circle_param", "path_param"]
 
 
 def show_usage():
@@ -5,7 +5,8 @@ This module provides utilities to create annotations like distance markers.
 """
 
 import numpy as np
-from manim import DoubleArrow, Line, MathTex, VGroup, Polygon, Intersection
+from manim import DoubleArrow, Line, VGroup, Polygon, Intersection
+from .tex_cache import cached_tex
 
 
 def distance_marker(point1, point2=None, color="#1e40af", stroke_width=2, tick_size=0.25, text="", label_offset=0.3, marker_offset=0):
@@ -98,7 +99,7 @@ def distance_marker(point1, point2=None, color="#1e40af", stroke_width=2, tick_s
 
     # Create VGroup with or without label
     if text:
-        marker_label = MathTex(text).set_color(color)
+        marker_label = cached_tex(text).set_color(color)
         # Position label at midpoint + perpendicular offset
         midpoint = (start_pt + end_pt) / 2
         label_position = midpoint + perpendicular_normalized * label_offset
@@ -148,7 +149,7 @@ def label(latex_text, point1, point2, buff=0.5, alpha=0.5, auto_rotate=True):
         >>> theta_label = label(r"\\theta", dot_a, dot_b, alpha=0.25, buff=0.3)
     """
     # Create MathTex label
-    label_obj = MathTex(latex_text)
+    label_obj = cached_tex(latex_text)
 
     # Extract coordinates from point1
     if hasattr(point1, 'get_center'):
@@ -1,10 +1,87 @@
 """
 Custom arrow tips for textbook-style vectors.
+
+The '>' tip geometry is cached as a point template per (angle, length) and
+placed with a single affine transform, so identical tips are never recomputed.
 """
 
 import numpy as np
 from manim import ArrowTip, VMobject
 
+# '>' tip templates keyed by (angle, length)
+_TIP_TEMPLATES = {}
+
+
+def segments_to_points(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Convert many straight segments into VMobject bezier points.
+
+    Each segment becomes one cubic curve with handles at 1/3 and 2/3, the same
+    representation Line uses, so the segments end up as separate subpaths of a
+    single VMobject.
+
+    Args:
+        starts: Array (N, 3) of segment start points
+        ends: Array (N, 3) of segment end points
+
+    Returns:
+        Array (N * 4, 3) of points for VMobject.set_points()
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons.arrow_tips import segments_to_points
+        >>>
+        >>> points = segments_to_points(np.array([LEFT, DOWN]), np.array([RIGHT, UP]))
+        >>> cross = VMobject().set_points(points)
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    delta = ends - starts
+    points = np.stack([starts, starts + delta / 3, starts + 2 * delta / 3, ends], axis=1)
+    return points.reshape(-1, 3)
+
+
+def tip_template(angle: float, length: float) -> np.ndarray:
+    """
+    Cached bezier points of a '>' tip pointing along +x with its tip at the origin.
+
+    Args:
+        angle: Angle between the two tip lines in radians
+        length: Length of each tip line
+
+    Returns:
+        Read-only array (8, 3): two straight cubic curves, tip -> upper back and tip -> lower back
+    """
+    key = (float(angle), float(length))
+    template = _TIP_TEMPLATES.get(key)
+    if template is None:
+        back_x = -length * np.cos(angle / 2)
+        back_y = length * np.sin(angle / 2)
+        origin = np.zeros(3)
+        template = segments_to_points(np.array([origin, origin]),
+                                      np.array([[back_x, back_y, 0], [back_x, -back_y, 0]]))
+        template.setflags(write=False)
+        _TIP_TEMPLATES[key] = template
+    return template
+
+
+def place_tip(template: np.ndarray, tip_point: np.ndarray, direction: np.ndarray) -> np.ndarray:
+    """
+    Move a tip template so its tip is at tip_point, pointing along direction.
+
+    Args:
+        template: Points from tip_template()
+        tip_point: Where the tip goes
+        direction: Direction the tip points to (any length)
+
+    Returns:
+        New array of placed points
+    """
+    direction = np.asarray(direction, dtype=float)
+    unit = direction / np.linalg.norm(direction)
+    perp = np.array([-unit[1], unit[0], 0.0])
+    return np.asarray(tip_point, dtype=float) + template[:, 0:1] * unit + template[:, 1:2] * perp
+
 
 class SimpleArrowTip(ArrowTip):
     """
@@ -26,32 +103,9 @@ class SimpleArrowTip(ArrowTip):
         VMobject.__init__(self, stroke_width=stroke_width, **kwargs)
 
     def generate_points(self):
-        """Generate the two line segments forming the '>' shape."""
-        half_angle = self.angle / 2
-
-        # Tip is at origin (0, 0, 0)
-        tip = np.array([0, 0, 0])
-
-        # Upper line: from tip back at angle
-        upper_back = np.array([
-            -self._arrow_length * np.cos(half_angle),
-            self._arrow_length * np.sin(half_angle),
-            0
-        ])
-
-        # Lower line: from tip back at angle
-        lower_back = np.array([
-            -self._arrow_length * np.cos(half_angle),
-            -self._arrow_length * np.sin(half_angle),
-            0
-        ])
-
-        # Draw two separate line segments (no connection at back)
-        # Upper line: tip -> upper_back
-        self.set_points_as_corners([tip, upper_back])
-        # Start new disconnected path for lower line
-        self.start_new_path(tip)
-        self.add_line_to(lower_back)
+        """Generate the two line segments forming the '>' shape (tip at origin)."""
+        # Two disconnected subpaths, tip -> upper back and tip -> lower back
+        self.set_points(tip_template(self.angle, self._arrow_length).copy())
 
     @property
     def base(self) -> np.ndarray:
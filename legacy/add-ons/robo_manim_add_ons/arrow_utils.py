@@ -12,7 +12,7 @@ Provides ArrowUtil class for creating arrows with:
 import numpy as np
 from manim import VMobject, VGroup, Line, DashedLine, Circle, Arc, PI, DEGREES
 from manim.utils.space_ops import rotate_vector
-from .arrow_tips import SimpleArrowTip
+from .arrow_tips import tip_template, place_tip
 
 
 class ArrowUtil:
@@ -109,25 +109,16 @@ class ArrowUtil:
         Returns:
             list: Two Line objects forming the tip
         """
-        sign = 1 if invert else -1
         index = -1 if not invert else 0
 
-        # Get the tip point
+        # Get the tip point and the direction the tip points to
         tip_point = line.get_all_points()[index]
+        direction = line.get_unit_vector() * (-1 if invert else 1)
 
-        # Calculate tip vector
-        unit_vector = line.get_unit_vector()
-        tip_vector = unit_vector * tip_length * sign
-
-        # Create base line for tip
-        base_tip = Line(tip_point, tip_point + tip_vector)
-
-        # Create the two tip lines by rotating
-        down_tip = base_tip.copy()
-        up_tip = base_tip.copy()
-
-        down_tip.rotate(tip_angle, about_point=tip_point)
-        up_tip.rotate(-tip_angle, about_point=tip_point)
+        # Cached '>' template (lines tip_angle off the shaft), placed in one transform
+        points = place_tip(tip_template(2 * tip_angle, tip_length), tip_point, direction)
+        up_tip = Line(points[0], points[3])
+        down_tip = Line(points[4], points[7])
 
         return [down_tip, up_tip]
 
@@ -216,13 +207,10 @@ class ArrowUtil:
             PI / 2
         )
 
-        # Create tip lines
-        tip_vector = tangent_direction * tip_length
-        down_tip = Line(end, end - tip_vector)
-        up_tip = down_tip.copy()
-
-        down_tip.rotate(tip_angle, about_point=end)
-        up_tip.rotate(-tip_angle, about_point=end)
+        # Create tip lines from the cached '>' template
+        points = place_tip(tip_template(2 * tip_angle, tip_length), end, tangent_direction)
+        down_tip = Line(points[4], points[7])
+        up_tip = Line(points[0], points[3])
 
         arrow_group.add(down_tip, up_tip)
 
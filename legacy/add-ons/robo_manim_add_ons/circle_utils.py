@@ -8,18 +8,7 @@ chords, and sectors on circles. All angles are in degrees.
 import numpy as np
 from manim import Line, Circle, Dot, DEGREES, TangentLine, Sector
 from typing import Union
-
-
-def _extract_position(obj):
-    """Extract position from Dot/object or np.array."""
-    if hasattr(obj, 'get_center'):
-        return obj.get_center()
-    elif isinstance(obj, np.ndarray):
-        return obj
-    elif isinstance(obj, (list, tuple)):
-        return np.array(obj)
-    else:
-        raise TypeError(f"Expected Dot, np.array, or list, got {type(obj).__name__}")
+from .coerce_utils import to_position
 
 
 def tangentc(circle: Circle, angle: Union[float, Dot, np.ndarray], length: float = 3) -> TangentLine:
@@ -50,7 +39,7 @@ def tangentc(circle: Circle, angle: Union[float, Dot, np.ndarray], length: float
         alpha = (angle % 360) / 360
     else:
         # Point given - find the angle
-        point = _extract_position(angle)
+        point = to_position(angle)
         center = circle.get_center()
         vec = point - center
         angle_rad = np.arctan2(vec[1], vec[0])
@@ -122,7 +111,7 @@ def normal(circle: Circle, angle: Union[float, Dot, np.ndarray], length: float =
     if isinstance(angle, (int, float)):
         point = circle.point_at_angle(angle * DEGREES)
     else:
-        point = _extract_position(angle)
+        point = to_position(angle)
 
     # Normal direction is from center through point
     normal_dir = point - center
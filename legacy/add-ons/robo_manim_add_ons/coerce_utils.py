@@ -0,0 +1,210 @@
+"""
+Shared coordinate coercion for the helper functions.
+
+Converts Dots, Lines, other mobjects, numpy arrays and lists into positions. The
+extractor is looked up once per class and cached, with fast paths for ndarray,
+list/tuple, plain Dots and straight Lines, so helpers no longer re-create nested
+_extract_position closures or probe instances with hasattr on every call.
+"""
+
+import numpy as np
+from manim import Dot, Line
+
+
+def _from_array(obj):
+    return obj
+
+
+def _from_sequence(obj):
+    if len(obj) == 2:
+        return np.array([obj[0], obj[1], 0.0])
+    return np.array(obj)
+
+
+def _from_dot(obj):
+    # Dot.get_center() is the bounding box center of its own points
+    if obj.submobjects:
+        return obj.get_center()
+    points = obj.points
+    return (points.min(axis=0) + points.max(axis=0)) / 2
+
+
+def _from_line(obj):
+    # A straight, tipless Line's bounding box center is the midpoint of its ends;
+    # subclasses and curved or tipped lines use the regular bounding box center
+    if type(obj) is not Line or obj.submobjects or obj.path_arc:
+        return obj.get_center()
+    points = obj.points
+    return (points[0] + points[-1]) / 2
+
+
+def _from_mobject(obj):
+    return obj.get_center()
+
+
+# Extractors per exact type, filled lazily by _extractor_for()
+_EXTRACTORS = {
+    np.ndarray: _from_array,
+    list: _from_sequence,
+    tuple: _from_sequence,
+    Dot: _from_dot,
+    Line: _from_line,
+}
+
+# Whether instances of a type count as points (objects with get_center or ndarray)
+_POINT_TYPES = {}
+
+
+def _extractor_for(cls):
+    """Find and cache the extractor for a class."""
+    extractor = _EXTRACTORS.get(cls)
+    if extractor is None:
+        if hasattr(cls, 'get_center'):
+            extractor = _from_mobject
+        elif issubclass(cls, np.ndarray):
+            extractor = _from_array
+        elif issubclass(cls, (list, tuple)):
+            extractor = _from_sequence
+        else:
+            return None
+        _EXTRACTORS[cls] = extractor
+    return extractor
+
+
+def to_position(obj, sequences: bool = True) -> np.ndarray:
+    """
+    Extract a position from a Dot/object, np.array, or list.
+
+    Args:
+        obj: Dot or any object with get_center(), numpy array, or list/tuple
+        sequences: Whether lists and tuples are accepted (default True)
+
+    Returns:
+        Position as numpy array (arrays are returned as-is, 2D lists are padded to 3D)
+
+    Raises:
+        TypeError: If the object type is not supported
+
+    Example:
+        >>> from manim import Dot, UP
+        >>> from robo_manim_add_ons.coerce_utils import to_position
+        >>>
+        >>> to_position(Dot(UP))      # array([0., 1., 0.])
+        >>> to_position([1, 2])       # array([1., 2., 0.])
+    """
+    cls = type(obj)
+    extractor = _EXTRACTORS.get(cls) or _extractor_for(cls)
+    if extractor is None or (extractor is _from_sequence and not sequences):
+        if sequences:
+            raise TypeError(f"Expected Dot, np.array, or list, got {cls.__name__}")
+        raise TypeError(f"Expected Dot or np.array, got {cls.__name__}")
+    return extractor(obj)
+
+
+def _pad3(obj) -> np.ndarray:
+    """Convert a 2D or 3D point-like into a 3D array."""
+    arr = np.asarray(obj, dtype=float)
+    return np.append(arr, 0.0) if arr.shape == (2,) else arr
+
+
+def to_positions(objs) -> np.ndarray:
+    """
+    Collect the positions of many points/objects into one array.
+
+    Args:
+        objs: Sequence of Dots/objects, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N, 3) (2D input is padded with z = 0; empty input gives (0, 3))
+
+    Raises:
+        TypeError: If an element is not a supported point
+
+    Example:
+        >>> from robo_manim_add_ons.coerce_utils import to_positions
+        >>>
+        >>> to_positions([Dot(LEFT), [1, 2]])   # array([[-1., 0., 0.], [1., 2., 0.]])
+    """
+    if isinstance(objs, np.ndarray) and objs.ndim == 2:
+        points = objs.astype(float, copy=False)
+    elif len(objs) == 0:
+        return np.empty((0, 3))
+    else:
+        points = np.array([to_position(obj) for obj in objs], dtype=float).reshape(len(objs), -1)
+    if points.shape[1] == 2:
+        points = np.hstack([points, np.zeros((len(points), 1))])
+    return points
+
+
+def to_vectors(objs) -> np.ndarray:
+    """
+    Collect many vectors into one array: end - start for Lines/Arrows, rows for arrays/lists.
+
+    Args:
+        objs: Sequence of Lines/Arrows (anything with get_vector()), np.arrays or lists,
+              or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N, 3) (2D input is padded with z = 0; empty input gives (0, 3))
+
+    Raises:
+        TypeError: If an element is not a supported vector
+
+    Example:
+        >>> from robo_manim_add_ons.coerce_utils import to_vectors
+        >>>
+        >>> to_vectors([Arrow(ORIGIN, RIGHT, buff=0), [0, 2]])   # array([[1., 0., 0.], [0., 2., 0.]])
+    """
+    if isinstance(objs, np.ndarray) and objs.ndim == 2:
+        vectors = objs.astype(float, copy=False)
+    elif len(objs) == 0:
+        return np.empty((0, 3))
+    else:
+        rows = []
+        for obj in objs:
+            if type(obj) is Line and not obj.submobjects:
+                # Straight line without tips: its ends are the first and last point
+                rows.append(obj.points[-1] - obj.points[0])
+            elif hasattr(obj, 'get_vector'):
+                rows.append(obj.get_vector())
+            elif isinstance(obj, (np.ndarray, list, tuple)):
+                rows.append(_pad3(obj))
+            else:
+                raise TypeError(
+                    f"Unsupported type {type(obj).__name__}. "
+                    "Expected object with get_vector(), numpy array, or list."
+                )
+        vectors = np.array(rows, dtype=float).reshape(len(rows), -1)
+    if vectors.shape[1] == 2:
+        vectors = np.hstack([vectors, np.zeros((len(vectors), 1))])
+    return vectors
+
+
+def is_point(obj, sequences: bool = False) -> bool:
+    """
+    Check if obj is a Dot/object with get_center() or np.array.
+
+    Args:
+        obj: Object to check
+        sequences: Whether lists and tuples also count as points (default False)
+
+    Returns:
+        True if obj can be used as a point
+    """
+    cls = type(obj)
+    kind = _POINT_TYPES.get(cls)
+    if kind is None:
+        if hasattr(cls, 'get_center') or issubclass(cls, np.ndarray):
+            kind = 'point'
+        elif issubclass(cls, (list, tuple)):
+            kind = 'sequence'
+        else:
+            kind = 'other'
+        _POINT_TYPES[cls] = kind
+    return kind == 'point' or (sequences and kind == 'sequence')
+
+
+def is_number(obj) -> bool:
+    """Check if obj is a number (int or float)."""
+    return isinstance(obj, (int, float))
+
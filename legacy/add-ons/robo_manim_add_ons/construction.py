@@ -0,0 +1,250 @@
+"""
+Incremental construction graph for dependent geometry.
+
+A Construction records every helper call as a node together with its inputs.
+Free nodes track mobjects the scene moves (Dots, Lines, ValueTrackers); derived
+nodes are recomputed lazily, and only when one of their upstream free nodes has
+actually moved. Bound mobjects follow their node through an updater that only
+calls become() when the node produced a new value.
+"""
+
+import inspect
+import weakref
+from importlib import import_module
+import numpy as np
+from manim import Mobject, VGroup
+
+
+# func -> supports as_value; weak keys so lambdas passed to node() can be collected
+_AS_VALUE = weakref.WeakKeyDictionary()
+
+
+def _accepts_as_value(func) -> bool:
+    """Check whether a helper supports the as_value keyword."""
+    try:
+        return _AS_VALUE[func]
+    except (KeyError, TypeError):
+        pass
+    try:
+        result = 'as_value' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        result = False
+    try:
+        _AS_VALUE[func] = result
+    except TypeError:
+        pass  # not weak-referenceable (builtins); checked again next time
+    return result
+
+
+def _materialize(value) -> Mobject:
+    """Turn a node value into a mobject."""
+    if isinstance(value, Mobject):
+        return value.copy()
+    if hasattr(value, 'to_mobject'):
+        return value.to_mobject()
+    if value is None:
+        return VGroup()
+    if isinstance(value, (tuple, list)):
+        return VGroup(*(_materialize(item) for item in value))
+    raise TypeError(f"Cannot create a mobject from node value of type {type(value).__name__}")
+
+
+class Node:
+    """
+    One value in a Construction.
+
+    Free nodes wrap a mobject or ValueTracker; derived nodes wrap a helper call.
+    Read the current value with node.value.
+    """
+
+    __slots__ = ('construction', 'func', 'inputs', 'kwargs', 'source',
+                 '_value', '_dirty', '_signature', 'version', 'dependents')
+
+    def __init__(self, construction, func=None, inputs=(), kwargs=None, source=None):
+        self.construction = construction
+        self.func = func
+        self.inputs = inputs
+        self.kwargs = kwargs or {}
+        self.source = source
+        self._value = None
+        self._dirty = True
+        self._signature = None
+        self.version = 0
+        self.dependents = []
+
+    @property
+    def is_free(self) -> bool:
+        return self.func is None
+
+    @property
+    def value(self):
+        """Current value, recomputed only if an upstream free node moved."""
+        if self._dirty:
+            if self.is_free:
+                self._value = self.source.get_value() if hasattr(self.source, 'get_value') else self.source
+            else:
+                args = [item.value if isinstance(item, Node) else item for item in self.inputs]
+                self._value = self.func(*args, **self.kwargs)
+            self._dirty = False
+            self.version += 1
+        return self._value
+
+    def invalidate(self) -> None:
+        """Mark this node and everything downstream of it dirty."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._dirty and node is not self:
+                continue
+            node._dirty = True
+            stack.extend(node.dependents)
+
+    def _read_signature(self):
+        """Snapshot of the tracked source used to detect movement."""
+        if hasattr(self.source, 'get_value'):
+            return self.source.get_value()
+        return self.source.points.copy()
+
+    def __repr__(self):
+        if self.is_free:
+            return f"Node(free {type(self.source).__name__})"
+        name = getattr(self.func, '__name__', repr(self.func))
+        return f"Node({name}, {len(self.inputs)} inputs)"
+
+
+class Construction:
+    """
+    Dependency graph of helper calls with lazy, incremental recomputation.
+
+    Any package helper can be called through the construction (c.perp(...),
+    c.ill(...), c.circumcenter(...)); arguments that are nodes become edges of the
+    graph. Helpers that support as_value are evaluated with lightweight values, so
+    intermediate steps do not allocate mobjects.
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import Construction
+        >>>
+        >>> A, B, C = Dot(LEFT * 2), Dot(RIGHT * 2), Dot(UP * 2)
+        >>> c = Construction()
+        >>> a, b, cc = c.free(A), c.free(B), c.free(C)
+        >>> O = c.circumcenter(a, b, cc)
+        >>> H = c.orthocenter(a, b, cc)
+        >>> euler = c.node(lambda p, q: Line(p.get_center(), q.get_center()), O, H)
+        >>> self.add(A, B, C, c.bind(O, color=RED), c.bind(euler, color=YELLOW))
+        >>> self.play(A.animate.shift(DOWN))  # only O, H and the Euler line update
+    """
+
+    def __init__(self):
+        """Initialize an empty construction."""
+        self.free_nodes = []
+        self.nodes = []
+        # Bound updaters that ran since the last per-frame refresh
+        self._updated = set()
+
+    def free(self, source) -> Node:
+        """
+        Add a free node that tracks a mobject or ValueTracker.
+
+        Args:
+            source: Mobject (Dot, Line, ...) or ValueTracker moved by the scene
+
+        Returns:
+            The free Node
+        """
+        node = Node(self, source=source)
+        node._signature = node._read_signature()
+        self.free_nodes.append(node)
+        self.nodes.append(node)
+        return node
+
+    def node(self, func, *inputs, **kwargs) -> Node:
+        """
+        Add a derived node computed as func(*inputs, **kwargs).
+
+        Args:
+            func: Any callable, typically a package helper
+            *inputs: Arguments; Node arguments are replaced by their current value
+            **kwargs: Keyword arguments passed to func
+
+        Returns:
+            The derived Node
+        """
+        if 'as_value' not in kwargs and _accepts_as_value(func):
+            kwargs['as_value'] = True
+        node = Node(self, func=func, inputs=inputs, kwargs=kwargs)
+        for item in inputs:
+            if isinstance(item, Node):
+                item.dependents.append(node)
+        self.nodes.append(node)
+        return node
+
+    def __getattr__(self, name):
+        """Expose every package helper as a node factory (c.perp, c.ill, ...)."""
+        func = None if name.startswith('_') else getattr(import_module(__package__), name, None)
+        if not callable(func):
+            raise AttributeError(f"'Construction' has no helper named '{name}'")
+        return lambda *inputs, **kwargs: self.node(func, *inputs, **kwargs)
+
+    def refresh(self) -> int:
+        """
+        Detect moved free nodes and invalidate their downstream nodes.
+
+        Returns:
+            Number of free nodes that moved since the last refresh
+        """
+        moved = 0
+        for node in self.free_nodes:
+            signature = node._read_signature()
+            if not np.array_equal(signature, node._signature):
+                node._signature = signature
+                node.invalidate()
+                moved += 1
+        return moved
+
+    def _frame_refresh(self, key) -> None:
+        """
+        Refresh once per frame on behalf of the bound updaters.
+
+        Every bound updater runs once per frame; the first one to run again
+        starts a new frame and does the refresh, the others reuse it.
+        """
+        if key in self._updated or not self._updated:
+            self.refresh()
+            self._updated.clear()
+        self._updated.add(key)
+
+    def bind(self, node: Node, color=None, **style) -> Mobject:
+        """
+        Create a mobject that follows a node.
+
+        The mobject gets an updater that rebuilds it only when the node has a new
+        value. All bound updaters share one refresh of the free nodes per frame.
+
+        Args:
+            node: Node to display
+            color: Color of the mobject (default None, keeps the helper's color)
+            **style: Additional arguments passed to set_style (stroke_width, fill_opacity, ...)
+
+        Returns:
+            Mobject with an updater attached
+        """
+        mobject = _materialize(node.value)
+        if color is not None:
+            mobject.set_color(color)
+        if style:
+            mobject.set_style(**style)
+        seen = [node.version]
+        key = object()
+
+        def update(mob):
+            self._frame_refresh(key)
+            value = node.value
+            if node.version != seen[0]:
+                seen[0] = node.version
+                new = _materialize(value)
+                new.match_style(mob)
+                mob.become(new)
+
+        mobject.add_updater(update)
+        return mobject
@@ -7,6 +7,120 @@ and visual elements, particularly for arc-based measurements and angle annotatio
 
 import numpy as np
 from manim import VMobject, Arc, DashedVMobject, TangentLine, PI, DEGREES, WHITE
+from .arrow_tips import segments_to_points
+
+
+def _dash_intervals(num_dashes, dashed_ratio, dash_offset, closed):
+    """
+    Compute dash start/end proportions exactly like DashedVMobject does.
+
+    Args:
+        num_dashes: Number of dashes
+        dashed_ratio: Ratio of dash length to total dash+gap length
+        dash_offset: Offset of the dash pattern along the path
+        closed: Whether the dashed path is closed
+
+    Returns:
+        Tuple (starts, ends) of arrays with proportions in [0, 1]
+    """
+    n = num_dashes
+    r = dashed_ratio
+    dash_len = r / n
+    if closed:
+        void_len = (1 - r) / n
+    else:
+        void_len = 1 - r if n == 1 else (1 - r) / (n - 1)
+
+    period = dash_len + void_len
+    phase_shift = (dash_offset % 1) * period
+    pattern_len = 1 if closed else 1 + void_len
+
+    offsets = np.arange(n) * period + phase_shift
+    starts = list(offsets % pattern_len)
+    ends = list((offsets + dash_len) % pattern_len)
+
+    # Open paths need the last dash clipped or split at the path end
+    if not closed:
+        if ends[-1] > 1 and starts[-1] > 1:
+            ends.pop()
+            starts.pop()
+        elif ends[-1] < dash_len:
+            if starts[-1] < 1:
+                starts.append(0)
+                ends.append(ends[-1])
+                ends[-2] = 1
+            else:
+                starts[-1] = 0
+        elif starts[-1] > (1 - dash_len):
+            ends[-1] = 1
+
+    return np.array(starts), np.array(ends)
+
+
+def _arc_parameters(vmobject):
+    """
+    Recover (center, radius, start_angle, angle) of a planar circular Arc.
+
+    Returns None if the object is not a plain Arc or has been transformed in a
+    way (non-uniform scaling, out-of-plane rotation, flipping) that no longer
+    matches its angle attribute.
+    """
+    if not isinstance(vmobject, Arc) or vmobject.submobjects or vmobject.get_num_points() < 4:
+        return None
+    # Sectors and annuli are Arcs too, but their outline is not a single arc
+    if len(vmobject.get_subpaths()) != 1:
+        return None
+
+    center = vmobject.get_arc_center()
+    start = vmobject.get_start()
+    radius_vector = start - center
+    radius = np.linalg.norm(radius_vector)
+    angle = vmobject.angle
+    if radius == 0 or not np.isfinite(radius):
+        return None
+
+    start_angle = np.arctan2(radius_vector[1], radius_vector[0])
+    end_angle = start_angle + angle
+    expected_end = center + radius * np.array([np.cos(end_angle), np.sin(end_angle), 0])
+    if not np.allclose(vmobject.get_end(), expected_end, atol=1e-6 * max(radius, 1)):
+        return None
+    return center, radius, start_angle, angle
+
+
+def _arc_dash_points(center, radius, start_angles, end_angles, curves_per_dash):
+    """
+    Build cubic bezier points for many arc pieces at once.
+
+    Args:
+        center: Arc center
+        radius: Arc radius
+        start_angles: Array (D,) of piece start angles
+        end_angles: Array (D,) of piece end angles
+        curves_per_dash: Number of cubic curves used per piece
+
+    Returns:
+        Array (D, curves_per_dash * 4, 3) of bezier control points
+    """
+    alphas = np.linspace(0, 1, curves_per_dash + 1)
+    spans = end_angles - start_angles
+    theta = start_angles[:, None] + spans[:, None] * alphas[None, :]
+    theta0, theta1 = theta[:, :-1], theta[:, 1:]
+
+    # Standard circular-arc handle length for a cubic segment
+    handle = 4 / 3 * np.tan((theta1 - theta0) / 4)
+    cos0, sin0 = np.cos(theta0), np.sin(theta0)
+    cos1, sin1 = np.cos(theta1), np.sin(theta1)
+
+    anchors1 = np.stack([cos0, sin0], axis=-1)
+    handles1 = anchors1 + handle[..., None] * np.stack([-sin0, cos0], axis=-1)
+    anchors2 = np.stack([cos1, sin1], axis=-1)
+    handles2 = anchors2 - handle[..., None] * np.stack([-sin1, cos1], axis=-1)
+
+    planar = np.stack([anchors1, handles1, handles2, anchors2], axis=2)
+    points = np.zeros(planar.shape[:-1] + (3,))
+    points[..., :2] = radius * planar
+    points += center
+    return points.reshape(len(start_angles), curves_per_dash * 4, 3)
 
 
 class ArcDashedVMobject(DashedVMobject):
@@ -14,7 +128,10 @@ class ArcDashedVMobject(DashedVMobject):
     Creates a dashed version of a VMobject, particularly useful for arcs.
 
     This class extends DashedVMobject to provide easy creation of dashed arcs
-    and other curved objects with customizable dash patterns.
+    and other curved objects with customizable dash patterns. Plain Arc inputs
+    are dashed analytically: the dash pattern is mapped to angles and all dash
+    curves are built in one vectorized pass instead of measuring and splitting
+    the bezier path.
     """
 
     def __init__(self,
@@ -44,13 +161,50 @@ class ArcDashedVMobject(DashedVMobject):
             >>> arc = Arc(radius=2, start_angle=0, angle=PI/2)
             >>> dashed_arc = ArcDashedVMobject(arc, num_dashes=20, color=BLUE)
         """
-        super().__init__(vmobject,
-                         num_dashes,
-                         dashed_ratio,
-                         dash_offset,
-                         color,
-                         equal_lengths,
-                         **kwargs)
+        arc_params = _arc_parameters(vmobject) if num_dashes > 0 else None
+        if arc_params is None:
+            super().__init__(vmobject,
+                             num_dashes,
+                             dashed_ratio,
+                             dash_offset,
+                             color,
+                             equal_lengths,
+                             **kwargs)
+            return
+
+        # Arc length is proportional to angle, so equal_lengths needs no measuring
+        self.dashed_ratio = dashed_ratio
+        self.num_dashes = num_dashes
+        VMobject.__init__(self, color=color, **kwargs)
+        self._add_arc_dashes(vmobject, *arc_params, dash_offset)
+
+    def _add_arc_dashes(self, arc, center, radius, start_angle, angle, dash_offset):
+        """Add one submobject per dash, built in closed form from the arc angles."""
+        starts, ends = _dash_intervals(self.num_dashes, self.dashed_ratio, dash_offset, arc.is_closed())
+        # On a full circle a dash may run through the start point
+        ends = np.where(ends < starts, ends + 1, ends)
+
+        # Same curve density as the source arc, at least one curve per dash
+        curves_per_radian = arc.get_num_curves() / max(abs(angle), 1e-9)
+        dash_span = abs(angle) * np.max(ends - starts)
+        curves_per_dash = max(1, int(np.ceil(dash_span * curves_per_radian)))
+
+        points = _arc_dash_points(
+            center, radius,
+            start_angle + starts * angle,
+            start_angle + ends * angle,
+            curves_per_dash,
+        )
+
+        dashes = []
+        for dash_points in points:
+            dash = VMobject()
+            dash.set_points(dash_points)
+            dashes.append(dash)
+        self.add(*dashes)
+
+        # Dashes take the arc style; the container itself matches it as DashedVMobject does
+        self.match_style(arc)
 
 
 class ArcArrow(VMobject):
@@ -120,12 +274,47 @@ class ArcArrow(VMobject):
         Add an arrow tip at the right (end) of the arc.
 
         This creates a two-line arrow tip tangent to the arc at the specified position.
+        The tangent, both tip lines and the normal line are computed in closed form
+        from the arc's center, radius and angles, and added as subpaths of a single
+        VMobject.
 
         Args:
             start_angle: Additional angle offset for the tip orientation (default 0)
             line_size: Length of the tip lines (default 0.3)
             invert: If False, adds tip at end; if True, adds tip at start (default False)
         """
+        arc_params = _arc_parameters(self.arc)
+        if arc_params is None:
+            self._add_tangent_line_tip(start_angle, line_size, invert)
+            return
+
+        center, radius, arc_start_angle, angle = arc_params
+        theta = arc_start_angle + angle if invert else arc_start_angle
+        point = center + radius * np.array([np.cos(theta), np.sin(theta), 0])
+
+        # Unit tangent in the direction of travel; inverted tips point backwards
+        direction = np.sign(angle) if angle != 0 else 1
+        tangent = direction * np.array([-np.sin(theta), np.cos(theta), 0])
+        if invert:
+            tangent = -tangent
+
+        def rotated(vector, phi):
+            c, s = np.cos(phi), np.sin(phi)
+            return np.array([c * vector[0] - s * vector[1], s * vector[0] + c * vector[1], 0])
+
+        down = rotated(tangent, self.tip_angle + start_angle) * line_size
+        up = rotated(tangent, -self.tip_angle + start_angle) * line_size
+        normal = rotated(tangent, PI / 2) * line_size / 2
+
+        starts = np.array([point, point, point - normal])
+        ends = np.array([point + down, point + up, point + normal])
+
+        tip = VMobject()
+        tip.set_points(segments_to_points(starts, ends))
+        self.add(tip)
+
+    def _add_tangent_line_tip(self, start_angle=0, line_size=0.3, invert=False):
+        """Build the tip from TangentLine copies, for arcs that are no longer circular."""
         arc = self.arc
         sign = -1 if invert else 1
         index = -1 if invert else 0
@@ -0,0 +1,341 @@
+"""
+Deferred construction plans for the exp_utils helpers.
+
+An ExpPlan records pt/ln/vt/cr/tri/aa calls (plus mid/st/ed) as nodes of a DAG
+instead of building mobjects. Identical sub-expressions are hash-consed into a
+single node, all geometry is evaluated level by level with one numpy operation
+per op, and only the nodes passed to show() are turned into mobjects by build().
+"""
+
+import numpy as np
+from .coerce_utils import to_position, is_point, is_number
+
+
+class PlanNode:
+    """
+    One recorded call in an ExpPlan.
+
+    Read the evaluated geometry with node.value: a (3,) point, a (2, 3) segment,
+    a (3, 3) triangle or a (center, radius) tuple, depending on the node kind.
+    """
+
+    __slots__ = ('plan', 'index', 'op', 'kind', 'inputs', 'kwargs', 'level')
+
+    def __init__(self, plan, index, op, kind, inputs, kwargs, level):
+        self.plan = plan
+        self.index = index
+        self.op = op
+        self.kind = kind
+        self.inputs = inputs
+        self.kwargs = kwargs
+        self.level = level
+
+    @property
+    def value(self):
+        """Evaluated geometry of this node (evaluates the plan if needed)."""
+        return self.plan.evaluate()[self.index]
+
+    def __repr__(self):
+        return f"PlanNode({self.op}, kind={self.kind}, level={self.level})"
+
+
+class ExpPlan:
+    """
+    Record exp_utils calls into a DAG and materialize only what reaches the scene.
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import Exp
+        >>>
+        >>> p = Exp.plan()
+        >>> A, B, C = p.pt(0, 0), p.pt(4, 0), p.pt(1, 3)
+        >>> AB = p.ln(A, B)                    # scaffolding, never built
+        >>> M = p.mid(p.st(AB), p.ed(AB))
+        >>> median = p.ln(C, M)
+        >>> p.show(p.tri(A, B, C), median, p.cr(M, 0.2, color=BLUE))
+        >>> self.add(*p.build())
+    """
+
+    def __init__(self):
+        """Initialize an empty plan."""
+        self.nodes = []
+        self._index = {}
+        self._shown = []
+        self._values = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _node(self, op, kind, inputs=(), kwargs=None):
+        """Create a node, or return the existing one for an identical call."""
+        kwargs = kwargs or {}
+        key = (op, inputs, tuple(sorted((k, _hashable(v)) for k, v in kwargs.items())))
+        node = self._index.get(key)
+        if node is None:
+            level = 1 + max((self.nodes[i].level for i in inputs if isinstance(i, int)), default=-1)
+            node = PlanNode(self, len(self.nodes), op, kind, inputs, kwargs, level)
+            self.nodes.append(node)
+            self._index[key] = node
+            self._values = None
+        return node
+
+    def _point(self, obj) -> int:
+        """Index of a point node for a PlanNode, Dot/object, np.array or list."""
+        if isinstance(obj, PlanNode):
+            if obj.kind != 'point':
+                raise TypeError(f"Expected a point node, got a {obj.kind} node")
+            return obj.index
+        position = to_position(obj)
+        return self._node('pt', 'point', (tuple(float(c) for c in position),)).index
+
+    def _segment(self, obj) -> int:
+        """Index of a segment node for a segment PlanNode or a Line."""
+        if isinstance(obj, PlanNode):
+            if obj.kind != 'segment':
+                raise TypeError(f"Expected a segment node, got a {obj.kind} node")
+            return obj.index
+        if hasattr(obj, 'get_start') and hasattr(obj, 'get_end'):
+            return self.ln(obj.get_start(), obj.get_end()).index
+        raise TypeError(f"Expected a segment node or Line, got {type(obj).__name__}")
+
+    def pt(self, x: float, y: float, z: float = 0) -> PlanNode:
+        """Record a point, like pt()."""
+        return self._node('pt', 'point', ((float(x), float(y), float(z)),))
+
+    def mid(self, a, b) -> PlanNode:
+        """Record the midpoint of two points, like mid(a, b)."""
+        return self._node('mid', 'point', (self._point(a), self._point(b)))
+
+    def st(self, segment) -> PlanNode:
+        """Record the start point of a segment, like st()."""
+        return self._node('st', 'point', (self._segment(segment),))
+
+    def ed(self, segment) -> PlanNode:
+        """Record the end point of a segment, like ed()."""
+        return self._node('ed', 'point', (self._segment(segment),))
+
+    def _segment_args(self, name, args):
+        """Normalize the ln()/vt() argument patterns into two point indices."""
+        if len(args) == 2:
+            return self._point(args[0]), self._point(args[1])
+        if len(args) == 3:
+            if (isinstance(args[0], PlanNode) or is_point(args[0])) and is_number(args[1]) and is_number(args[2]):
+                return self._point(args[0]), self.pt(args[1], args[2]).index
+            if is_number(args[0]) and is_number(args[1]) and (isinstance(args[2], PlanNode) or is_point(args[2])):
+                return self.pt(args[0], args[1]).index, self._point(args[2])
+            raise TypeError("For 3 arguments, expected either (dot, x, y) or (x, y, dot)")
+        if len(args) == 4:
+            if not all(is_number(arg) for arg in args):
+                raise TypeError("For 4 arguments, all must be numbers")
+            return self.pt(args[0], args[1]).index, self.pt(args[2], args[3]).index
+        raise ValueError(f"{name}() takes 2, 3, or 4 arguments, got {len(args)}")
+
+    def ln(self, *args) -> PlanNode:
+        """Record a line, with the same argument patterns as ln()."""
+        return self._node('ln', 'segment', self._segment_args('ln', args))
+
+    def vt(self, *args) -> PlanNode:
+        """Record a vector arrow, with the same argument patterns as vt()."""
+        return self._node('vt', 'segment', self._segment_args('vt', args))
+
+    def tri(self, p1, p2, p3) -> PlanNode:
+        """Record a triangle, like tri()."""
+        return self._node('tri', 'triangle', (self._point(p1), self._point(p2), self._point(p3)))
+
+    def cr(self, *args, **kwargs) -> PlanNode:
+        """Record a circle, with the same argument patterns as cr()."""
+        if len(args) == 1:
+            segment = self._segment(args[0])
+            return self._node('cr_pp', 'circle', (self.st(self.nodes[segment]).index,
+                                                  self.ed(self.nodes[segment]).index), kwargs)
+        if len(args) == 2:
+            if is_number(args[1]):
+                return self._node('cr_pr', 'circle', (self._point(args[0]), float(args[1])), kwargs)
+            return self._node('cr_pp', 'circle', (self._point(args[0]), self._point(args[1])), kwargs)
+        raise ValueError(f"cr() takes 1 or 2 arguments, got {len(args)}")
+
+    def aa(self, *args, radius=0.5, dash=True, **kwargs) -> PlanNode:
+        """Record an angle arc, with the same argument patterns as aa()."""
+        if len(args) == 3:
+            inputs = tuple(self._point(arg) for arg in args)
+        elif len(args) == 2:
+            inputs = tuple(self._segment(arg) for arg in args)
+        else:
+            raise ValueError(f"aa() takes 2 or 3 arguments, got {len(args)}")
+        return self._node('aa', 'angle', inputs, dict(kwargs, radius=radius, dash=dash))
+
+    def show(self, *nodes) -> 'ExpPlan':
+        """
+        Mark nodes that reach the scene.
+
+        Args:
+            *nodes: PlanNodes to materialize in build()
+
+        Returns:
+            self, for chaining
+        """
+        for node in nodes:
+            if node not in self._shown:
+                self._shown.append(node)
+        return self
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self) -> list:
+        """
+        Evaluate the geometry of every node.
+
+        Nodes are processed level by level; within a level all nodes with the same
+        op are computed with one vectorized numpy operation.
+
+        Returns:
+            List of node values, indexed by node.index
+        """
+        if self._values is not None and len(self._values) == len(self.nodes):
+            return self._values
+
+        values = [None] * len(self.nodes)
+        groups = {}
+        for node in self.nodes:
+            groups.setdefault((node.level, node.op), []).append(node)
+
+        for (_, op), nodes in sorted(groups.items(), key=lambda item: item[0][0]):
+            _OPS[op](nodes, values)
+
+        self._values = values
+        return values
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+
+    def materialize(self, node: PlanNode):
+        """
+        Build the mobject for a single node with the regular exp_utils helper.
+
+        Args:
+            node: PlanNode to build
+
+        Returns:
+            Dot, Line, Arrow, Polygon, Circle or ArcArrow
+        """
+        from .exp_utils import pt, ln, vt, tri, cr, aa
+        from manim import Line
+
+        values = self.evaluate()
+        value = values[node.index]
+        if node.kind == 'point':
+            return pt(*value)
+        if node.op == 'ln':
+            return ln(value[0], value[1])
+        if node.op == 'vt':
+            return vt(value[0], value[1])
+        if node.op == 'tri':
+            return tri(*value)
+        if node.kind == 'circle':
+            center, radius = value
+            return cr(center, radius, **node.kwargs)
+        if node.op == 'aa':
+            kwargs = dict(node.kwargs)
+            inputs = [values[i] for i in node.inputs]
+            if self.nodes[node.inputs[0]].kind == 'segment':
+                inputs = [Line(segment[0], segment[1]) for segment in inputs]
+            return aa(*inputs, **kwargs)
+        raise TypeError(f"Cannot materialize node with op '{node.op}'")
+
+    def build(self) -> list:
+        """
+        Evaluate the plan and build mobjects for the shown nodes only.
+
+        Returns:
+            List of mobjects in show() order
+        """
+        self.evaluate()
+        return [self.materialize(node) for node in self._shown]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+
+def _hashable(value):
+    """Make keyword values usable in the dedupe key."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _stack(values, indices) -> np.ndarray:
+    return np.array([values[i] for i in indices], dtype=float)
+
+
+def _op_pt(nodes, values):
+    for node in nodes:
+        values[node.index] = np.array(node.inputs[0], dtype=float)
+
+
+def _op_mid(nodes, values):
+    a = _stack(values, [n.inputs[0] for n in nodes])
+    b = _stack(values, [n.inputs[1] for n in nodes])
+    for node, point in zip(nodes, (a + b) / 2):
+        values[node.index] = point
+
+
+def _op_segment(nodes, values):
+    starts = _stack(values, [n.inputs[0] for n in nodes])
+    ends = _stack(values, [n.inputs[1] for n in nodes])
+    for node, segment in zip(nodes, np.stack([starts, ends], axis=1)):
+        values[node.index] = segment
+
+
+def _op_end(which):
+    def op(nodes, values):
+        segments = _stack(values, [n.inputs[0] for n in nodes])
+        for node, point in zip(nodes, segments[:, which]):
+            values[node.index] = point
+    return op
+
+
+def _op_tri(nodes, values):
+    corners = [_stack(values, [n.inputs[k] for n in nodes]) for k in range(3)]
+    for node, triangle in zip(nodes, np.stack(corners, axis=1)):
+        values[node.index] = triangle
+
+
+def _op_circle_point_radius(nodes, values):
+    centers = _stack(values, [n.inputs[0] for n in nodes])
+    for node, center in zip(nodes, centers):
+        values[node.index] = (center, node.inputs[1])
+
+
+def _op_circle_diameter(nodes, values):
+    a = _stack(values, [n.inputs[0] for n in nodes])
+    b = _stack(values, [n.inputs[1] for n in nodes])
+    centers = (a + b) / 2
+    radii = np.linalg.norm(b - a, axis=1) / 2
+    for node, center, radius in zip(nodes, centers, radii):
+        values[node.index] = (center, float(radius))
+
+
+def _op_angle(nodes, values):
+    # Angle arcs carry no geometry of their own; they are built from their inputs
+    for node in nodes:
+        values[node.index] = None
+
+
+_OPS = {
+    'pt': _op_pt,
+    'mid': _op_mid,
+    'ln': _op_segment,
+    'vt': _op_segment,
+    'st': _op_end(0),
+    'ed': _op_end(1),
+    'tri': _op_tri,
+    'cr_pr': _op_circle_point_radius,
+    'cr_pp': _op_circle_diameter,
+    'aa': _op_angle,
+}
@@ -10,6 +10,10 @@ from typing import Union
 from manim import Line, Arrow, Dot, Polygon, Arc, Angle, Circle, Rectangle, RED, RightAngle
 from .graph_utils import GraphUtils
 from .shape_utils import rect as _rect, tri_sss as _sss, tri_sas as _sas, tri_ssa as _ssa
+from .shape_utils import tri_sss_many as _sss_many, tri_sas_many as _sas_many, tri_ssa_many as _ssa_many
+from .value_types import point_result
+from .coerce_utils import to_position, to_positions, to_vectors, is_point, is_number
+from .exp_plan import ExpPlan
 
 
 def x(obj: Union[object, np.ndarray, list]) -> float:
@@ -104,7 +108,7 @@ def y(obj: Union[object, np.ndarray, list]) -> float:
         )
 
 
-def st(obj: Union[object, np.ndarray, list]) -> Dot:
+def st(obj: Union[object, np.ndarray, list], as_value: bool = False) -> Dot:
     """
     Get the start point from various object types as a Dot.
 
@@ -113,6 +117,7 @@ def st(obj: Union[object, np.ndarray, list]) -> Dot:
             - A Manim object with get_start() method (e.g., Line, Arc, etc.)
             - A NumPy array [x, y] or [x, y, z]
             - A Python list [x, y] or [x, y, z]
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         A Dot at the start point
@@ -135,13 +140,13 @@ def st(obj: Union[object, np.ndarray, list]) -> Dot:
     """
     # Check if object has get_start method (Manim object like Line, Arc, etc.)
     if hasattr(obj, 'get_start'):
-        return Dot(obj.get_start())
+        return point_result(obj.get_start(), as_value)
     # Check if it's a numpy array
     elif isinstance(obj, np.ndarray):
-        return Dot(obj)
+        return point_result(obj, as_value)
     # Check if it's a list
     elif isinstance(obj, (list, tuple)):
-        return Dot(np.array(obj))
+        return point_result(np.array(obj), as_value)
     else:
         raise TypeError(
             f"Unsupported type {type(obj).__name__}. "
@@ -149,7 +154,7 @@ def st(obj: Union[object, np.ndarray, list]) -> Dot:
         )
 
 
-def ed(obj: Union[object, np.ndarray, list]) -> Dot:
+def ed(obj: Union[object, np.ndarray, list], as_value: bool = False) -> Dot:
     """
     Get the end point from various object types as a Dot.
 
@@ -158,6 +163,7 @@ def ed(obj: Union[object, np.ndarray, list]) -> Dot:
             - A Manim object with get_end() method (e.g., Line, Arc, etc.)
             - A NumPy array [x, y] or [x, y, z]
             - A Python list [x, y] or [x, y, z]
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         A Dot at the end point
@@ -180,13 +186,13 @@ def ed(obj: Union[object, np.ndarray, list]) -> Dot:
     """
     # Check if object has get_end method (Manim object like Line, Arc, etc.)
     if hasattr(obj, 'get_end'):
-        return Dot(obj.get_end())
+        return point_result(obj.get_end(), as_value)
     # Check if it's a numpy array
     elif isinstance(obj, np.ndarray):
-        return Dot(obj)
+        return point_result(obj, as_value)
     # Check if it's a list
     elif isinstance(obj, (list, tuple)):
-        return Dot(np.array(obj))
+        return point_result(np.array(obj), as_value)
     else:
         raise TypeError(
             f"Unsupported type {type(obj).__name__}. "
@@ -194,7 +200,7 @@ def ed(obj: Union[object, np.ndarray, list]) -> Dot:
         )
 
 
-def mid(*args) -> Dot:
+def mid(*args, as_value: bool = False) -> Dot:
     """
     Get a Dot at the midpoint of an object or between two points.
 
@@ -202,6 +208,9 @@ def mid(*args) -> Dot:
         - 1 arg: A Manim object with get_center() method (e.g., Line, Circle, VMobject, etc.)
         - 2 args: Two points (Dot objects, np.arrays, or lists) - returns midpoint between them
 
+    Keyword Args:
+        as_value: Return a P2 value instead of a Dot (default False)
+
     Returns:
         A Dot at the midpoint
 
@@ -232,22 +241,11 @@ def mid(*args) -> Dot:
         >>> # Mixed types
         >>> midpoint = mid(Dot(LEFT), np.array([1, 1, 0]))  # Dot at (0, 0.5, 0)
     """
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return np.array(obj)
-        else:
-            raise TypeError(f"Expected Dot, np.array, or list, got {type(obj).__name__}")
-
     if len(args) == 1:
         # Single argument - get center of object
         obj = args[0]
         if hasattr(obj, 'get_center'):
-            return Dot(obj.get_center())
+            return point_result(obj.get_center(), as_value)
         else:
             raise TypeError(
                 f"Unsupported type {type(obj).__name__}. "
@@ -256,12 +254,12 @@ def mid(*args) -> Dot:
 
     elif len(args) == 2:
         # Two arguments - calculate midpoint between two points
-        pos1 = _extract_position(args[0])
-        pos2 = _extract_position(args[1])
+        pos1 = to_position(args[0])
+        pos2 = to_position(args[1])
 
         # Calculate midpoint
         midpoint = (pos1 + pos2) / 2
-        return Dot(midpoint)
+        return point_result(midpoint, as_value)
 
     else:
         raise ValueError(
@@ -310,17 +308,6 @@ def mag(*args) -> float:
         >>> arr2 = np.array([3.0, 4.0, 0.0])
         >>> distance = mag(arr1, arr2)  # Returns 5.0
     """
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return np.array(obj)
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 1:
         # Single argument - calculate magnitude
         obj = args[0]
@@ -342,8 +329,8 @@ def mag(*args) -> float:
 
     elif len(args) == 2:
         # Two arguments - calculate distance between points
-        pos1 = _extract_position(args[0])
-        pos2 = _extract_position(args[1])
+        pos1 = to_position(args[0])
+        pos2 = to_position(args[1])
 
         # Calculate distance
         return float(np.linalg.norm(pos2 - pos1))
@@ -549,6 +536,165 @@ def slope(obj: Union[object, np.ndarray, list]) -> float:
         )
 
 
+def x_many(objs) -> np.ndarray:
+    """
+    Extract the x-coordinates of many objects at once.
+
+    Args:
+        objs: Sequence of Dots/objects, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N,) of x-coordinates
+
+    Example:
+        >>> from robo_manim_add_ons import x_many
+        >>>
+        >>> xs = x_many(triangle.get_vertices())
+        >>> xs = x_many([Dot(LEFT), Dot(RIGHT)])  # array([-1., 1.])
+    """
+    return to_positions(objs)[:, 0]
+
+
+def y_many(objs) -> np.ndarray:
+    """
+    Extract the y-coordinates of many objects at once.
+
+    Args:
+        objs: Sequence of Dots/objects, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N,) of y-coordinates
+
+    Example:
+        >>> from robo_manim_add_ons import y_many
+        >>>
+        >>> ys = y_many([Dot(UP), Dot(DOWN)])  # array([1., -1.])
+    """
+    return to_positions(objs)[:, 1]
+
+
+def vec_many(objs) -> np.ndarray:
+    """
+    Get the vectors of many objects at once.
+
+    Args:
+        objs: Sequence of Lines (end - start), np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N, 3) of vectors
+
+    Example:
+        >>> from robo_manim_add_ons import vec_many
+        >>>
+        >>> vectors = vec_many([Line(ORIGIN, RIGHT), Line(ORIGIN, UP)])
+    """
+    return to_vectors(objs)
+
+
+def mag_many(objs, others=None) -> np.ndarray:
+    """
+    Get the magnitudes of many objects, or the distances between many point pairs.
+
+    Args:
+        objs: Sequence of Lines/objects with get_length(), np.arrays or lists,
+              or an (N, 2) / (N, 3) array of vectors
+        others: Optional second sequence of points; if given, returns the distances
+                between objs[i] and others[i] (default None)
+
+    Returns:
+        Array (N,) of magnitudes or distances
+
+    Example:
+        >>> from robo_manim_add_ons import mag_many
+        >>>
+        >>> lengths = mag_many(edges)                              # edge lengths
+        >>> distances = mag_many(vertices, np.roll(vertices, -1, axis=0))
+    """
+    if others is not None:
+        return np.linalg.norm(to_positions(others) - to_positions(objs), axis=1)
+    if not (isinstance(objs, np.ndarray) and objs.ndim == 2):
+        # Curved objects (Arc, ...) report their own length, straight ones use end - start
+        if any(hasattr(obj, 'get_length') and not isinstance(obj, Line) for obj in objs):
+            return np.array([mag(obj) for obj in objs], dtype=float)
+    return np.linalg.norm(to_vectors(objs), axis=1)
+
+
+def uv_many(objs) -> np.ndarray:
+    """
+    Get the unit vectors of many objects at once.
+
+    Args:
+        objs: Sequence of Lines, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N, 3) of unit vectors
+
+    Raises:
+        ValueError: If any vector has zero magnitude
+
+    Example:
+        >>> from robo_manim_add_ons import uv_many
+        >>>
+        >>> directions = uv_many(np.array([[3, 4, 0], [0, 2, 0]]))
+    """
+    vectors = to_vectors(objs)
+    magnitudes = np.linalg.norm(vectors, axis=1)
+    if np.any(magnitudes == 0):
+        raise ValueError("Cannot compute unit vector of zero-magnitude vector")
+    return vectors / magnitudes[:, None]
+
+
+def ang_many(objs) -> np.ndarray:
+    """
+    Get the angles of many objects at once.
+
+    Args:
+        objs: Sequence of Lines, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N,) of angles in radians
+
+    Example:
+        >>> from robo_manim_add_ons import ang_many
+        >>>
+        >>> angles = ang_many([Line(ORIGIN, RIGHT), Line(ORIGIN, UP)])  # array([0., 1.5708])
+    """
+    vectors = to_vectors(objs)
+    return np.arctan2(vectors[:, 1], vectors[:, 0])
+
+
+def slope_many(objs) -> np.ndarray:
+    """
+    Get the slopes of many objects at once.
+
+    Matches slope() element by element: arrays and lists with a vertical direction
+    give inf (or -inf when pointing down), while Lines use tan(angle) like
+    Line.get_slope(), which is a large finite number for vertical Lines.
+
+    Args:
+        objs: Sequence of Lines, np.arrays or lists, or an (N, 2) / (N, 3) array
+
+    Returns:
+        Array (N,) of slopes
+
+    Example:
+        >>> from robo_manim_add_ons import slope_many
+        >>>
+        >>> slopes = slope_many(np.array([[1, 2, 0], [0, 1, 0]]))  # array([2., inf])
+    """
+    vectors = to_vectors(objs)
+    dx, dy = vectors[:, 0], vectors[:, 1]
+    vertical = dx == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = dy / np.where(vertical, 1, dx)
+    slopes = np.where(vertical, np.where(dy > 0, np.inf, -np.inf), slopes)
+    if not isinstance(objs, np.ndarray):
+        lines = np.array([hasattr(obj, 'get_slope') for obj in objs], dtype=bool)
+        if lines.any():
+            slopes = np.where(lines, np.tan(np.arctan2(dy, dx)), slopes)
+    return slopes
+
+
 def val(obj: Union[object, float, int]) -> float:
     """
     Get the value from various object types.
@@ -865,41 +1011,24 @@ def ln(*args) -> Line:
     """
     from manim import RED
 
-    def _is_object(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 2:
         # Two objects (Dots or arrays)
-        start_pos = _extract_position(args[0])
-        end_pos = _extract_position(args[1])
+        start_pos = to_position(args[0], sequences=False)
+        end_pos = to_position(args[1], sequences=False)
         return Line(start_pos, end_pos, color=RED)
 
     elif len(args) == 3:
         # One dot/array and two numbers
         # Check if first arg is object and last two are numbers
-        if _is_object(args[0]) and _is_number(args[1]) and _is_number(args[2]):
+        if is_point(args[0]) and is_number(args[1]) and is_number(args[2]):
             # Pattern: (dot, x, y)
-            start_pos = _extract_position(args[0])
+            start_pos = to_position(args[0], sequences=False)
             end_pos = np.array([args[1], args[2], 0])
         # Check if first two are numbers and last is object
-        elif _is_number(args[0]) and _is_number(args[1]) and _is_object(args[2]):
+        elif is_number(args[0]) and is_number(args[1]) and is_point(args[2]):
             # Pattern: (x, y, dot)
             start_pos = np.array([args[0], args[1], 0])
-            end_pos = _extract_position(args[2])
+            end_pos = to_position(args[2], sequences=False)
         else:
             raise TypeError(
                 "For 3 arguments, expected either (dot, x, y) or (x, y, dot)"
@@ -908,7 +1037,7 @@ def ln(*args) -> Line:
 
     elif len(args) == 4:
         # Four numbers
-        if not all(_is_number(arg) for arg in args):
+        if not all(is_number(arg) for arg in args):
             raise TypeError("For 4 arguments, all must be numbers")
         x1, y1, x2, y2 = args
         start_pos = np.array([x1, y1, 0])
@@ -955,41 +1084,24 @@ def vt(*args) -> Arrow:
     """
     from manim import RED
 
-    def _is_object(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 2:
         # Two objects (Dots or arrays)
-        start_pos = _extract_position(args[0])
-        end_pos = _extract_position(args[1])
+        start_pos = to_position(args[0], sequences=False)
+        end_pos = to_position(args[1], sequences=False)
         return Arrow(start_pos, end_pos, color=RED)
 
     elif len(args) == 3:
         # One dot/array and two numbers
         # Check if first arg is object and last two are numbers
-        if _is_object(args[0]) and _is_number(args[1]) and _is_number(args[2]):
+        if is_point(args[0]) and is_number(args[1]) and is_number(args[2]):
             # Pattern: (dot, x, y)
-            start_pos = _extract_position(args[0])
+            start_pos = to_position(args[0], sequences=False)
             end_pos = np.array([args[1], args[2], 0])
         # Check if first two are numbers and last is object
-        elif _is_number(args[0]) and _is_number(args[1]) and _is_object(args[2]):
+        elif is_number(args[0]) and is_number(args[1]) and is_point(args[2]):
             # Pattern: (x, y, dot)
             start_pos = np.array([args[0], args[1], 0])
-            end_pos = _extract_position(args[2])
+            end_pos = to_position(args[2], sequences=False)
         else:
             raise TypeError(
                 "For 3 arguments, expected either (dot, x, y) or (x, y, dot)"
@@ -998,7 +1110,7 @@ def vt(*args) -> Arrow:
 
     elif len(args) == 4:
         # Four numbers
-        if not all(_is_number(arg) for arg in args):
+        if not all(is_number(arg) for arg in args):
             raise TypeError("For 4 arguments, all must be numbers")
         x1, y1, x2, y2 = args
         start_pos = np.array([x1, y1, 0])
@@ -1037,18 +1149,9 @@ def tri(p1, p2, p3) -> Polygon:
     """
     from manim import RED
 
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
-    pos1 = _extract_position(p1)
-    pos2 = _extract_position(p2)
-    pos3 = _extract_position(p3)
+    pos1 = to_position(p1, sequences=False)
+    pos2 = to_position(p2, sequences=False)
+    pos3 = to_position(p3, sequences=False)
 
     return Polygon(pos1, pos2, pos3, color=RED)
 
@@ -1103,19 +1206,6 @@ def aa(*args, radius=0.5, dash=True, **kwargs):
         """Check if arg is a Line object"""
         return isinstance(arg, Line)
 
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     # Set default color if not provided
     if 'color' not in kwargs:
         kwargs['color'] = RED
@@ -1166,15 +1256,15 @@ def aa(*args, radius=0.5, dash=True, **kwargs):
 
     elif len(args) == 3:
         # Three points case
-        if not all(_is_point(arg) for arg in args):
+        if not all(is_point(arg) for arg in args):
             raise TypeError("For 3 arguments, all must be Dot objects or np.arrays")
 
         p1, vertex, p3 = args
 
         # Extract positions
-        p1_pos = _extract_position(p1)
-        vertex_pos = _extract_position(vertex)
-        p3_pos = _extract_position(p3)
+        p1_pos = to_position(p1, sequences=False)
+        vertex_pos = to_position(vertex, sequences=False)
+        p3_pos = to_position(p3, sequences=False)
 
         # Create vectors from vertex to p1 and p3
         v1 = p1_pos - vertex_pos
@@ -1266,19 +1356,6 @@ def aa2(*args, radius=0.5, **kwargs):
         """Check if arg is a Line object"""
         return isinstance(arg, Line)
 
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     # Set default color if not provided
     if 'color' not in kwargs:
         kwargs['color'] = RED
@@ -1323,14 +1400,14 @@ def aa2(*args, radius=0.5, **kwargs):
             else:
                 raise TypeError(f"Quadrant parameter must be bool or number, got {type(quadrant_param).__name__}")
 
-        elif all(_is_point(arg) for arg in args):
+        elif all(is_point(arg) for arg in args):
             # Pattern: (p1, vertex, p3) - three points, no quadrant
             p1, vertex, p3 = args
 
             # Extract positions
-            p1_pos = _extract_position(p1)
-            vertex_pos = _extract_position(vertex)
-            p3_pos = _extract_position(p3)
+            p1_pos = to_position(p1, sequences=False)
+            vertex_pos = to_position(vertex, sequences=False)
+            p3_pos = to_position(p3, sequences=False)
 
             # Create Angle from three points
             return Angle.from_three_points(p1_pos, vertex_pos, p3_pos, radius=radius, **kwargs)
@@ -1340,16 +1417,16 @@ def aa2(*args, radius=0.5, **kwargs):
 
     elif len(args) == 4:
         # Pattern: (p1, vertex, p3, quadrant)
-        if not all(_is_point(arg) for arg in args[:3]):
+        if not all(is_point(arg) for arg in args[:3]):
             raise TypeError("For 4 arguments, first 3 must be Dot objects or np.arrays")
 
         p1, vertex, p3 = args[:3]
         quadrant_param = args[3]
 
         # Extract positions
-        p1_pos = _extract_position(p1)
-        vertex_pos = _extract_position(vertex)
-        p3_pos = _extract_position(p3)
+        p1_pos = to_position(p1, sequences=False)
+        vertex_pos = to_position(vertex, sequences=False)
+        p3_pos = to_position(p3, sequences=False)
 
         # Process quadrant parameter
         if isinstance(quadrant_param, bool):
@@ -1520,6 +1597,68 @@ def ssa(a: float, b: float, angle_deg: float, **kwargs) -> Polygon:
     return _ssa(a, b, angle_deg, **kwargs)
 
 
+def sss_many(a, b=None, c=None) -> tuple:
+    """
+    Solve many SSS triangles at once without building Polygons.
+
+    Args:
+        a: Array of side lengths (if only arg, equilateral triangles)
+        b: Array of second side lengths (optional, defaults to 'a')
+        c: Array of third side lengths (optional, defaults to 'a')
+
+    Returns:
+        Tuple (vertices, valid) with vertices of shape (N, 3, 3); see tri_sss_many()
+
+    Example:
+        >>> from robo_manim_add_ons import sss_many, tri_polygons
+        >>>
+        >>> vertices, valid = sss_many(*np.random.uniform(1, 5, size=(3, 5000)))
+        >>> triangles = tri_polygons(vertices, np.flatnonzero(valid)[:3])
+    """
+    return _sss_many(a, b, c)
+
+
+def sas_many(a, angle_deg, b) -> tuple:
+    """
+    Solve many SAS triangles at once without building Polygons.
+
+    Args:
+        a: Array of first side lengths
+        angle_deg: Array of included angles (in degrees)
+        b: Array of second side lengths
+
+    Returns:
+        Tuple (vertices, valid) with vertices of shape (N, 3, 3); see tri_sas_many()
+
+    Example:
+        >>> from robo_manim_add_ons import sas_many
+        >>>
+        >>> vertices, valid = sas_many([3, 2], [90, 60], [4, 3])
+    """
+    return _sas_many(a, angle_deg, b)
+
+
+def ssa_many(a, b, angle_deg, solution: int = 1) -> tuple:
+    """
+    Solve many SSA triangles at once without building Polygons.
+
+    Args:
+        a: Array of side lengths opposite to the angle
+        b: Array of second side lengths
+        angle_deg: Array of angles opposite to side 'a' (in degrees)
+        solution: 1 for the first solution, 2 for the second ambiguous one (default 1)
+
+    Returns:
+        Tuple (vertices, valid, ambiguous); see tri_ssa_many()
+
+    Example:
+        >>> from robo_manim_add_ons import ssa_many
+        >>>
+        >>> vertices, valid, ambiguous = ssa_many([3, 1], [5, 5], [30, 30])
+    """
+    return _ssa_many(a, b, angle_deg, solution)
+
+
 def cr(*args, **kwargs) -> Circle:
     """
     Create a Circle with flexible arguments.
@@ -1560,23 +1699,6 @@ def cr(*args, **kwargs) -> Circle:
         """Check if arg is a Line object"""
         return isinstance(arg, Line)
 
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 1:
         # Single line case
         if not _is_line(args[0]):
@@ -1593,19 +1715,19 @@ def cr(*args, **kwargs) -> Circle:
 
     elif len(args) == 2:
         # Could be: (center, radius) OR (dot1, dot2)
-        if _is_point(args[0]) and _is_number(args[1]):
+        if is_point(args[0]) and is_number(args[1]):
             # Pattern: (center, radius)
-            center = _extract_position(args[0])
+            center = to_position(args[0], sequences=False)
             radius = args[1]
 
             circle = Circle(radius=radius, **kwargs)
             circle.move_to(center)
             return circle
 
-        elif _is_point(args[0]) and _is_point(args[1]):
+        elif is_point(args[0]) and is_point(args[1]):
             # Pattern: (dot1, dot2)
-            pos1 = _extract_position(args[0])
-            pos2 = _extract_position(args[1])
+            pos1 = to_position(args[0], sequences=False)
+            pos2 = to_position(args[1], sequences=False)
 
             # Midpoint is center
             center = (pos1 + pos2) / 2
@@ -1629,7 +1751,8 @@ class Exp:
     """
     Expression utility class for extracting coordinates and properties from various types.
 
-    This class provides the same functionality as the standalone x, y, st, ed, mid, mag, uv, vec, ang, slope, val, pt, m2v, v2m, x2v, vl, hl, lra, vra, r2p, ln, vt, tri, aa, rect, cr, sss, sas, ssa, and graph functions,
+    This class provides the same functionality as the standalone x, y, st, ed, mid, mag, uv, vec, ang, slope, val, pt, m2v, v2m, x2v, vl, hl, lra, vra, r2p, ln, vt, tri, aa, rect, cr, sss, sas, ssa, and graph functions
+    (plus the *_many batch variants of x, y, mag, uv, vec, ang and slope),
     but in a class-based interface for those who prefer it.
     """
     x = staticmethod(x)
@@ -1642,6 +1765,13 @@ class Exp:
     vec = staticmethod(vec)
     ang = staticmethod(ang)
     slope = staticmethod(slope)
+    x_many = staticmethod(x_many)
+    y_many = staticmethod(y_many)
+    mag_many = staticmethod(mag_many)
+    uv_many = staticmethod(uv_many)
+    vec_many = staticmethod(vec_many)
+    ang_many = staticmethod(ang_many)
+    slope_many = staticmethod(slope_many)
     val = staticmethod(val)
     pt = staticmethod(pt)
     m2v = staticmethod(m2v)
@@ -1663,4 +1793,10 @@ class Exp:
     sss = staticmethod(sss)
     sas = staticmethod(sas)
     ssa = staticmethod(ssa)
+    sss_many = staticmethod(sss_many)
+    sas_many = staticmethod(sas_many)
+    ssa_many = staticmethod(ssa_many)
     graph = staticmethod(GraphUtils.graph)
+
+    # Deferred mode: Exp.plan() records calls and builds only the shown nodes
+    plan = staticmethod(ExpPlan)
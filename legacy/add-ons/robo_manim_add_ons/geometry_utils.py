@@ -8,6 +8,7 @@ as well as projection and reflection operations.
 import numpy as np
 from manim import Line, Dot
 from typing import Union
+from .value_types import point_result
 
 
 def perp(line: Line, dot: Dot, length: float, placement: str = "mid") -> Line:
@@ -130,13 +131,14 @@ def parallel(line: Line, dot: Dot, length: float, placement: str = "mid") -> Lin
     return Line(new_start, new_end)
 
 
-def project(line: Line, point: Union[np.ndarray, Dot]) -> Dot:
+def project(line: Line, point: Union[np.ndarray, Dot], as_value: bool = False) -> Dot:
     """
     Project a point onto a line (extended infinitely).
 
     Args:
         line: The reference Line object
         point: The point to project (Dot object or numpy array)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the projected position on the line (extended infinitely)
@@ -172,23 +174,24 @@ def project(line: Line, point: Union[np.ndarray, Dot]) -> Dot:
 
     if line_length_sq == 0:
         # Degenerate line (start == end), return point at line start
-        return Dot(line_start)
+        return point_result(line_start, as_value)
 
     t = np.dot(point_vec, line_vec) / line_length_sq
 
     # Calculate projected point (can be outside the line segment)
     projected_point = line_start + t * line_vec
 
-    return Dot(projected_point)
+    return point_result(projected_point, as_value)
 
 
-def reflect(line: Line, point: Union[np.ndarray, Dot]) -> Dot:
+def reflect(line: Line, point: Union[np.ndarray, Dot], as_value: bool = False) -> Dot:
     """
     Reflect a point across a line (extended infinitely).
 
     Args:
         line: The reference Line object
         point: The point to reflect (Dot object or numpy array)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the reflected position
@@ -224,7 +227,7 @@ def reflect(line: Line, point: Union[np.ndarray, Dot]) -> Dot:
 
     if line_length_sq == 0:
         # Degenerate line (start == end), return point at same position
-        return Dot(point_pos)
+        return point_result(point_pos, as_value)
 
     t = np.dot(point_vec, line_vec) / line_length_sq
 
@@ -234,7 +237,7 @@ def reflect(line: Line, point: Union[np.ndarray, Dot]) -> Dot:
     # Reflection formula: reflected = 2 * projection - point
     reflected_point = 2 * projected_point - point_pos
 
-    return Dot(reflected_point)
+    return point_result(reflected_point, as_value)
 
 
 def extended_line(line: Line, proportion: float, length: float) -> Line:
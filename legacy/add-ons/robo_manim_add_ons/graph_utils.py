@@ -9,8 +9,9 @@ import numpy as np
 import sympy as sp
 import re
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application, convert_xor
-from manim import Axes, ImplicitFunction, ParametricFunction, MathTex, PI, BLACK, BLUE_D, DOWN, LEFT
+from manim import Axes, ImplicitFunction, ParametricFunction, PI, BLACK, BLUE_D, DOWN, LEFT
 from typing import Tuple, Union
+from .tex_cache import cached_tex
 
 # Transformations for parsing expressions with implicit multiplication
 transformations = (standard_transformations +
@@ -122,7 +123,7 @@ class GraphUtils:
 
         # Add labels
         for val, label_text in sorted_labels.items():
-            label = MathTex(label_text, font_size=24)
+            label = cached_tex(label_text, font_size=24)
             if axis == 'x':
                 label.next_to(target_axis.n2p(val), DOWN, buff=0.2)
             else:
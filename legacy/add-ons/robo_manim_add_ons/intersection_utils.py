@@ -7,15 +7,17 @@ Provides helper functions for finding intersections between geometric objects.
 import numpy as np
 from manim import Line, Dot, VGroup, Circle, Polygon, rotate_vector
 from typing import Union
+from .value_types import P2, Seg, point_result
 
 
-def intersect_lines(line1: Line, line2: Line) -> Union[Dot, VGroup]:
+def intersect_lines(line1: Line, line2: Line, as_value: bool = False) -> Union[Dot, VGroup]:
     """
     Find the intersection point of two lines (extended infinitely).
 
     Args:
         line1: The first Line object
         line2: The second Line object
+        as_value: Return a P2 (or None if parallel) instead of a Dot/VGroup (default False)
 
     Returns:
         Dot at the intersection point if lines intersect,
@@ -55,6 +57,8 @@ def intersect_lines(line1: Line, line2: Line) -> Union[Dot, VGroup]:
 
     # If cross product is zero, lines are parallel or coincident
     if np.abs(cross_d1_d2) < 1e-10:
+        if as_value:
+            return None
         return VGroup()  # Empty VGroup for parallel/coincident lines
 
     # Calculate parameter t for line1
@@ -67,16 +71,17 @@ def intersect_lines(line1: Line, line2: Line) -> Union[Dot, VGroup]:
     # P = p1 + t * d1
     intersection_point = p1 + t * d1
 
-    return Dot(intersection_point)
+    return point_result(intersection_point, as_value)
 
 
-def intersect_line_circle(line: Line, circle: Circle) -> VGroup:
+def intersect_line_circle(line: Line, circle: Circle, as_value: bool = False) -> VGroup:
     """
     Find the intersection points of a line (extended infinitely) and a circle.
 
     Args:
         line: The Line object (treated as infinite)
         circle: The Circle object
+        as_value: Return a tuple of P2 values instead of a VGroup of Dots (default False)
 
     Returns:
         VGroup containing:
@@ -127,13 +132,13 @@ def intersect_line_circle(line: Line, circle: Circle) -> VGroup:
 
     # No intersection if discriminant is negative
     if discriminant < -1e-10:
-        return VGroup()
+        return _points_result([], as_value)
 
     # Tangent case (one intersection point)
     if abs(discriminant) < 1e-10:
         t = -b / (2 * a)
         intersection_point = p1 + t * d
-        return VGroup(Dot(intersection_point))
+        return _points_result([intersection_point], as_value)
 
     # Two intersection points
     sqrt_discriminant = np.sqrt(discriminant)
@@ -143,7 +148,14 @@ def intersect_line_circle(line: Line, circle: Circle) -> VGroup:
     point1 = p1 + t1 * d
     point2 = p1 + t2 * d
 
-    return VGroup(Dot(point1), Dot(point2))
+    return _points_result([point1, point2], as_value)
+
+
+def _points_result(points: list, as_value: bool):
+    """Wrap computed positions as a tuple of P2 values or a VGroup of Dots."""
+    if as_value:
+        return tuple(P2(point) for point in points)
+    return VGroup(*(Dot(point) for point in points))
 
 
 def _point_on_segment(point: np.ndarray, start: np.ndarray, end: np.ndarray, tolerance: float = 1e-10) -> bool:
@@ -168,7 +180,7 @@ def _point_on_segment(point: np.ndarray, start: np.ndarray, end: np.ndarray, tol
     return abs(d1 + d2 - d_total) < tolerance
 
 
-def icc(c1: Circle, c2: Circle) -> VGroup:
+def icc(c1: Circle, c2: Circle, as_value: bool = False) -> VGroup:
     """
     Find intersection points of two circles.
 
@@ -178,6 +190,7 @@ def icc(c1: Circle, c2: Circle) -> VGroup:
     Args:
         c1: First Circle object
         c2: Second Circle object
+        as_value: Return a tuple of P2 values instead of a VGroup of Dots (default False)
 
     Returns:
         VGroup containing:
@@ -218,16 +231,16 @@ def icc(c1: Circle, c2: Circle) -> VGroup:
     if d < 1e-10:
         if abs(r1 - r2) < 1e-10:
             # Identical circles - infinite intersections, return empty
-            return VGroup()
+            return _points_result([], as_value)
         else:
             # Concentric circles with different radii - no intersection
-            return VGroup()
+            return _points_result([], as_value)
 
     # No intersection cases
     if d > r1 + r2 + 1e-10:  # Circles too far apart
-        return VGroup()
+        return _points_result([], as_value)
     if d < abs(r1 - r2) - 1e-10:  # One circle inside other
-        return VGroup()
+        return _points_result([], as_value)
 
     # Direction from o1 to o2
     direction = (o2 - o1) / d
@@ -235,7 +248,7 @@ def icc(c1: Circle, c2: Circle) -> VGroup:
     # Tangent case: external tangent
     if abs(d - (r1 + r2)) < 1e-10:
         point = o1 + r1 * direction
-        return VGroup(Dot(point))
+        return _points_result([point], as_value)
 
     # Tangent case: internal tangent
     if abs(d - abs(r1 - r2)) < 1e-10:
@@ -243,7 +256,7 @@ def icc(c1: Circle, c2: Circle) -> VGroup:
             point = o1 + r1 * direction
         else:
             point = o1 - r1 * direction
-        return VGroup(Dot(point))
+        return _points_result([point], as_value)
 
     # Calculate intersection using law of cosines
     # cos(α) = (r1² + d² - r2²) / (2 * r1 * d)
@@ -255,10 +268,10 @@ def icc(c1: Circle, c2: Circle) -> VGroup:
     p1 = o1 + r1 * rotate_vector(direction, alpha)
     p2 = o1 + r1 * rotate_vector(direction, -alpha)
 
-    return VGroup(Dot(p1), Dot(p2))
+    return _points_result([p1, p2], as_value)
 
 
-def ilp(line: Line, polygon: Polygon) -> VGroup:
+def ilp(line: Line, polygon: Polygon, as_value: bool = False) -> VGroup:
     """
     Find all intersection points between a line (extended infinitely) and a polygon.
 
@@ -268,6 +281,7 @@ def ilp(line: Line, polygon: Polygon) -> VGroup:
     Args:
         line: Line object (treated as infinite line)
         polygon: Polygon object
+        as_value: Return a tuple of P2 values instead of a VGroup of Dots (default False)
 
     Returns:
         VGroup containing Dots at all intersection points
@@ -289,35 +303,35 @@ def ilp(line: Line, polygon: Polygon) -> VGroup:
     """
     vertices = polygon.get_vertices()
     n = len(vertices)
-    intersections = VGroup()
+    points = []
 
     for i in range(n):
         # Get edge from vertex[i] to vertex[(i+1) % n]
         edge_start = vertices[i]
         edge_end = vertices[(i + 1) % n]
-        edge = Line(edge_start, edge_end)
+        edge = Seg(edge_start, edge_end)
 
         # Find intersection of infinite line with this edge (treated as infinite)
-        intersection = intersect_lines(line, edge)
+        intersection = intersect_lines(line, edge, as_value=True)
 
-        if len(intersection) > 0:
+        if intersection is not None:
             # Check if intersection is within the edge segment
             point = intersection.get_center()
             if _point_on_segment(point, edge_start, edge_end):
-                intersections.add(Dot(point))
+                points.append(point)
 
-    return intersections
+    return _points_result(points, as_value)
 
 
 # ============================================================================
 # Aliases
 # ============================================================================
 
-def ill(line1: Line, line2: Line) -> Union[Dot, VGroup]:
+def ill(line1: Line, line2: Line, as_value: bool = False) -> Union[Dot, VGroup]:
     """Alias for intersect_lines(). See intersect_lines() for full documentation."""
-    return intersect_lines(line1, line2)
+    return intersect_lines(line1, line2, as_value)
 
 
-def ilc(line: Line, circle: Circle) -> VGroup:
+def ilc(line: Line, circle: Circle, as_value: bool = False) -> VGroup:
     """Alias for intersect_line_circle(). See intersect_line_circle() for full documentation."""
-    return intersect_line_circle(line, circle)
+    return intersect_line_circle(line, circle, as_value)
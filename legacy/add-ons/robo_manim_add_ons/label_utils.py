@@ -1,14 +1,34 @@
 """
 Label utility functions for Manim polygons.
 
-This module provides utilities to create vertex and edge labels for polygons.
+This module provides utilities to create vertex and edge labels for polygons,
+and a collision-aware layout engine that places many labels at once.
 """
 
+import time
 import numpy as np
-from manim import MathTex, WHITE, YELLOW, UP
+from manim import WHITE, YELLOW, UP, DL, UR
+from .tex_cache import cached_tex
 
 
-def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
+def _outward(direction: np.ndarray) -> np.ndarray:
+    """Normalize a direction, falling back to UP for zero vectors."""
+    norm = np.linalg.norm(direction)
+    if norm > 0:
+        return direction / norm
+    return UP
+
+
+def _outline_points(vertices: np.ndarray, samples: int = 9) -> np.ndarray:
+    """Sample points along the closed outline through the given vertices."""
+    alphas = np.linspace(0, 1, samples)[:, None]
+    n = len(vertices)
+    return np.vstack([
+        vertices[i] + alphas * (vertices[(i + 1) % n] - vertices[i]) for i in range(n)
+    ])
+
+
+def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3, avoid_overlap=False):
     """
     Create vertex labels positioned outside polygon
 
@@ -18,6 +38,8 @@ def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
         scale: Label text scale (default 0.7)
         color: Label color (default WHITE)
         buff: Distance from vertex to label (default 0.3)
+        avoid_overlap: Re-place labels with layout_labels() so they do not overlap
+                       each other or the polygon outline (default False)
 
     Returns:
         List of positioned MathTex objects
@@ -25,6 +47,7 @@ def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
     vertices = polygon.get_vertices()
     center = polygon.get_center()
     label_objects = []
+    directions = []
 
     for vertex, label_text in zip(vertices, labels):
         # Calculate outward direction from center
@@ -36,17 +59,22 @@ def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
             direction = UP  # Fallback if vertex is at center
 
         # Create and position label
-        label = MathTex(label_text)
+        label = cached_tex(label_text)
         label.scale(scale)
         label.set_color(color)
         label.next_to(vertex, direction, buff=buff)
 
         label_objects.append(label)
+        directions.append(direction)
+
+    if avoid_overlap:
+        layout_labels(label_objects, vertices[:len(label_objects)], directions, buff=buff,
+                      obstacles=[_outline_points(vertices)])
 
     return label_objects
 
 
-def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2):
+def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2, avoid_overlap=False):
     """
     Create edge labels at midpoints with perpendicular offset
 
@@ -56,12 +84,16 @@ def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2):
         scale: Label text scale (default 0.6)
         color: Label color (default YELLOW)
         buff: Distance from edge midpoint (default 0.2)
+        avoid_overlap: Re-place labels with layout_labels() so they do not overlap
+                       each other or the polygon outline (default False)
 
     Returns:
         List of positioned MathTex objects
     """
     vertices = polygon.get_vertices()
     label_objects = []
+    anchors = []
+    directions = []
     n = len(vertices)
 
     for i, label_text in enumerate(labels):
@@ -84,11 +116,237 @@ def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2):
             perp = UP  # Fallback
 
         # Create and position label
-        label = MathTex(label_text)
+        label = cached_tex(label_text)
         label.scale(scale)
         label.set_color(color)
         label.next_to(midpoint, perp, buff=buff)
 
         label_objects.append(label)
+        anchors.append(midpoint)
+        directions.append(perp)
+
+    if avoid_overlap:
+        layout_labels(label_objects, anchors, directions, buff=buff,
+                      obstacles=[_outline_points(vertices)])
 
     return label_objects
+
+
+def _box_overlap(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise overlap area of axis-aligned boxes.
+
+    Args:
+        boxes_a: Array (..., 4) of [xmin, ymin, xmax, ymax]
+        boxes_b: Array (M, 4) of [xmin, ymin, xmax, ymax]
+
+    Returns:
+        Array (..., M) of overlap areas
+    """
+    a = boxes_a[..., None, :]
+    widths = np.minimum(a[..., 2], boxes_b[:, 2]) - np.maximum(a[..., 0], boxes_b[:, 0])
+    heights = np.minimum(a[..., 3], boxes_b[:, 3]) - np.maximum(a[..., 1], boxes_b[:, 1])
+    return np.clip(widths, 0, None) * np.clip(heights, 0, None)
+
+
+def _obstacle_boxes(obstacles, padding: float) -> np.ndarray:
+    """Convert obstacle mobjects / points into an (M, 4) box array."""
+    boxes = []
+    for obstacle in obstacles:
+        if isinstance(obstacle, np.ndarray) and obstacle.ndim == 2:
+            # Array of points: each point is a tiny box
+            points = obstacle[:, :2]
+            boxes.append(np.hstack([points - padding, points + padding]))
+        elif hasattr(obstacle, 'get_corner'):
+            lower = obstacle.get_corner(DL)[:2]
+            upper = obstacle.get_corner(UR)[:2]
+            boxes.append(np.hstack([lower - padding, upper + padding])[None, :])
+        else:
+            point = np.asarray(obstacle, dtype=float)[:2]
+            boxes.append(np.hstack([point - padding, point + padding])[None, :])
+    if not boxes:
+        return np.zeros((0, 4))
+    return np.vstack(boxes)
+
+
+def layout_labels(labels, anchors, directions, buff=0.2, obstacles=None, num_candidates=16,
+                  padding=0.05, time_budget=0.0, seed=None):
+    """
+    Place many labels around their anchors without overlapping each other.
+
+    Every label gets num_candidates candidate positions around its anchor, ordered
+    by how far they turn away from the preferred direction. All candidate boxes are
+    tested against the obstacles and the already placed labels with a vectorized
+    bounding-box overlap check, and a greedy pass picks the cheapest candidate per
+    label. With a positive time_budget the greedy result is refined by simulated
+    annealing until the budget is used up.
+
+    Args:
+        labels: List of label mobjects (MathTex, Text, ...) to position
+        anchors: Anchor point for each label (Dot, np.array, or list)
+        directions: Preferred outward direction for each label (np.array or list)
+        buff: Gap between anchor and label box, single value or one per label (default 0.2)
+        obstacles: Optional list of mobjects (their bounding boxes are avoided),
+                   points, or (N, 3) point arrays to keep clear (default None)
+        num_candidates: Number of candidate directions per label (default 16)
+        padding: Extra margin kept around every box (default 0.05)
+        time_budget: Seconds of simulated annealing after the greedy pass (default 0, greedy only)
+        seed: Random seed for the annealing pass (default None)
+
+    Returns:
+        The list of labels, moved to their chosen positions
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import layout_labels
+        >>>
+        >>> dots = [Dot(ORIGIN), Dot(RIGHT * 0.3), Dot(UP * 0.2)]
+        >>> labels = [MathTex(s) for s in "ABC"]
+        >>> layout_labels(labels, dots, [UP, UP, UP], obstacles=dots, time_budget=0.05)
+    """
+    n = len(labels)
+    if n == 0:
+        return labels
+
+    anchor_pts = np.array([
+        anchor.get_center() if hasattr(anchor, 'get_center') else np.asarray(anchor, dtype=float)
+        for anchor in anchors
+    ])[:, :2]
+    preferred = np.array([np.asarray(d, dtype=float)[:2] for d in directions])
+    sizes = np.array([[label.width, label.height] for label in labels]) / 2 + padding
+    buffs = np.broadcast_to(np.asarray(buff, dtype=float), (n,))
+
+    # Candidate angles: preferred direction first, then alternating turns away from it
+    steps = np.arange(num_candidates)
+    turns = ((steps + 1) // 2) * np.where(steps % 2 == 1, 1, -1) * (2 * np.pi / num_candidates)
+    base_angles = np.arctan2(preferred[:, 1], preferred[:, 0])
+    angles = base_angles[:, None] + turns[None, :]
+    cand_dirs = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+
+    # Distance from box center to box edge along each direction
+    with np.errstate(divide='ignore'):
+        reach = np.minimum(
+            sizes[:, None, 0] / np.abs(cand_dirs[..., 0]),
+            sizes[:, None, 1] / np.abs(cand_dirs[..., 1]),
+        )
+    centers = anchor_pts[:, None, :] + cand_dirs * (buffs[:, None, None] + reach[..., None])
+    boxes = np.concatenate([centers - sizes[:, None, :], centers + sizes[:, None, :]], axis=-1)
+
+    # Static cost: deviation from the preferred direction plus obstacle overlap
+    obstacle_boxes = _obstacle_boxes(obstacles or [], padding)
+    obstacle_boxes = np.vstack([obstacle_boxes, np.hstack([anchor_pts - padding, anchor_pts + padding])])
+    deviation = np.abs(turns) / np.pi * 0.01
+    static_cost = deviation[None, :] + _box_overlap(boxes, obstacle_boxes).sum(axis=-1)
+
+    # Greedy pass in label order
+    choice = np.zeros(n, dtype=int)
+    for i in range(n):
+        cost = static_cost[i].copy()
+        if i > 0:
+            placed = boxes[np.arange(i), choice[:i]]
+            cost += _box_overlap(boxes[i], placed).sum(axis=-1)
+        choice[i] = int(np.argmin(cost))
+
+    # Optional simulated annealing refinement under a time budget
+    if time_budget > 0 and n > 1:
+        rng = np.random.default_rng(seed)
+        chosen = boxes[np.arange(n), choice]
+        pair = _box_overlap(chosen, chosen)
+        np.fill_diagonal(pair, 0)
+        total = static_cost[np.arange(n), choice].sum() + pair.sum() / 2
+        best_total, best_choice = total, choice.copy()
+        temperature0 = max(float(static_cost.mean()), 1e-3)
+        start = time.perf_counter()
+        while True:
+            elapsed = time.perf_counter() - start
+            if elapsed >= time_budget:
+                break
+            temperature = temperature0 * (1 - elapsed / time_budget) + 1e-9
+            i = rng.integers(n)
+            k = rng.integers(num_candidates)
+            if k == choice[i]:
+                continue
+            others = np.delete(chosen, i, axis=0)
+            old_cost = static_cost[i, choice[i]] + _box_overlap(chosen[i], others).sum()
+            new_cost = static_cost[i, k] + _box_overlap(boxes[i, k], others).sum()
+            delta = new_cost - old_cost
+            if delta < 0 or rng.random() < np.exp(-delta / temperature):
+                choice[i] = k
+                chosen[i] = boxes[i, k]
+                total += delta
+                if total < best_total:
+                    best_total, best_choice = total, choice.copy()
+        choice = best_choice
+
+    for i, label in enumerate(labels):
+        x, y = centers[i, choice[i]]
+        label.move_to(np.array([x, y, label.get_center()[2]]))
+
+    return labels
+
+
+def polygon_labels(polygon, vertex_texts=None, edge_texts=None, vertex_scale=0.7, edge_scale=0.6,
+                   vertex_color=WHITE, edge_color=YELLOW, vertex_buff=0.3, edge_buff=0.2,
+                   obstacles=None, time_budget=0.0, seed=None):
+    """
+    Create vertex and edge labels for a polygon and lay them out jointly.
+
+    Vertex labels prefer the outward direction from the center, edge labels the
+    edge normal. The polygon outline is sampled as an obstacle so labels do not
+    sit on top of edges. See layout_labels() for the placement algorithm.
+
+    Args:
+        polygon: Manim Polygon object
+        vertex_texts: List of vertex label strings ['A', 'B', 'C'] (default None)
+        edge_texts: List of edge label strings ['a', 'b', 'c'] (default None)
+        vertex_scale: Vertex label text scale (default 0.7)
+        edge_scale: Edge label text scale (default 0.6)
+        vertex_color: Vertex label color (default WHITE)
+        edge_color: Edge label color (default YELLOW)
+        vertex_buff: Distance from vertex to label (default 0.3)
+        edge_buff: Distance from edge midpoint to label (default 0.2)
+        obstacles: Extra obstacles passed to layout_labels() (default None)
+        time_budget: Seconds of simulated annealing (default 0, greedy only)
+        seed: Random seed for the annealing pass (default None)
+
+    Returns:
+        Tuple (vertex_label_list, edge_label_list) of positioned MathTex objects
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import polygon_labels
+        >>>
+        >>> triangle = Polygon([0, 0, 0], [0.8, 0, 0], [0.2, 0.5, 0])
+        >>> vlabels, elabels = polygon_labels(triangle, ["A", "B", "C"], ["c", "a", "b"])
+    """
+    vertices = polygon.get_vertices()
+    center = polygon.get_center()
+    n = len(vertices)
+
+    labels, anchors, directions, buffs = [], [], [], []
+    vertex_objects, edge_objects = [], []
+
+    for vertex, label_text in zip(vertices, vertex_texts or []):
+        label = cached_tex(label_text).scale(vertex_scale).set_color(vertex_color)
+        vertex_objects.append(label)
+        labels.append(label)
+        anchors.append(vertex)
+        directions.append(_outward(vertex - center))
+        buffs.append(vertex_buff)
+
+    for i, label_text in enumerate(edge_texts or []):
+        p1, p2 = vertices[i], vertices[(i + 1) % n]
+        edge_vector = p2 - p1
+        label = cached_tex(label_text).scale(edge_scale).set_color(edge_color)
+        edge_objects.append(label)
+        labels.append(label)
+        anchors.append((p1 + p2) / 2)
+        directions.append(_outward(np.array([-edge_vector[1], edge_vector[0], 0])))
+        buffs.append(edge_buff)
+
+    # Sample the outline so labels keep clear of the edges
+    all_obstacles = [_outline_points(vertices)] + list(obstacles or [])
+
+    layout_labels(labels, anchors, directions, buff=np.array(buffs), obstacles=all_obstacles,
+                  time_budget=time_budget, seed=seed)
+    return vertex_objects, edge_objects
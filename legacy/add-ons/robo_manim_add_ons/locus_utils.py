@@ -0,0 +1,264 @@
+"""
+Locus tracing for points that depend on a moving input point.
+
+A Locus samples a parameterized input point over a whole parameter array,
+evaluates the construction once on all samples (vectorized when the construction
+accepts arrays, e.g. the *_many triangle centers), and keeps the result. The locus
+can then be drawn as one smooth VMobject, and updaters read positions with an
+O(1) interpolated lookup instead of recomputing the construction every frame.
+"""
+
+import numpy as np
+from manim import VMobject, Dot, WHITE, YELLOW
+from manim.utils.bezier import partial_bezier_points
+from .coerce_utils import to_position
+
+
+def circle_param(center, radius: float, start_angle: float = 0.0, turns: float = 1.0):
+    """
+    Parameterize a point moving along a circle.
+
+    Args:
+        center: Circle center (Dot, np.array, or list)
+        radius: Circle radius
+        start_angle: Angle at t = 0 in radians (default 0)
+        turns: Number of full turns over t in [0, 1] (default 1)
+
+    Returns:
+        Function mapping a parameter array (N,) to points (N, 3)
+
+    Example:
+        >>> from robo_manim_add_ons import circle_param
+        >>>
+        >>> moving = circle_param(ORIGIN, 2)
+        >>> moving(np.array([0, 0.25]))  # [[2, 0, 0], [0, 2, 0]]
+    """
+    c = to_position(center)
+
+    def param(t):
+        angles = start_angle + np.asarray(t, dtype=float) * turns * 2 * np.pi
+        points = np.zeros((angles.size, 3))
+        points[:, 0] = c[0] + radius * np.cos(angles)
+        points[:, 1] = c[1] + radius * np.sin(angles)
+        points[:, 2] = c[2]
+        return points
+
+    return param
+
+
+def path_param(vmobject: VMobject):
+    """
+    Parameterize a point moving along a VMobject path.
+
+    Evaluates all bezier curves of the path at once; t in [0, 1] is spread evenly
+    over the curves, like point_from_proportion on uniformly built paths (Circle, Arc,
+    Line, ...).
+
+    Args:
+        vmobject: Path to follow
+
+    Returns:
+        Function mapping a parameter array (N,) to points (N, 3)
+
+    Example:
+        >>> from robo_manim_add_ons import path_param
+        >>>
+        >>> moving = path_param(Circle(radius=2))
+    """
+    nppc = vmobject.n_points_per_cubic_curve
+    curves = np.array(vmobject.points).reshape(-1, nppc, 3)
+    num_curves = len(curves)
+
+    def param(t):
+        scaled = np.clip(np.asarray(t, dtype=float), 0, 1) * num_curves
+        index = np.minimum(scaled.astype(int), num_curves - 1)
+        s = (scaled - index)[:, None]
+        p0, p1, p2, p3 = (curves[index, k] for k in range(4))
+        return ((1 - s) ** 3) * p0 + 3 * ((1 - s) ** 2) * s * p1 + 3 * (1 - s) * (s ** 2) * p2 + (s ** 3) * p3
+
+    return param
+
+
+class Locus:
+    """
+    Precomputed locus of a construction driven by a moving point.
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import Locus, circle_param, orthocenter_many
+        >>>
+        >>> B, C = np.array([-2, -1, 0]), np.array([2, -1, 0])
+        >>> def construction(A):
+        ...     tris = np.stack([A, np.broadcast_to(B, A.shape), np.broadcast_to(C, A.shape)], axis=1)
+        ...     return orthocenter_many(tris)
+        >>>
+        >>> locus = Locus(circle_param(ORIGIN, 2), construction, samples=400)
+        >>> t = ValueTracker(0)
+        >>> self.add(locus.path(color=BLUE), locus.dot(t, color=RED), locus.trace(t))
+        >>> self.play(t.animate.set_value(1), run_time=6)
+    """
+
+    def __init__(self, param, construction, t_range=(0.0, 1.0), samples: int = 200, vectorized: bool = True):
+        """
+        Sample the input point and evaluate the construction on all samples.
+
+        Args:
+            param: Function mapping a parameter array (N,) to input points (N, 3),
+                   or a VMobject path the input point moves along
+            construction: Function mapping input points (N, 3) to locus points (N, 3).
+                          It may also return (points, invalid_mask), as the *_many
+                          triangle centers do. With vectorized=False it is called once
+                          per sample with a single point and may return a Dot or array.
+            t_range: Parameter interval (default (0, 1))
+            samples: Number of parameter samples (default 200)
+            vectorized: Whether construction accepts the whole (N, 3) array (default True)
+        """
+        if samples < 2:
+            raise ValueError(f"samples must be at least 2, got {samples}")
+        if isinstance(param, VMobject):
+            param = path_param(param)
+
+        self.t_min, self.t_max = float(t_range[0]), float(t_range[1])
+        self.t = np.linspace(self.t_min, self.t_max, samples)
+        self.inputs = np.asarray(param(self.t), dtype=float)
+
+        if vectorized:
+            result = construction(self.inputs)
+        else:
+            result = np.array([to_position(construction(point)) for point in self.inputs])
+
+        invalid = np.zeros(samples, dtype=bool)
+        if isinstance(result, tuple):
+            result, invalid = result
+        self.points = np.array(result, dtype=float)
+        if self.points.shape != (samples, 3):
+            raise ValueError(f"construction must return an ({samples}, 3) array, got shape {self.points.shape}")
+        self.valid = ~np.asarray(invalid, dtype=bool) & np.all(np.isfinite(self.points), axis=1)
+        self._step = (self.t_max - self.t_min) / (samples - 1)
+
+    def at(self, t: float) -> np.ndarray:
+        """
+        Locus position at parameter t, interpolated between the two nearest samples.
+
+        Args:
+            t: Parameter value (clamped to t_range)
+
+        Returns:
+            Position as numpy array
+        """
+        u = (min(max(t, self.t_min), self.t_max) - self.t_min) / self._step if self._step else 0.0
+        i = min(int(u), len(self.t) - 2)
+        s = u - i
+        return self.points[i] * (1 - s) + self.points[i + 1] * s
+
+    def path(self, color=YELLOW, **kwargs) -> VMobject:
+        """
+        Smooth VMobject through all valid samples.
+
+        Invalid samples (degenerate constructions) break the path into separate pieces.
+
+        Args:
+            color: Path color (default YELLOW)
+            **kwargs: Additional arguments passed to VMobject (stroke_width, ...)
+
+        Returns:
+            VMobject of the whole locus
+        """
+        path = VMobject(color=color, **kwargs)
+        for piece in self._valid_runs():
+            if len(piece) >= 2:
+                path.append_vectorized_mobject(VMobject().set_points_smoothly(self.points[piece]))
+        return path
+
+    def dot(self, tracker, color=WHITE, **kwargs) -> Dot:
+        """
+        Dot that follows the locus as a ValueTracker moves through t_range.
+
+        Args:
+            tracker: ValueTracker holding the parameter
+            color: Dot color (default WHITE)
+            **kwargs: Additional arguments passed to Dot
+
+        Returns:
+            Dot with an O(1) updater
+        """
+        dot = Dot(self.at(tracker.get_value()), color=color, **kwargs)
+        dot.add_updater(lambda mob: mob.move_to(self.at(tracker.get_value())))
+        return dot
+
+    def trace(self, tracker, color=YELLOW, **kwargs) -> VMobject:
+        """
+        Path that grows along the locus as a ValueTracker moves through t_range.
+
+        The curves of every valid run are built once. Each frame maps t to its
+        sample index with searchsorted, takes the finished curves as one slice
+        of the precomputed points and adds at most one partial curve, so the
+        trace follows t exactly even across invalid gaps.
+
+        Args:
+            tracker: ValueTracker holding the parameter
+            color: Trace color (default YELLOW)
+            **kwargs: Additional arguments passed to VMobject
+
+        Returns:
+            VMobject with an updater
+        """
+        trace = VMobject(color=color, **kwargs)
+        runs = [run for run in self._valid_runs() if len(run) >= 2]
+        curves = [VMobject().set_points_smoothly(self.points[run]).points for run in runs]
+        all_points = np.concatenate(curves) if curves else np.zeros((0, 3))
+        run_starts = np.array([run[0] for run in runs], dtype=int)
+        run_ends = np.array([run[-1] for run in runs], dtype=int)
+        run_offsets = np.cumsum([0] + [len(points) for points in curves])
+        curve_size = [len(points) // (len(run) - 1) for run, points in zip(runs, curves)]
+        last = len(self.t) - 1
+
+        def update(mob):
+            t = min(max(tracker.get_value(), self.t_min), self.t_max)
+            i = min(int(np.searchsorted(self.t, t, side='right')) - 1, last)
+            frac = (t - self.t[i]) / self._step if self._step and i < last else 0.0
+            r = int(np.searchsorted(run_starts, i, side='right')) - 1
+            if r < 0:
+                mob.clear_points()
+                return
+            if i >= run_ends[r]:
+                mob.set_points(all_points[:run_offsets[r + 1]])
+                return
+            size = curve_size[r]
+            cut = run_offsets[r] + (i - run_starts[r]) * size
+            if frac > 0:
+                partial = partial_bezier_points(all_points[cut:cut + size], 0, frac)
+                mob.set_points(np.concatenate([all_points[:cut], partial]))
+            else:
+                mob.set_points(all_points[:cut])
+
+        update(trace)
+        trace.add_updater(update)
+        return trace
+
+    def _valid_runs(self) -> list:
+        """Index arrays of consecutive valid samples."""
+        valid = self.valid
+        runs = []
+        start = None
+        for i, ok in enumerate(valid):
+            if ok and start is None:
+                start = i
+            elif not ok and start is not None:
+                runs.append(np.arange(start, i))
+                start = None
+        if start is not None:
+            runs.append(np.arange(start, len(valid)))
+        return runs
+
+
+def locus(param, construction, t_range=(0.0, 1.0), samples: int = 200, vectorized: bool = True) -> Locus:
+    """
+    Create a Locus. See Locus for full documentation.
+
+    Example:
+        >>> from robo_manim_add_ons import locus, circle_param
+        >>>
+        >>> path = locus(circle_param(ORIGIN, 2), construction).path()
+    """
+    return Locus(param, construction, t_range, samples, vectorized)
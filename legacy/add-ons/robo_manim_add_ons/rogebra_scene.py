@@ -2,8 +2,10 @@
 RogebraScene: A Scene subclass with utility methods for common animations.
 """
 
-from manim import MovingCameraScene, FadeIn, FadeOut, Transform, ReplacementTransform, Restore, VGroup, Text, MathTex, VMobject, SurroundingRectangle, RED, TEAL, GREEN, BLUE, PURPLE, ORANGE, DOWN
+from manim import MovingCameraScene, FadeIn, FadeOut, Transform, ReplacementTransform, Restore, VGroup, VMobject, SurroundingRectangle, RED, TEAL, GREEN, BLUE, PURPLE, ORANGE
 from itertools import cycle
+from .tex_cache import cached_tex, prefetch_tex
+from .text_utils import parse_index, tex_index, index_overlay, index_map
 
 
 class RogebraScene(MovingCameraScene):
@@ -217,20 +219,27 @@ class RogebraScene(MovingCameraScene):
         self.wait(wait_time)
         self.play(Restore(self.camera.frame))
 
+    def prefetch_labels(self, *tex_strings, font_size=None):
+        """
+        Typeset all label strings the scene will use with a single LaTeX run.
+
+        Call this at the top of construct() so later labels are cache hits.
+
+        Args:
+            *tex_strings: LaTeX label strings
+            font_size: Font size the labels will be created with (default MathTex default)
+
+        Examples:
+            self.prefetch_labels("A", "B", "C", "a", "b", "c")
+            self.prefetch_labels(r"\\pi", r"\\frac{\\pi}{2}", font_size=24)
+        """
+        if font_size is None:
+            return prefetch_tex(tex_strings)
+        return prefetch_tex(tex_strings, font_size=font_size)
+
     def _parse_index(self, index_arg):
         """Parse an index argument into a usable index or slice."""
-        if isinstance(index_arg, int):
-            return index_arg
-        elif isinstance(index_arg, str):
-            parts = index_arg.split(':')
-            if len(parts) == 2:
-                start = int(parts[0]) if parts[0] else None
-                end = int(parts[1]) if parts[1] else None
-                return slice(start, end)
-            else:
-                raise ValueError(f"Invalid slice format: {index_arg}")
-        else:
-            raise TypeError(f"Index must be int or string, got {type(index_arg)}")
+        return parse_index(index_arg)
 
     def _extract_part(self, mathtext_obj, *indices):
         """Extract a part from MathTex using chained indices with error reporting."""
@@ -265,18 +274,24 @@ class RogebraScene(MovingCameraScene):
             part2 = self.text("x^2 + y", 1, 2)    # Extract eq[1][2]
             part3 = self.text(eq, "1:3")          # Extract eq[1:3]
         """
-        # Create MathTex if string is provided
+        # Strings go through the shared index: typeset once, parts memoized.
+        # Typesetting errors propagate; only index errors are caught.
         if isinstance(mathtext, str):
-            mathtext_obj = MathTex(mathtext)
-        else:
-            mathtext_obj = mathtext
+            tex_index.template(mathtext)
+            try:
+                part = tex_index.part(mathtext, *args)
+            except (IndexError, TypeError, ValueError, KeyError) as e:
+                indices_str = ', '.join(str(i) for i in args)
+                print(f"Invalid index [{indices_str}]: {e}")
+                return VMobject()
+            return part.copy()
 
         # If no indices provided, return the whole MathTex object
         if len(args) == 0:
-            return mathtext_obj
+            return mathtext
 
         # Extract part using indices
-        return self._extract_part(mathtext_obj, *args)
+        return self._extract_part(mathtext, *args)
 
     def text2(self, mathtext, *args):
         """
@@ -318,12 +333,14 @@ class RogebraScene(MovingCameraScene):
 
         return extracted_part
 
-    def textdg(self, tex, scale=2, lscale=0.3, buff=0.05, color_tex=True):
+    def textdg(self, tex, scale=2, lscale=0.3, buff=0.05, color_tex=True, dump=None):
         """
         Debug utility: Show index labels below each character in a MathTex.
 
         Creates colored index labels (word_index, char_index) below each submobject,
-        making it easy to identify which indices to use for extraction.
+        making it easy to identify which indices to use for extraction. Labels are
+        composed from a cached glyph atlas (one VMobject per label color), so long
+        derivations don't need one Text render per glyph.
 
         Args:
             tex: Either a string (creates MathTex) or existing MathTex object
@@ -331,31 +348,33 @@ class RogebraScene(MovingCameraScene):
             lscale: Scale factor for the index labels (default 0.3)
             buff: Buffer between character and label (default 0.05)
             color_tex: Whether to color the MathTex characters to match labels (default True)
+            dump: If set, only build the index map: True returns it as JSON, a file path
+                  also writes it there. Nothing is scaled, colored or added (default None)
 
         Returns:
-            VGroup containing the MathTex and its index labels
+            VGroup containing the MathTex and its index labels, or the JSON string when dump is set
 
         Examples:
             self.textdg(r"\\sin(x) = \\frac{a}{b}")  # Show with default scale
             self.textdg(eq, scale=1.5)               # Use existing MathTex with custom scale
+            self.textdg(long_tex, dump="indices.json")  # Index map only, no rendering
         """
+        if dump is not None:
+            return index_map(tex, as_json=True, path=None if dump is True else dump)
+
         # Create MathTex if string is passed
         if isinstance(tex, str):
-            tex = MathTex(tex)
+            tex = cached_tex(tex)
 
         tex.scale(scale)
 
-        subscripts = VGroup()
-        colors = cycle([RED, TEAL, GREEN, BLUE, PURPLE])
-
-        for j, word in enumerate(tex):
-            for i, subtex in enumerate(word):
-                color = next(colors)
-                sub = Text(f"{j},{i}", color=color).scale(lscale)
-                sub.next_to(subtex, DOWN, buff=buff)
-                subscripts.add(sub)
-                if color_tex:
-                    subtex.set_color(color)
+        subscripts = index_overlay(tex, lscale=lscale, buff=buff, colors=[RED, TEAL, GREEN, BLUE, PURPLE])
+
+        if color_tex:
+            colors = cycle([RED, TEAL, GREEN, BLUE, PURPLE])
+            for word in tex:
+                for subtex in word:
+                    subtex.set_color(next(colors))
 
         result = VGroup(tex, subscripts)
         self.add(result)
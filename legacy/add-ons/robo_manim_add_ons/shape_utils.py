@@ -7,6 +7,7 @@ Provides helper functions for creating shapes like rectangles and triangles with
 import numpy as np
 from manim import Rectangle, Polygon, RED
 from typing import Union
+from .coerce_utils import to_position, is_point, is_number
 
 
 def rect(*args, **kwargs) -> Rectangle:
@@ -50,28 +51,9 @@ def rect(*args, **kwargs) -> Rectangle:
         >>> rb = [2, -1.5, 0]
         >>> rectangle = rect(lb, lt, rt, rb)
     """
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, (np.ndarray, list, tuple))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array/list"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return np.array(obj)
-        else:
-            raise TypeError(f"Expected Dot, np.array, or list, got {type(obj).__name__}")
-
     if len(args) == 2:
         # Could be: (width, height) OR (left_bottom, top_right)
-        if _is_number(args[0]) and _is_number(args[1]):
+        if is_number(args[0]) and is_number(args[1]):
             # Pattern: (width, height)
             width = args[0]
             height = args[1]
@@ -79,10 +61,10 @@ def rect(*args, **kwargs) -> Rectangle:
             rectangle = Rectangle(width=width, height=height, **kwargs)
             return rectangle
 
-        elif _is_point(args[0]) and _is_point(args[1]):
+        elif is_point(args[0], sequences=True) and is_point(args[1], sequences=True):
             # Pattern: (left_bottom, top_right)
-            lb_pos = _extract_position(args[0])
-            tr_pos = _extract_position(args[1])
+            lb_pos = to_position(args[0])
+            tr_pos = to_position(args[1])
 
             # Calculate width, height, and center
             width = abs(tr_pos[0] - lb_pos[0])
@@ -100,13 +82,13 @@ def rect(*args, **kwargs) -> Rectangle:
 
     elif len(args) == 4:
         # Pattern: (left_bottom, left_top, right_top, right_bottom)
-        if not all(_is_point(arg) for arg in args):
+        if not all(is_point(arg, sequences=True) for arg in args):
             raise TypeError("For 4 arguments, all must be Dot objects, np.arrays, or lists")
 
-        lb_pos = _extract_position(args[0])  # left-bottom
-        lt_pos = _extract_position(args[1])  # left-top
-        rt_pos = _extract_position(args[2])  # right-top
-        rb_pos = _extract_position(args[3])  # right-bottom
+        lb_pos = to_position(args[0])  # left-bottom
+        lt_pos = to_position(args[1])  # left-top
+        rt_pos = to_position(args[2])  # right-top
+        rb_pos = to_position(args[3])  # right-bottom
 
         # Calculate width and height
         # Width: distance between left and right sides
@@ -336,3 +318,152 @@ def tri_ssa(a: float, b: float, angle_deg: float, **kwargs) -> Polygon:
     C = np.array([b * np.cos(angle_A), b * np.sin(angle_A), 0])
 
     return Polygon(A, B, C, **kwargs)
+
+
+# ============================================================================
+# Vectorized triangle solvers
+# ============================================================================
+
+def _triangle_vertices(c, b, angle_A, valid) -> np.ndarray:
+    """Vertices A at origin, B at distance c on the x-axis, C at distance b and angle angle_A."""
+    vertices = np.zeros(c.shape + (3, 3))
+    vertices[..., 1, 0] = c
+    vertices[..., 2, 0] = b * np.cos(angle_A)
+    vertices[..., 2, 1] = b * np.sin(angle_A)
+    vertices[~valid] = np.nan
+    return vertices
+
+
+def tri_sss_many(a, b=None, c=None) -> tuple:
+    """
+    Solve many SSS triangles at once.
+
+    Vertices are placed as in tri_sss(): A at the origin, B at distance c along the
+    positive x-axis, C from the law of cosines. No Polygons are built; pass the
+    selected rows to tri_polygons().
+
+    Args:
+        a: Array (N,) of side lengths opposite to vertex A
+        b: Array (N,) of side lengths opposite to vertex B (optional, defaults to a)
+        c: Array (N,) of side lengths opposite to vertex C (optional, defaults to a)
+
+    Returns:
+        Tuple (vertices, valid):
+            vertices: Array (N, 3, 3) of triangle vertices (NaN where invalid)
+            valid: Boolean array (N,), False where the triangle inequality fails
+
+    Example:
+        >>> from robo_manim_add_ons.shape_utils import tri_sss_many, tri_polygons
+        >>>
+        >>> sides = np.random.uniform(1, 5, size=(3, 10000))
+        >>> vertices, valid = tri_sss_many(*sides)
+        >>> triangles = tri_polygons(vertices, np.flatnonzero(valid)[:4])
+    """
+    if b is None and c is None:
+        b = c = a
+    elif b is None or c is None:
+        raise ValueError("Either provide 1 argument (equilateral) or 3 arguments (a, b, c)")
+    a, b, c = np.broadcast_arrays(*(np.asarray(side, dtype=float) for side in (a, b, c)))
+
+    valid = (a + b > c) & (a + c > b) & (b + c > a)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_A = np.clip((b ** 2 + c ** 2 - a ** 2) / (2 * b * c), -1, 1)
+    return _triangle_vertices(c, b, np.arccos(cos_A), valid), valid
+
+
+def tri_sas_many(a, angle_deg, b) -> tuple:
+    """
+    Solve many SAS triangles at once.
+
+    Vertices are placed as in tri_sas(): A at the origin, B at distance a along the
+    positive x-axis, C at distance b and the included angle from A.
+
+    Args:
+        a: Array (N,) of first side lengths
+        angle_deg: Array (N,) of included angles in degrees
+        b: Array (N,) of second side lengths
+
+    Returns:
+        Tuple (vertices, valid):
+            vertices: Array (N, 3, 3) of triangle vertices (NaN where invalid)
+            valid: Boolean array (N,), False for non-positive sides or angles outside (0, 180)
+
+    Example:
+        >>> from robo_manim_add_ons.shape_utils import tri_sas_many
+        >>>
+        >>> vertices, valid = tri_sas_many([3, 2], [90, 60], [4, 3])
+    """
+    a, angle_deg, b = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, angle_deg, b)))
+    valid = (a > 0) & (b > 0) & (angle_deg > 0) & (angle_deg < 180)
+    return _triangle_vertices(a, b, np.radians(angle_deg), valid), valid
+
+
+def tri_ssa_many(a, b, angle_deg, solution: int = 1) -> tuple:
+    """
+    Solve many SSA triangles at once, flagging impossible and ambiguous cases.
+
+    Solution 1 is the triangle tri_ssa() returns. Where the data is ambiguous, a
+    second triangle exists with the obtuse angle at B; request it with solution=2.
+
+    Args:
+        a: Array (N,) of side lengths opposite to the given angle
+        b: Array (N,) of second side lengths
+        angle_deg: Array (N,) of angles opposite to side a, in degrees
+        solution: 1 for the first solution, 2 for the second (ambiguous) one (default 1)
+
+    Returns:
+        Tuple (vertices, valid, ambiguous):
+            vertices: Array (N, 3, 3) of triangle vertices (NaN where invalid)
+            valid: Boolean array (N,), True where the requested solution exists
+            ambiguous: Boolean array (N,), True where two triangles fit the data
+
+    Example:
+        >>> from robo_manim_add_ons.shape_utils import tri_ssa_many
+        >>>
+        >>> vertices, valid, ambiguous = tri_ssa_many([3, 3, 1], [5, 5, 5], [30, 30, 30])
+        >>> second, valid2, _ = tri_ssa_many([3], [5], [30], solution=2)
+    """
+    if solution not in (1, 2):
+        raise ValueError(f"solution must be 1 or 2, got {solution}")
+    a, b, angle_deg = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, angle_deg)))
+
+    angle_A = np.radians(angle_deg)
+    inputs_ok = (a > 0) & (b > 0) & (angle_deg > 0) & (angle_deg < 180)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sin_B = b * np.sin(angle_A) / a
+        angle_B1 = np.arcsin(np.clip(sin_B, -1, 1))
+    angle_B2 = np.pi - angle_B1
+
+    exists = inputs_ok & (sin_B <= 1)
+    first = exists & (np.pi - angle_A - angle_B1 > 0)
+    second = exists & (sin_B < 1) & (np.pi - angle_A - angle_B2 > 0)
+    ambiguous = first & second
+
+    valid = first if solution == 1 else second
+    angle_B = angle_B1 if solution == 1 else angle_B2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = a * np.sin(np.pi - angle_A - angle_B) / np.sin(angle_A)
+    return _triangle_vertices(c, b, angle_A, valid), valid, ambiguous
+
+
+def tri_polygons(vertices, indices=None, **kwargs) -> list:
+    """
+    Build Polygons for selected rows of a solved vertex array.
+
+    Args:
+        vertices: Array (N, 3, 3) from tri_sss_many(), tri_sas_many() or tri_ssa_many()
+        indices: Row indices or boolean mask to build (default None, all rows)
+        **kwargs: Additional styling arguments (color, fill_opacity, etc.)
+
+    Returns:
+        List of Polygon objects (red by default)
+
+    Example:
+        >>> from robo_manim_add_ons import tri_polygons
+        >>>
+        >>> triangles = tri_polygons(vertices, valid & (vertices[:, 2, 1] > 1))
+    """
+    if 'color' not in kwargs:
+        kwargs['color'] = RED
+    selected = np.asarray(vertices) if indices is None else np.asarray(vertices)[indices]
+    return [Polygon(*triangle, **kwargs) for triangle in selected]
@@ -2,12 +2,99 @@
 Style utilities for chainable styling of Manim objects.
 
 Provides convenient methods for styling objects with method chaining.
+Style chains apply each change immediately, or after defer() collect them and
+write them in one pass over the submobject family; style_many() does the same
+for many objects at once.
+Themes map semantic roles (axis, construction, highlight, label, shape) to
+precompiled styles and restyle every tagged object in one pass.
 """
 
-from manim import VMobject
+import weakref
+import numpy as np
+from manim import (VMobject, color_to_rgb, BLACK, WHITE, GREY, GREY_B, GREY_C, GREY_D,
+                   BLUE, BLUE_D, RED, YELLOW)
 from typing import Union
 
 
+class _CompiledStyle:
+    """Style changes with colors already converted to RGB, ready to write."""
+
+    __slots__ = ('stroke_color', 'fill_color', 'stroke_rgb', 'fill_rgb', 'stroke_opacity', 'fill_opacity',
+                 'width', 'gradient_stroke', 'gradient_fill')
+
+    def __init__(self, changes: dict):
+        self.stroke_color = changes.get('stroke')
+        self.fill_color = changes.get('fill')
+        # Gradients (several colors) go through the manim setters, as set_stroke/set_fill tuplify them
+        self.gradient_stroke = isinstance(self.stroke_color, (list, tuple))
+        self.gradient_fill = isinstance(self.fill_color, (list, tuple))
+        self.stroke_rgb = (color_to_rgb(self.stroke_color)
+                           if self.stroke_color is not None and not self.gradient_stroke else None)
+        self.fill_rgb = color_to_rgb(self.fill_color) if self.fill_color is not None and not self.gradient_fill else None
+        self.stroke_opacity = changes.get('sopacity')
+        self.fill_opacity = changes.get('fopacity')
+        self.width = changes.get('sw')
+
+    def apply(self, obj):
+        """Write the style to every VMobject in obj's family, like set_stroke()/set_fill() do."""
+        touch_stroke = self.stroke_color is not None or self.stroke_opacity is not None or self.width is not None
+        touch_fill = self.fill_color is not None or self.fill_opacity is not None
+        for mob in obj.get_family():
+            if not isinstance(mob, VMobject):
+                continue
+            # Sheen turns one color into a two-color gradient: leave that to manim
+            slow = getattr(mob, 'sheen_factor', 0) != 0
+            if touch_stroke:
+                if slow or self.gradient_stroke:
+                    mob.set_stroke(color=self.stroke_color, width=self.width, opacity=self.stroke_opacity, family=False)
+                else:
+                    _update_rgbas(mob, 'stroke_rgbas', self.stroke_rgb, self.stroke_opacity)
+                    if self.stroke_opacity is not None:
+                        mob.stroke_opacity = self.stroke_opacity
+                    if self.width is not None:
+                        mob.stroke_width = self.width
+            if touch_fill:
+                if slow or self.gradient_fill:
+                    mob.set_fill(color=self.fill_color, opacity=self.fill_opacity, family=False)
+                else:
+                    _update_rgbas(mob, 'fill_rgbas', self.fill_rgb, self.fill_opacity)
+                    if self.fill_opacity is not None:
+                        mob.fill_opacity = self.fill_opacity
+
+
+def _apply_style(objs, changes: dict):
+    """
+    Apply collected style changes to objects in a single family traversal.
+
+    Colors are converted to RGB once; each family member's stroke/fill arrays and
+    opacity attributes are then updated the way VMobject.update_rgbas_array() and
+    set_stroke()/set_fill() update them (gradients and sheen use the setters).
+    """
+    compiled = _CompiledStyle(changes)
+    for obj in objs:
+        compiled.apply(obj)
+
+
+def _update_rgbas(mob: VMobject, name: str, rgb, opacity):
+    """
+    Overwrite the color and/or opacity columns of a stroke/fill RGBA array in place.
+
+    A missing or empty array is created from the new values, with black and zero
+    opacity for the parts not given, as generate_rgbas_array() does.
+    """
+    rgbas = getattr(mob, name, None)
+    if rgbas is None or len(rgbas) == 0:
+        rgbas = np.zeros((1, 4))
+        rgbas[0, :3] = color_to_rgb(BLACK) if rgb is None else rgb
+        rgbas[0, 3] = 0.0 if opacity is None else opacity
+        setattr(mob, name, rgbas)
+        return
+    if rgb is not None:
+        rgbas[:, :3] = rgb
+    if opacity is not None:
+        rgbas[:, 3] = opacity
+
+
 def stroke(obj: VMobject, color) -> VMobject:
     """
     Set stroke color of a VMobject.
@@ -113,16 +200,22 @@ class Style:
     """
     Helper class for chainable styling.
 
-    This class wraps a VMobject and provides chainable styling methods.
+    This class wraps a VMobject and provides chainable styling methods. Each
+    call takes effect immediately. After defer(), changes are collected instead
+    and written together in one pass over the object's family when apply() or
+    get() is called.
 
     Example:
         >>> from robo_manim_add_ons import Style
         >>> line = Line(ORIGIN, RIGHT)
-        >>> Style(line).stroke(RED).sw(3).sopacity(0.8)
+        >>> line = Style(line).stroke(RED).sw(3).sopacity(0.8).get()
         >>>
-        >>> # Or use the s() convenience function
-        >>> from robo_manim_add_ons import s
-        >>> s(line).stroke(YELLOW).sw(5)
+        >>> # Or use the style() convenience function
+        >>> from robo_manim_add_ons import style
+        >>> style(line).stroke(YELLOW).sw(5)
+        >>>
+        >>> # Deferred: one family pass for the whole chain
+        >>> style(group).defer().stroke(YELLOW).fill(BLUE).fopacity(0.3).sw(5).apply()
     """
 
     def __init__(self, obj: VMobject):
@@ -133,6 +226,18 @@ class Style:
             obj: The VMobject to style
         """
         self.obj = obj
+        self._changes = {}
+        self._deferred = False
+
+    def defer(self) -> 'Style':
+        """
+        Collect the following changes until apply() or get() is called.
+
+        Returns:
+            Self (for chaining)
+        """
+        self._deferred = True
+        return self
 
     def stroke(self, color) -> 'Style':
         """
@@ -144,7 +249,7 @@ class Style:
         Returns:
             Self (for chaining)
         """
-        self.obj.set_stroke(color=color)
+        self._set('stroke', color)
         return self
 
     def fill(self, color) -> 'Style':
@@ -157,7 +262,7 @@ class Style:
         Returns:
             Self (for chaining)
         """
-        self.obj.set_fill(color=color)
+        self._set('fill', color)
         return self
 
     def sopacity(self, opacity: float) -> 'Style':
@@ -170,7 +275,7 @@ class Style:
         Returns:
             Self (for chaining)
         """
-        self.obj.set_stroke(opacity=opacity)
+        self._set('sopacity', opacity)
         return self
 
     def fopacity(self, opacity: float) -> 'Style':
@@ -183,7 +288,7 @@ class Style:
         Returns:
             Self (for chaining)
         """
-        self.obj.set_fill(opacity=opacity)
+        self._set('fopacity', opacity)
         return self
 
     def sw(self, width: float) -> 'Style':
@@ -196,16 +301,36 @@ class Style:
         Returns:
             Self (for chaining)
         """
-        self.obj.set_stroke(width=width)
+        self._set('sw', width)
+        return self
+
+    def _set(self, key: str, value) -> None:
+        """Record a change; write it right away unless the builder is deferred."""
+        self._changes[key] = value
+        if not self._deferred:
+            self.apply()
+
+    def apply(self) -> 'Style':
+        """
+        Apply the collected changes in a single family traversal and end deferral.
+
+        Returns:
+            Self (for chaining)
+        """
+        self._deferred = False
+        if self._changes:
+            changes, self._changes = self._changes, {}
+            _apply_style([self.obj], changes)
         return self
 
     def get(self) -> VMobject:
         """
-        Get the styled object.
+        Apply the collected changes and get the styled object.
 
         Returns:
             The VMobject
         """
+        self.apply()
         return self.obj
 
 
@@ -225,10 +350,230 @@ def style(obj: VMobject) -> Style:
         >>>
         >>> # Chain multiple styles
         >>> line = Line(ORIGIN, RIGHT)
-        >>> style(line).stroke(RED).sw(5).sopacity(0.7)
+        >>> line = style(line).stroke(RED).sw(5).sopacity(0.7).get()
         >>>
         >>> # Works with any VMobject
         >>> circle = Circle()
         >>> style(circle).fill(BLUE).fopacity(0.3).stroke(RED).sw(2)
+        >>>
+        >>> # One family pass for the whole chain
+        >>> style(circle).defer().fill(BLUE).fopacity(0.3).stroke(RED).sw(2).apply()
     """
     return Style(obj)
+
+
+def style_many(objs, stroke=None, fill=None, sopacity: float = None, fopacity: float = None,
+               sw: float = None) -> list:
+    """
+    Style many objects in one pass.
+
+    Colors are converted once and every object's family is visited once, instead
+    of one full traversal per setter per object.
+
+    Args:
+        objs: Iterable of VMobjects (or a VGroup)
+        stroke: Stroke color (default None, unchanged)
+        fill: Fill color (default None, unchanged)
+        sopacity: Stroke opacity (default None, unchanged)
+        fopacity: Fill opacity (default None, unchanged)
+        sw: Stroke width (default None, unchanged)
+
+    Returns:
+        The objects as a list
+
+    Example:
+        >>> from robo_manim_add_ons import style_many
+        >>>
+        >>> style_many(grid_lines, stroke=GREY, sopacity=0.5, sw=1)
+        >>> style_many([tri1, tri2, tri3], fill=BLUE, fopacity=0.3)
+    """
+    objs = list(objs)
+    changes = {key: value for key, value in
+               (('stroke', stroke), ('fill', fill), ('sopacity', sopacity), ('fopacity', fopacity), ('sw', sw))
+               if value is not None}
+    _apply_style(objs, changes)
+    return objs
+
+
+# ============================================================================
+# Themes
+# ============================================================================
+
+# Role tag per object; entries vanish with the objects
+_ROLES = weakref.WeakKeyDictionary()
+_THEMES = {}
+_active_theme = None
+
+
+class Theme:
+    """
+    A named mapping from semantic roles to styles.
+
+    Role styles use the style_many() keywords (stroke, fill, sopacity, fopacity, sw).
+    Colors are converted to RGB once, when the role is defined.
+
+    Example:
+        >>> from robo_manim_add_ons import Theme, register_theme, tag, apply_theme
+        >>>
+        >>> register_theme(Theme("slides", axis=dict(stroke=GREY_B, sw=2), highlight=dict(stroke=ORANGE, sw=6)))
+        >>> tag(axes, "axis"); tag(median, "highlight")
+        >>> apply_theme("slides")
+    """
+
+    def __init__(self, name: str, **roles):
+        """
+        Initialize a theme.
+
+        Args:
+            name: Theme name used by register_theme() / apply_theme()
+            **roles: role=dict(stroke=..., fill=..., sopacity=..., fopacity=..., sw=...)
+        """
+        self.name = name
+        self.roles = {}
+        self._compiled = {}
+        for role, changes in roles.items():
+            self.role(role, **changes)
+
+    def role(self, role: str, **changes) -> 'Theme':
+        """
+        Define or replace the style of a role.
+
+        Args:
+            role: Role name
+            **changes: stroke, fill, sopacity, fopacity and/or sw
+
+        Returns:
+            Self (for chaining)
+        """
+        self.roles[role] = dict(changes)
+        self._compiled[role] = _CompiledStyle(changes)
+        return self
+
+    def apply(self, objs=None) -> int:
+        """
+        Restyle tagged objects with this theme.
+
+        Args:
+            objs: Objects to restyle (default None, every tagged object)
+
+        Returns:
+            Number of objects restyled
+        """
+        if objs is None:
+            items = list(_ROLES.items())
+        else:
+            items = [(obj, _ROLES.get(obj)) for obj in objs]
+        count = 0
+        for obj, role in items:
+            compiled = self._compiled.get(role)
+            if compiled is not None:
+                compiled.apply(obj)
+                count += 1
+        return count
+
+    def __repr__(self):
+        return f"Theme({self.name!r}, roles={sorted(self.roles)})"
+
+
+def register_theme(theme: Theme) -> Theme:
+    """
+    Register a theme under its name (replacing one with the same name).
+
+    Args:
+        theme: The Theme
+
+    Returns:
+        The theme
+    """
+    _THEMES[theme.name] = theme
+    return theme
+
+
+def get_theme(name: str) -> Theme:
+    """
+    Look up a registered theme.
+
+    Args:
+        name: Theme name
+
+    Returns:
+        The Theme
+
+    Raises:
+        ValueError: If no theme with that name is registered
+    """
+    if name not in _THEMES:
+        raise ValueError(f"Unknown theme '{name}'. Registered themes: {sorted(_THEMES)}")
+    return _THEMES[name]
+
+
+def tag(obj: VMobject, role: str) -> VMobject:
+    """
+    Tag an object with a semantic role; the active theme (if any) styles it right away.
+
+    Args:
+        obj: The VMobject (or group) to tag
+        role: Role name, e.g. "axis", "construction", "highlight", "label", "shape"
+
+    Returns:
+        The object (for chaining)
+
+    Example:
+        >>> from robo_manim_add_ons import tag
+        >>> helper = tag(DashedLine(A, B), "construction")
+    """
+    _ROLES[obj] = role
+    if _active_theme is not None:
+        _active_theme.apply([obj])
+    return obj
+
+
+def apply_theme(theme: Union[Theme, str], objs=None) -> Theme:
+    """
+    Make a theme active and restyle tagged objects in one pass.
+
+    Args:
+        theme: Theme or registered theme name ("light", "dark", "print" are built in)
+        objs: Objects to restyle (default None, every tagged object)
+
+    Returns:
+        The active Theme
+
+    Example:
+        >>> from robo_manim_add_ons import apply_theme
+        >>>
+        >>> apply_theme("dark")
+        >>> apply_theme("print")   # one pass over every tagged object
+    """
+    global _active_theme
+    if isinstance(theme, str):
+        theme = get_theme(theme)
+    _active_theme = theme
+    theme.apply(objs)
+    return theme
+
+
+register_theme(Theme(
+    "light",
+    axis=dict(stroke=BLACK, sopacity=1, sw=2),
+    construction=dict(stroke=GREY_C, sopacity=0.8, sw=2),
+    highlight=dict(stroke=RED, sopacity=1, sw=5),
+    label=dict(stroke=BLACK, fill=BLACK, fopacity=1, sw=0),
+    shape=dict(stroke=BLUE_D, fill=BLUE_D, sw=3),
+))
+register_theme(Theme(
+    "dark",
+    axis=dict(stroke=GREY_B, sopacity=1, sw=2),
+    construction=dict(stroke=GREY, sopacity=0.7, sw=2),
+    highlight=dict(stroke=YELLOW, sopacity=1, sw=5),
+    label=dict(stroke=WHITE, fill=WHITE, fopacity=1, sw=0),
+    shape=dict(stroke=BLUE, fill=BLUE, sw=3),
+))
+register_theme(Theme(
+    "print",
+    axis=dict(stroke=BLACK, sopacity=1, sw=2),
+    construction=dict(stroke=GREY_D, sopacity=1, sw=1),
+    highlight=dict(stroke=BLACK, sopacity=1, sw=5),
+    label=dict(stroke=BLACK, fill=BLACK, fopacity=1, sw=0),
+    shape=dict(stroke=BLACK, fill=GREY_C, sw=2),
+))
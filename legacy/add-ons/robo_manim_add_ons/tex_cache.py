@@ -0,0 +1,425 @@
+"""
+Shared cache for typeset MathTex labels.
+
+Provides a memoizing MathTex factory so that short label strings ("A", "a", "3")
+are typeset once and handed out as copies afterwards, plus a prefetch API that
+compiles many labels with a single LaTeX run.
+"""
+
+import re
+import shutil
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from pathlib import Path
+from manim import MathTex, TexTemplate, config, DEFAULT_FONT_SIZE
+
+# Environment MathTex wraps its expression in
+_MATH_ENVIRONMENT = "align*"
+
+# Batching reproduces manim's tex file naming and expression clean-up, which are
+# not public API; only enable it on versions where those internals are known.
+_MIN_BATCH_MANIM = (0, 17)
+
+
+def _manim_version() -> tuple:
+    try:
+        from manim import __version__
+        return tuple(int(part) for part in re.findall(r"\d+", __version__)[:3])
+    except Exception:
+        return ()
+
+
+try:
+    from manim.utils.tex_file_writing import tex_hash, tex_to_svg_file
+    _BATCH_SUPPORTED = (_manim_version() >= _MIN_BATCH_MANIM
+                        and hasattr(MathTex, '_get_modified_expression'))
+except ImportError:
+    tex_hash = tex_to_svg_file = None
+    _BATCH_SUPPORTED = False
+
+# Template key -> whether a batch page matched the single-label compile
+_BATCH_VERIFIED = {}
+
+
+def _template_key(tex_template):
+    """Return a hashable key describing the effective TeX template."""
+    if tex_template is None:
+        tex_template = config.tex_template
+    if tex_template is None:
+        return None
+    return getattr(tex_template, 'body', None) or repr(tex_template)
+
+
+def _modified_expression(tex_string: str) -> str:
+    """Apply the same expression clean-up MathTex performs before hashing."""
+    if not _BATCH_SUPPORTED:
+        return tex_string.strip()
+    try:
+        probe = MathTex.__new__(MathTex)
+        return probe._get_modified_expression(tex_string)
+    except Exception:
+        return tex_string.strip()
+
+
+def _svg_path(expression: str, tex_template) -> Path:
+    """Path of the SVG that MathTex looks up for an expression."""
+    tex_code = tex_template.get_texcode_for_expression_in_env(expression, _MATH_ENVIRONMENT)
+    tex_dir = Path(config.get_dir("tex_dir"))
+    return tex_dir / (tex_hash(tex_code) + ".svg")
+
+
+def _batch_document(expressions: list, tex_template) -> str:
+    """
+    Build one LaTeX document with every expression on its own page.
+
+    The preview package in active mode emits each preview environment as a
+    separate page, so the DVI has exactly one page per expression. The article
+    class matches manim's default standalone class (article based); templates
+    with another document class are not batched (see compile_tex_batch).
+    """
+    lines = [
+        r"\documentclass{article}",
+        r"\usepackage[active,tightpage]{preview}",
+        tex_template.preamble,
+        r"\begin{document}",
+        tex_template.post_doc_commands,
+    ]
+    for expression in expressions:
+        lines += [
+            r"\begin{preview}",
+            rf"\begin{{{_MATH_ENVIRONMENT}}}",
+            expression,
+            rf"\end{{{_MATH_ENVIRONMENT}}}",
+            r"\end{preview}",
+        ]
+    lines.append(r"\end{document}")
+    return "\n".join(lines)
+
+
+def _glyph_layout(svg_file: Path) -> list:
+    """
+    Glyph and rule boxes of a dvisvgm SVG, relative to the first one.
+
+    Returns:
+        Sorted list of (kind, dx, dy, width, height) rounded to 1e-3 pt
+    """
+    items = []
+    for element in ET.parse(str(svg_file)).getroot().iter():
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag not in ('use', 'rect'):
+            continue
+        items.append((tag, float(element.get('x', 0)), float(element.get('y', 0)),
+                      float(element.get('width', 0)), float(element.get('height', 0))))
+    if not items:
+        return []
+    x0, y0 = items[0][1], items[0][2]
+    return sorted((kind, round(x - x0, 3), round(y - y0, 3), round(w, 3), round(h, 3))
+                  for kind, x, y, w, h in items)
+
+
+def _batch_matches_single(expression: str, batch_svg: Path, tex_template) -> bool:
+    """
+    Compile one expression the normal way and compare its glyph boxes with the batch page.
+
+    The single compile is written to the path MathTex looks up, so the work is
+    not wasted either way.
+    """
+    try:
+        single_svg = Path(tex_to_svg_file(expression, _MATH_ENVIRONMENT, tex_template))
+        return _glyph_layout(single_svg) == _glyph_layout(batch_svg)
+    except Exception as e:
+        print(f"Warning: could not verify batch LaTeX output: {e}")
+        return False
+
+
+def compile_tex_batch(expressions: list, tex_template=None) -> dict:
+    """
+    Compile many MathTex expressions with one latex and one dvisvgm run.
+
+    The per-page SVGs are written to the paths MathTex looks up in the media
+    tex directory, so creating MathTex objects for these expressions afterwards
+    does not spawn any LaTeX process.
+
+    Only templates with manim's default document class are batched. The first
+    time a template is batched, one expression is also compiled the normal way
+    and the glyph boxes of both SVGs are compared; if they differ, batching is
+    disabled for that template and callers fall back to per-label compiles.
+    Batching is also disabled on manim versions whose tex internals are unknown.
+
+    Args:
+        expressions: List of (already cleaned-up) MathTex expressions
+        tex_template: TexTemplate to compile with (default None, uses config.tex_template)
+
+    Returns:
+        dict mapping each expression to its SVG path (empty if the batch run failed
+        or was skipped)
+    """
+    if tex_template is None:
+        tex_template = config.tex_template
+
+    if not _BATCH_SUPPORTED:
+        return {}
+    template_key = _template_key(tex_template)
+    if _BATCH_VERIFIED.get(template_key) is False:
+        return {}
+
+    documentclass = getattr(tex_template, 'documentclass', None)
+    if documentclass != TexTemplate().documentclass:
+        print(f"Warning: batch LaTeX compilation only supports the default document class, got {documentclass}")
+        return {}
+
+    compiler = getattr(tex_template, 'tex_compiler', 'latex')
+    output_format = getattr(tex_template, 'output_format', '.dvi')
+    if output_format not in ('.dvi', '.xdv'):
+        print(f"Warning: batch LaTeX compilation needs DVI/XDV output, got {output_format}")
+        return {}
+    if shutil.which(compiler) is None or shutil.which("dvisvgm") is None:
+        print(f"Warning: batch LaTeX compilation needs '{compiler}' and 'dvisvgm' on PATH")
+        return {}
+
+    with tempfile.TemporaryDirectory(prefix="robo_tex_") as tmp:
+        tmp_dir = Path(tmp)
+        tex_file = tmp_dir / "labels.tex"
+        tex_file.write_text(_batch_document(expressions, tex_template), encoding="utf-8")
+
+        compile_cmd = [compiler, "-interaction=batchmode", "-halt-on-error",
+                       f"-output-directory={tmp_dir}", str(tex_file)]
+        if compiler == "xelatex":
+            compile_cmd.insert(1, "-no-pdf")
+        elif compiler == "lualatex":
+            compile_cmd.insert(1, "--output-format=dvi")
+        svg_cmd = ["dvisvgm", str(tex_file.with_suffix(output_format)), "--page=1-",
+                   "-n", "-v", "0", "-o", str(tmp_dir / "page-%p.svg")]
+
+        try:
+            subprocess.run(compile_cmd, cwd=tmp_dir, check=True, capture_output=True)
+            subprocess.run(svg_cmd, cwd=tmp_dir, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Warning: batch LaTeX compilation failed: {e}")
+            return {}
+
+        pages = {}
+        for svg_file in tmp_dir.glob("page-*.svg"):
+            match = re.fullmatch(r"page-(\d+)\.svg", svg_file.name)
+            if match:
+                pages[int(match.group(1))] = svg_file
+        if sorted(pages) != list(range(1, len(expressions) + 1)):
+            print(f"Warning: batch LaTeX compilation produced {len(pages)} pages for {len(expressions)} labels")
+            return {}
+
+        if template_key not in _BATCH_VERIFIED:
+            _BATCH_VERIFIED[template_key] = _batch_matches_single(expressions[0], pages[1], tex_template)
+            if not _BATCH_VERIFIED[template_key]:
+                print("Warning: batch LaTeX output differs from single compiles; batching disabled for this template")
+                return {}
+
+        result = {}
+        for page, expression in enumerate(expressions, start=1):
+            target = _svg_path(expression, tex_template)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not target.exists():
+                shutil.move(str(pages[page]), str(target))
+            result[expression] = target
+        return result
+
+
+class TexCache:
+    """
+    Bounded LRU cache of typeset MathTex templates.
+
+    Entries are keyed on (tex string, tex template, font size). A lookup returns a
+    copy of the cached template, so callers are free to move, scale and recolor
+    the result.
+
+    Example:
+        >>> from robo_manim_add_ons.tex_cache import TexCache
+        >>>
+        >>> cache = TexCache(maxsize=256)
+        >>> a1 = cache.get("A")
+        >>> a2 = cache.get("A")  # copy of the cached template, no re-typesetting
+        >>> cache.info()
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 256}
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of typeset templates to keep (default 512)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+
+    @staticmethod
+    def key(tex_string: str, font_size: float = DEFAULT_FONT_SIZE, tex_template=None) -> tuple:
+        """
+        Build the cache key for a label.
+
+        Args:
+            tex_string: LaTeX string of the label
+            font_size: Font size passed to MathTex (default DEFAULT_FONT_SIZE)
+            tex_template: TexTemplate passed to MathTex (default None, uses config.tex_template)
+
+        Returns:
+            Hashable tuple (tex string, template key, font size)
+        """
+        return (tex_string, _template_key(tex_template), float(font_size))
+
+    def get(self, tex_string: str, font_size: float = DEFAULT_FONT_SIZE, tex_template=None) -> MathTex:
+        """
+        Return a MathTex for the string, typesetting it only on the first request.
+
+        Args:
+            tex_string: LaTeX string of the label
+            font_size: Font size passed to MathTex (default DEFAULT_FONT_SIZE)
+            tex_template: TexTemplate passed to MathTex (default None, uses config.tex_template)
+
+        Returns:
+            A fresh copy of the cached MathTex
+        """
+        key = self.key(tex_string, font_size, tex_template)
+        template = self._templates.get(key)
+        if template is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template.copy()
+
+        self.misses += 1
+        template = MathTex(tex_string, font_size=font_size, tex_template=tex_template)
+        self.put(key, template)
+        return template.copy()
+
+    def put(self, key: tuple, template: MathTex) -> None:
+        """
+        Store a typeset template under a key built with TexCache.key().
+
+        Args:
+            key: Cache key from TexCache.key()
+            template: The MathTex to keep as template (not copied)
+        """
+        self._templates[key] = template
+        self._templates.move_to_end(key)
+        while len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+
+    def prefetch(self, tex_strings, font_size: float = DEFAULT_FONT_SIZE, tex_template=None) -> int:
+        """
+        Typeset all labels that are not cached yet with a single LaTeX run.
+
+        Labels whose SVG is already on disk are only loaded. If the batch run is
+        not possible (missing binaries, LaTeX error) the remaining labels are
+        typeset one by one, so the cache is always populated afterwards.
+
+        Args:
+            tex_strings: Iterable of LaTeX label strings
+            font_size: Font size the labels will be requested with (default DEFAULT_FONT_SIZE)
+            tex_template: TexTemplate the labels will be requested with (default None)
+
+        Returns:
+            Number of labels that were compiled in the batch run
+        """
+        template = tex_template if tex_template is not None else config.tex_template
+        tex_strings = list(dict.fromkeys(tex_strings))
+
+        pending = []
+        for tex_string in tex_strings:
+            if not _BATCH_SUPPORTED or self.key(tex_string, font_size, tex_template) in self:
+                continue
+            expression = _modified_expression(tex_string)
+            if not _svg_path(expression, template).exists():
+                pending.append(expression)
+
+        compiled = compile_tex_batch(list(dict.fromkeys(pending)), template) if pending else {}
+
+        for tex_string in tex_strings:
+            key = self.key(tex_string, font_size, tex_template)
+            if key not in self:
+                self.misses += 1
+                self.put(key, MathTex(tex_string, font_size=font_size, tex_template=tex_template))
+        return len(compiled)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def info(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict with 'hits', 'misses', 'size' and 'maxsize'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._templates),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached templates and reset the hit/miss counters."""
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Package-wide cache shared by the label and annotation helpers
+label_cache = TexCache()
+
+
+def cached_tex(tex_string: str, font_size: float = DEFAULT_FONT_SIZE, tex_template=None) -> MathTex:
+    """
+    Create a MathTex label through the shared package cache.
+
+    Identical (tex string, tex template, font size) requests are typeset once;
+    every call returns an independent copy.
+
+    Args:
+        tex_string: LaTeX string of the label (e.g., "A", r"\\theta")
+        font_size: Font size passed to MathTex (default DEFAULT_FONT_SIZE)
+        tex_template: TexTemplate passed to MathTex (default None, uses config.tex_template)
+
+    Returns:
+        MathTex copy of the cached label
+
+    Example:
+        >>> from robo_manim_add_ons import cached_tex
+        >>>
+        >>> labels = [cached_tex("A") for _ in range(100)]  # typeset once
+    """
+    return label_cache.get(tex_string, font_size, tex_template)
+
+
+def prefetch_tex(tex_strings, font_size: float = DEFAULT_FONT_SIZE, tex_template=None) -> int:
+    """
+    Compile all label strings up front into the shared label cache.
+
+    All labels that are neither cached nor already on disk are written into one
+    multi-page LaTeX document, compiled with a single latex + dvisvgm run and
+    split into the per-label SVGs MathTex expects. Later cached_tex() calls for
+    these strings are plain cache hits.
+
+    Args:
+        tex_strings: Iterable of LaTeX label strings
+        font_size: Font size the labels will be requested with (default DEFAULT_FONT_SIZE)
+        tex_template: TexTemplate the labels will be requested with (default None)
+
+    Returns:
+        Number of labels compiled in the batch run
+
+    Example:
+        >>> from robo_manim_add_ons import prefetch_tex, vertex_labels
+        >>>
+        >>> prefetch_tex(["A", "B", "C", "a", "b", "c"])  # one latex run
+        >>> labels = vertex_labels(triangle, ["A", "B", "C"])  # cache hits
+    """
+    return label_cache.prefetch(tex_strings, font_size, tex_template)
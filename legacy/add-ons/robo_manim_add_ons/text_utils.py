@@ -2,9 +2,332 @@
 Text utilities for MathTex extraction and debugging.
 
 Provides helper class for flexible MathTex part extraction with silent error handling.
+Extractions from strings go through a shared index: each string is typeset once,
+index specs are parsed once, and resolved parts are memoized, so repeated
+text("x^2+y^2", 1, 2) calls only copy the requested part.
+
+Index overlays for debugging are composed from a digit/comma glyph atlas that is
+rendered once, instead of one Pango Text per glyph.
 """
 
-from manim import MathTex, VMobject, SurroundingRectangle, BLUE, ORANGE
+import json
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
+from manim import VMobject, VGroup, Text, SurroundingRectangle, BLUE, ORANGE, RED, TEAL, GREEN, PURPLE
+from .tex_cache import cached_tex
+
+
+@lru_cache(maxsize=1024)
+def _parse_slice(index_arg: str) -> slice:
+    """Parse "1:2", "1:" or ":2" into a slice (memoized)."""
+    parts = index_arg.split(':')
+    if len(parts) == 2:
+        start = int(parts[0]) if parts[0] else None
+        end = int(parts[1]) if parts[1] else None
+        return slice(start, end)
+    raise ValueError(f"Invalid slice format: {index_arg}")
+
+
+def parse_index(index_arg):
+    """
+    Parse an index argument into a usable index or slice.
+
+    Args:
+        index_arg: Either an int or a string like "1:2" or "1:" or ":2"
+
+    Returns:
+        int or slice object
+
+    Raises:
+        ValueError: If a string is not in slice format
+        TypeError: If index_arg is neither int nor string
+    """
+    if isinstance(index_arg, int):
+        return index_arg
+    elif isinstance(index_arg, str):
+        return _parse_slice(index_arg)
+    else:
+        raise TypeError(f"Index must be int or string, got {type(index_arg)}")
+
+
+class MathTexIndex:
+    """
+    Bounded LRU index of typeset MathTex objects and their extracted parts.
+
+    Each tex string is typeset once (through the shared label cache) and kept as a
+    template; every (tex string, indices) lookup is resolved on the template once
+    and memoized. get() hands out copies, so callers may move and recolor them.
+
+    Example:
+        >>> from robo_manim_add_ons.text_utils import MathTexIndex
+        >>>
+        >>> index = MathTexIndex()
+        >>> xsq = index.get("x^2 + y^2", 0, "0:2")   # typesets, resolves eq[0][0:2]
+        >>> xsq2 = index.get("x^2 + y^2", 0, "0:2")  # copy of the memoized part
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the index.
+
+        Args:
+            maxsize: Maximum number of tex strings to keep (default 128)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _entry(self, tex_string: str) -> tuple:
+        """(template, parts) for a tex string, typesetting it on first use."""
+        entry = self._entries.get(tex_string)
+        if entry is None:
+            entry = (cached_tex(tex_string), {})
+            self._entries[tex_string] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(tex_string)
+        return entry
+
+    def template(self, tex_string: str):
+        """
+        The cached MathTex for a string (not copied; do not modify).
+
+        Args:
+            tex_string: LaTeX string
+
+        Returns:
+            The template MathTex
+        """
+        return self._entry(tex_string)[0]
+
+    def part(self, tex_string: str, *indices):
+        """
+        Resolve chained indices on the template (not copied; do not modify).
+
+        Args:
+            tex_string: LaTeX string
+            *indices: One or more indices (int or string slices) to chain
+
+        Returns:
+            The template's part
+
+        Raises:
+            IndexError, TypeError, ValueError, KeyError: If the indices are invalid
+        """
+        template, parts = self._entry(tex_string)
+        key = tuple(indices)
+        try:
+            result = parts[key]
+            self.hits += 1
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            key = None  # unhashable index, resolve without memoizing
+
+        self.misses += 1
+        result = template
+        for index_arg in indices:
+            result = result[parse_index(index_arg)]
+        if key is not None:
+            parts[key] = result
+        return result
+
+    def get(self, tex_string: str, *indices):
+        """
+        Copy of the whole MathTex, or of the part selected by chained indices.
+
+        Args:
+            tex_string: LaTeX string
+            *indices: Zero or more indices (int or string slices) to chain
+
+        Returns:
+            Independent copy
+
+        Raises:
+            IndexError, TypeError, ValueError, KeyError: If the indices are invalid
+        """
+        return self.part(tex_string, *indices).copy()
+
+    def info(self) -> dict:
+        """
+        Get index statistics.
+
+        Returns:
+            dict with 'hits', 'misses' (part lookups), 'size' and 'maxsize' (tex strings)
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop all templates and parts and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# ============================================================================
+# Index overlay (textdg)
+# ============================================================================
+
+_GLYPH_CHARS = "0123456789,"
+_INDEX_COLORS = [RED, TEAL, GREEN, BLUE, PURPLE]
+
+
+@lru_cache(maxsize=1)
+def _glyph_atlas() -> tuple:
+    """
+    Render the index glyphs once with a single Text.
+
+    Returns:
+        Tuple (glyphs, gap): glyphs maps each char to (points, width) with points
+        shifted so the glyph's left edge is at x = 0 (baseline kept); gap is the
+        spacing Pango puts between consecutive glyphs.
+    """
+    atlas = Text(_GLYPH_CHARS)
+    glyphs = {}
+    lefts, rights = [], []
+    for char, glyph in zip(_GLYPH_CHARS, atlas.submobjects):
+        points = np.concatenate([np.asarray(m.points, dtype=float) for m in glyph.get_family() if len(m.points)])
+        left, right = points[:, 0].min(), points[:, 0].max()
+        points = points - np.array([left, 0, 0])
+        points.setflags(write=False)
+        glyphs[char] = (points, right - left)
+        lefts.append(left)
+        rights.append(right)
+    gap = float(np.median(np.array(lefts[1:]) - np.array(rights[:-1])))
+    return glyphs, max(gap, 0.0)
+
+
+def _label_points(label: str) -> np.ndarray:
+    """Points of a label like "3,12" laid out from the glyph atlas."""
+    glyphs, gap = _glyph_atlas()
+    pieces = []
+    cursor = 0.0
+    for char in label:
+        points, width = glyphs[char]
+        pieces.append(points + np.array([cursor, 0, 0]))
+        cursor += width + gap
+    return np.concatenate(pieces)
+
+
+def _index_parts(tex) -> list:
+    """(word_index, char_index, subtex) for every glyph of a MathTex."""
+    return [(j, i, subtex) for j, word in enumerate(tex) for i, subtex in enumerate(word)]
+
+
+def index_overlay(tex, lscale: float = 0.3, buff: float = 0.05, colors=None) -> VGroup:
+    """
+    Index labels (word_index, char_index) below every glyph of a MathTex.
+
+    Labels are composed from a pre-rendered digit/comma atlas; all labels sharing
+    a color are subpaths of one VMobject, so the overlay has one VMobject per color.
+    Label k gets colors[k % len(colors)].
+
+    Args:
+        tex: MathTex object
+        lscale: Scale factor for the labels, as for Text(...).scale() (default 0.3)
+        buff: Buffer between glyph and label (default 0.05)
+        colors: Label colors, cycled (default RED, TEAL, GREEN, BLUE, PURPLE)
+
+    Returns:
+        VGroup of one VMobject per color
+
+    Example:
+        >>> from robo_manim_add_ons import index_overlay
+        >>>
+        >>> eq = MathTex(r"\\sin(x) = \\frac{a}{b}").scale(2)
+        >>> self.add(eq, index_overlay(eq))
+    """
+    colors = colors or _INDEX_COLORS
+    buckets = [[] for _ in colors]
+    for k, (j, i, subtex) in enumerate(_index_parts(tex)):
+        points = _label_points(f"{j},{i}") * lscale
+        low, high = points.min(axis=0), points.max(axis=0)
+        target = np.array([subtex.get_center()[0], subtex.get_bottom()[1] - buff, 0])
+        points = points + (target - np.array([(low[0] + high[0]) / 2, high[1], 0]))
+        buckets[k % len(colors)].append(points)
+
+    overlay = VGroup()
+    for color, bucket in zip(colors, buckets):
+        if bucket:
+            mob = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            mob.set_points(np.concatenate(bucket))
+            overlay.add(mob)
+    return overlay
+
+
+def index_map(tex, as_json: bool = False, path: str = None):
+    """
+    Index map of a MathTex without rendering any labels.
+
+    Args:
+        tex: MathTex object or LaTeX string (typeset once through the shared index)
+        as_json: Return a JSON string instead of a list (default False)
+        path: Optional file to write the JSON to
+
+    Returns:
+        List of dicts with 'word', 'char', 'center', 'width' and 'height' per glyph
+        (in the MathTex's current coordinates), or its JSON string
+
+    Example:
+        >>> from robo_manim_add_ons import index_map
+        >>>
+        >>> index_map(r"x^2 + y^2")[:2]
+        [{'word': 0, 'char': 0, 'center': [...], ...}, {'word': 0, 'char': 1, ...}]
+        >>> index_map(derivation, path="derivation_indices.json")
+    """
+    if isinstance(tex, str):
+        tex = tex_index.template(tex)
+    entries = [
+        {
+            'word': j,
+            'char': i,
+            'center': [round(float(c), 4) for c in subtex.get_center()],
+            'width': round(float(subtex.width), 4),
+            'height': round(float(subtex.height), 4),
+        }
+        for j, i, subtex in _index_parts(tex)
+    ]
+    if path is not None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+    return json.dumps(entries) if as_json else entries
+
+
+# Package-wide index shared by TextUtils and RogebraScene
+tex_index = MathTexIndex()
+
+
+def tex_part(tex_string: str, *indices):
+    """
+    Copy of a MathTex part through the shared index.
+
+    Args:
+        tex_string: LaTeX string
+        *indices: Zero or more indices (int or "1:2" string slices) to chain
+
+    Returns:
+        Independent copy of the part
+
+    Raises:
+        IndexError, TypeError, ValueError, KeyError: If the indices are invalid
+
+    Example:
+        >>> from robo_manim_add_ons import tex_part
+        >>>
+        >>> y_squared = tex_part("x^2 + y^2", 0, "3:5")
+    """
+    return tex_index.get(tex_string, *indices)
 
 
 class TextUtils:
@@ -29,19 +352,7 @@ class TextUtils:
             >>> TextUtils._parse_index("2:")
             slice(2, None, None)
         """
-        if isinstance(index_arg, int):
-            return index_arg
-        elif isinstance(index_arg, str):
-            # Parse slice notation "1:2" or "1:" or ":2"
-            parts = index_arg.split(':')
-            if len(parts) == 2:
-                start = int(parts[0]) if parts[0] else None
-                end = int(parts[1]) if parts[1] else None
-                return slice(start, end)
-            else:
-                raise ValueError(f"Invalid slice format: {index_arg}")
-        else:
-            raise TypeError(f"Index must be int or string, got {type(index_arg)}")
+        return parse_index(index_arg)
 
     @staticmethod
     def _extract_part(mathtext_obj, *indices):
@@ -105,18 +416,23 @@ class TextUtils:
             >>> part4 = TextUtils.text(self, "x^2 + y", "1:3")  # eq[1:3]
             >>> part5 = TextUtils.text(self, existing_eq, 0, "1:4")  # existing_eq[0][1:4]
         """
-        # Create MathTex if string is provided
+        # Strings go through the shared index: typeset once, parts memoized.
+        # Typesetting errors propagate; only index errors are caught.
         if isinstance(mathtext, str):
-            mathtext_obj = MathTex(mathtext)
-        else:
-            mathtext_obj = mathtext
+            tex_index.template(mathtext)
+            try:
+                part = tex_index.part(mathtext, *args)
+            except (IndexError, TypeError, ValueError, KeyError) as e:
+                print(f"Warning: Invalid index for MathTex extraction: {e}")
+                return VMobject()
+            return part.copy()
 
         # If no indices provided, return the whole MathTex object
         if len(args) == 0:
-            return mathtext_obj
+            return mathtext
 
         # Extract part using indices
-        return TextUtils._extract_part(mathtext_obj, *args)
+        return TextUtils._extract_part(mathtext, *args)
 
     @staticmethod
     def text2(scene, mathtext, *args):
@@ -2,25 +2,174 @@
 Transform utilities for Manim objects.
 
 Provides helper functions for creating transformed copies of Manim objects
-using translations, rotations, and scaling operations.
+using translations, rotations, and scaling operations. With lazy=True the
+helpers return a TransformedView that accumulates a 3x3 affine matrix, so a
+chain of transforms costs one copy and one matrix multiply when materialized.
+transform_many() makes K copies from a stack of K matrices in one einsum.
 """
 
+import copy
+import types
+from enum import Enum
 import numpy as np
-from manim import Mobject, Dot
+from manim import Mobject, VMobject, VGroup, Dot, ManimColor
 from typing import Union
 
 
-def translated(obj: Mobject, dx: float, dy: float) -> Mobject:
+# Point-transform methods whose Mobject/VMobject versions the fast path reproduces
+_TRANSFORM_METHODS = ('shift', 'rotate', 'scale', 'apply_points_function_about_point')
+_PLAIN_TRANSFORMS = {}
+
+
+def _plain_transforms(cls) -> bool:
+    """Whether cls uses the stock Mobject/VMobject transform methods (cached per class)."""
+    plain = _PLAIN_TRANSFORMS.get(cls)
+    if plain is None:
+        plain = all(getattr(cls, name, None) in (getattr(Mobject, name), getattr(VMobject, name))
+                    for name in _TRANSFORM_METHODS)
+        _PLAIN_TRANSFORMS[cls] = plain
+    return plain
+
+
+def _about_point(about, view: 'TransformedView') -> np.ndarray:
+    """Resolve the about argument (Dot, numpy array, or None for the view's center)."""
+    if about is None:
+        return view.get_center()
+    elif isinstance(about, Dot):
+        return about.get_center()
+    else:
+        return np.array(about)
+
+
+def _around(matrix: np.ndarray, point: np.ndarray) -> np.ndarray:
+    """Conjugate a 3x3 affine matrix so it acts around the given point."""
+    to_point = np.array([[1, 0, point[0]], [0, 1, point[1]], [0, 0, 1]], dtype=float)
+    from_point = np.array([[1, 0, -point[0]], [0, 1, -point[1]], [0, 0, 1]], dtype=float)
+    return to_point @ matrix @ from_point
+
+
+class TransformedView:
+    """
+    A lazily transformed copy of a mobject.
+
+    Holds the source mobject and an accumulated 2D affine matrix (3x3, homogeneous).
+    Composing more transforms only multiplies matrices; materialize() makes one copy
+    of the source and transforms its points once. Pass a view to translated(),
+    rotated() or scaled() without lazy=True to get the final Mobject.
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import translated, rotated, scaled
+        >>>
+        >>> view = scaled(translated(square, 2, 0, lazy=True), 0.5, lazy=True)
+        >>> tile = rotated(view, 60)   # one copy, one point transform
+    """
+
+    def __init__(self, source: Mobject, matrix: np.ndarray = None, ops: tuple = ()):
+        """
+        Initialize a view.
+
+        Args:
+            source: The Mobject being transformed (never modified)
+            matrix: Accumulated 3x3 affine matrix (default None, identity)
+            ops: Recorded (name, *args) operations, replayed for mobjects with custom scaling
+        """
+        self.source = source
+        self.matrix = np.eye(3) if matrix is None else matrix
+        self.ops = ops
+        self._mobject = None
+
+    def _compose(self, matrix: np.ndarray, op: tuple) -> 'TransformedView':
+        return TransformedView(self.source, matrix @ self.matrix, self.ops + (op,))
+
+    def _transform_points(self, points: np.ndarray) -> np.ndarray:
+        result = points.copy()
+        result[:, :2] = points[:, :2] @ self.matrix[:2, :2].T + self.matrix[:2, 2]
+        return result
+
+    def get_center(self) -> np.ndarray:
+        """Bounding box center of the transformed object, computed without copying it."""
+        points = self.source.get_all_points()
+        if len(points) == 0:
+            return self._transform_points(self.source.get_center()[None, :])[0]
+        transformed = self._transform_points(points)
+        return (transformed.min(axis=0) + transformed.max(axis=0)) / 2
+
+    def translated(self, dx: float, dy: float) -> 'TransformedView':
+        """Compose a translation by dx and dy."""
+        matrix = np.array([[1, 0, dx], [0, 1, dy], [0, 0, 1]], dtype=float)
+        return self._compose(matrix, ('shift', np.array([dx, dy, 0.0])))
+
+    def rotated(self, angle_in_degrees: float, about=None) -> 'TransformedView':
+        """Compose a rotation around about (default: the current center)."""
+        angle = angle_in_degrees * np.pi / 180
+        point = _about_point(about, self)
+        c, s = np.cos(angle), np.sin(angle)
+        rotation = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]], dtype=float)
+        return self._compose(_around(rotation, point), ('rotate', angle, point))
+
+    def scaled(self, scale_factor: float, about=None) -> 'TransformedView':
+        """Compose a scaling around about (default: the current center)."""
+        point = _about_point(about, self)
+        scaling = np.diag([scale_factor, scale_factor, 1.0])
+        return self._compose(_around(scaling, point), ('scale', scale_factor, point))
+
+    def materialize(self) -> Mobject:
+        """
+        Build the transformed copy (once; later calls return the same Mobject).
+
+        Returns:
+            A copy of the source with the accumulated transform applied
+        """
+        if self._mobject is not None:
+            return self._mobject
+
+        new_obj = self.source.copy()
+        family = new_obj.get_family()
+        if all(_plain_transforms(type(mob)) for mob in family):
+            for mob in family:
+                if len(mob.points) > 0:
+                    mob.points = self._transform_points(mob.points)
+            # VMobject.rotate also turns the sheen direction
+            angle = sum(args[0] for name, *args in self.ops if name == 'rotate')
+            if angle and isinstance(new_obj, VMobject):
+                new_obj.rotate_sheen_direction(angle)
+        else:
+            # Classes with their own shift/rotate/scale (e.g. Arrow) need the real calls
+            for name, *args in self.ops:
+                if name == 'shift':
+                    new_obj.shift(args[0])
+                elif name == 'rotate':
+                    new_obj.rotate(args[0], about_point=args[1])
+                else:
+                    new_obj.scale(args[0], about_point=args[1])
+        self._mobject = new_obj
+        return new_obj
+
+    @property
+    def mobject(self) -> Mobject:
+        """The materialized Mobject."""
+        return self.materialize()
+
+    def __getattr__(self, name):
+        # Any other attribute access counts as first use of the mobject
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+
+def translated(obj: Mobject, dx: float, dy: float, lazy: bool = False) -> Mobject:
     """
     Create a copy of an object translated by dx and dy.
 
     Args:
-        obj: The Mobject to copy and translate
+        obj: The Mobject (or TransformedView) to copy and translate
         dx: The horizontal displacement
         dy: The vertical displacement
+        lazy: Return a TransformedView instead of copying now (default False)
 
     Returns:
-        A new Mobject that is a translated copy of the input
+        A new Mobject that is a translated copy of the input (TransformedView if lazy)
 
     Example:
         >>> from manim import *
@@ -30,22 +179,29 @@ def translated(obj: Mobject, dx: float, dy: float) -> Mobject:
         >>> shifted_square = translated(square, 2, 1)
         >>> # Creates a copy of square shifted right 2 units and up 1 unit
     """
+    if lazy or isinstance(obj, TransformedView):
+        view = obj if isinstance(obj, TransformedView) else TransformedView(obj)
+        view = view.translated(dx, dy)
+        return view if lazy else view.materialize()
+
     new_obj = obj.copy()
     new_obj.shift(dx * np.array([1, 0, 0]) + dy * np.array([0, 1, 0]))
     return new_obj
 
 
-def rotated(obj: Mobject, angle_in_degrees: float, about: Union[Dot, np.ndarray, None] = None) -> Mobject:
+def rotated(obj: Mobject, angle_in_degrees: float, about: Union[Dot, np.ndarray, None] = None,
+            lazy: bool = False) -> Mobject:
     """
     Create a copy of an object rotated by a given angle.
 
     Args:
-        obj: The Mobject to copy and rotate
+        obj: The Mobject (or TransformedView) to copy and rotate
         angle_in_degrees: The rotation angle in degrees
         about: The point to rotate around (Dot, numpy array, or None for object's center)
+        lazy: Return a TransformedView instead of copying now (default False)
 
     Returns:
-        A new Mobject that is a rotated copy of the input
+        A new Mobject that is a rotated copy of the input (TransformedView if lazy)
 
     Example:
         >>> from manim import *
@@ -55,6 +211,11 @@ def rotated(obj: Mobject, angle_in_degrees: float, about: Union[Dot, np.ndarray,
         >>> rotated_line = rotated(line, 90)  # Rotate 90 degrees around center
         >>> rotated_around_point = rotated(line, 45, Dot(UP))  # Rotate around a point
     """
+    if lazy or isinstance(obj, TransformedView):
+        view = obj if isinstance(obj, TransformedView) else TransformedView(obj)
+        view = view.rotated(angle_in_degrees, about)
+        return view if lazy else view.materialize()
+
     new_obj = obj.copy()
 
     # Convert degrees to radians
@@ -72,17 +233,19 @@ def rotated(obj: Mobject, angle_in_degrees: float, about: Union[Dot, np.ndarray,
     return new_obj
 
 
-def scaled(obj: Mobject, scale_factor: float, about: Union[Dot, np.ndarray, None] = None) -> Mobject:
+def scaled(obj: Mobject, scale_factor: float, about: Union[Dot, np.ndarray, None] = None,
+           lazy: bool = False) -> Mobject:
     """
     Create a copy of an object scaled by a given factor.
 
     Args:
-        obj: The Mobject to copy and scale
+        obj: The Mobject (or TransformedView) to copy and scale
         scale_factor: The scaling factor (e.g., 2 doubles the size, 0.5 halves it)
         about: The point to scale around (Dot, numpy array, or None for object's center)
+        lazy: Return a TransformedView instead of copying now (default False)
 
     Returns:
-        A new Mobject that is a scaled copy of the input
+        A new Mobject that is a scaled copy of the input (TransformedView if lazy)
 
     Example:
         >>> from manim import *
@@ -92,6 +255,11 @@ def scaled(obj: Mobject, scale_factor: float, about: Union[Dot, np.ndarray, None
         >>> big_circle = scaled(circle, 2)  # Double the size
         >>> small_circle = scaled(circle, 0.5, Dot(UP))  # Scale to half size around a point
     """
+    if lazy or isinstance(obj, TransformedView):
+        view = obj if isinstance(obj, TransformedView) else TransformedView(obj)
+        view = view.scaled(scale_factor, about)
+        return view if lazy else view.materialize()
+
     new_obj = obj.copy()
 
     # Determine scaling point
@@ -104,3 +272,203 @@ def scaled(obj: Mobject, scale_factor: float, about: Union[Dot, np.ndarray, None
 
     new_obj.scale(scale_factor, about_point=about_point)
     return new_obj
+
+
+def rotation_matrices(angles_in_degrees, about: Union[Dot, np.ndarray, None] = None) -> np.ndarray:
+    """
+    Stack of 3x3 affine rotation matrices for transform_many().
+
+    Args:
+        angles_in_degrees: Sequence of K rotation angles in degrees
+        about: The point to rotate around (Dot, numpy array, or None for the origin)
+
+    Returns:
+        Array of shape (K, 3, 3)
+
+    Example:
+        >>> from robo_manim_add_ons import rotation_matrices
+        >>>
+        >>> matrices = rotation_matrices(np.arange(6) * 60)  # 6-fold symmetry
+    """
+    angles = np.asarray(angles_in_degrees, dtype=float) * np.pi / 180
+    point = np.zeros(3) if about is None else (about.get_center() if isinstance(about, Dot) else np.array(about))
+
+    matrices = np.zeros((angles.size, 3, 3))
+    c, s = np.cos(angles), np.sin(angles)
+    matrices[:, 0, 0], matrices[:, 0, 1] = c, -s
+    matrices[:, 1, 0], matrices[:, 1, 1] = s, c
+    # Rotation about point p: x -> R(x - p) + p
+    matrices[:, 0, 2] = point[0] - (c * point[0] - s * point[1])
+    matrices[:, 1, 2] = point[1] - (s * point[0] + c * point[1])
+    matrices[:, 2, 2] = 1
+    return matrices
+
+
+def translation_matrices(offsets) -> np.ndarray:
+    """
+    Stack of 3x3 affine translation matrices for transform_many().
+
+    Args:
+        offsets: Sequence of K (dx, dy) or (dx, dy, dz) offsets (z is ignored)
+
+    Returns:
+        Array of shape (K, 3, 3)
+
+    Example:
+        >>> from robo_manim_add_ons import translation_matrices
+        >>>
+        >>> grid = [(i, j) for i in range(5) for j in range(3)]
+        >>> matrices = translation_matrices(grid)
+    """
+    offsets = np.atleast_2d(np.asarray(offsets, dtype=float))
+    matrices = np.tile(np.eye(3), (len(offsets), 1, 1))
+    matrices[:, 0, 2] = offsets[:, 0]
+    matrices[:, 1, 2] = offsets[:, 1]
+    return matrices
+
+
+# Attribute values _clone may share between original and copy (immutable or code)
+_SHARED_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum, np.generic, ManimColor,
+                 types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+def _clonable(obj: Mobject) -> bool:
+    """
+    Whether _clone can copy obj's family as faithfully as deepcopy.
+
+    Attributes may hold shared immutable values, ndarrays, mobjects, and
+    lists/tuples/dicts of shared values and mobjects. Anything else (other
+    objects, nested containers or arrays) needs copy().
+    """
+    def item_ok(value):
+        return isinstance(value, (_SHARED_TYPES, Mobject))
+
+    for mob in obj.get_family():
+        for value in mob.__dict__.values():
+            if item_ok(value) or isinstance(value, np.ndarray):
+                continue
+            if isinstance(value, (list, tuple)) and all(item_ok(item) for item in value):
+                continue
+            if isinstance(value, dict) and all(isinstance(k, _SHARED_TYPES) and item_ok(v) for k, v in value.items()):
+                continue
+            return False
+    return True
+
+
+def _clone(mob: Mobject, points_by_id: dict, memo: dict = None) -> Mobject:
+    """
+    Copy a mobject family without deepcopy (only for families passing _clonable).
+
+    Arrays are copied, lists and dicts are copied one level deep and shared
+    immutable values are kept. A submobject that appears several times in the
+    family is cloned once, and references to family members (e.g. Arrow.tip,
+    VDict.submob_dict) are rewritten to the matching clone through an
+    id(original) -> clone memo, as deepcopy does. Mobjects referenced from
+    outside the family (e.g. Square.grid_lines) are deep-copied with that memo.
+    """
+    top = memo is None
+    if top:
+        memo = {}
+    clone = copy.copy(mob)
+    memo[id(mob)] = clone
+    points = points_by_id.get(id(mob))
+    for name, value in mob.__dict__.items():
+        if name == 'points' and points is not None:
+            clone.points = points
+        elif isinstance(value, np.ndarray):
+            setattr(clone, name, value.copy())
+        elif isinstance(value, (list, dict)):
+            setattr(clone, name, value.copy())
+    clone.original_id = str(id(mob))
+    clone.submobjects = [memo[id(sub)] if id(sub) in memo else _clone(sub, points_by_id, memo)
+                         for sub in mob.submobjects]
+    if top:
+        for member in list(memo.values()):
+            _remap_members(member, memo)
+    return clone
+
+
+def _remap_members(clone: Mobject, memo: dict) -> None:
+    """Point attributes that reference original family members at their clones."""
+    def remap(value):
+        if not isinstance(value, Mobject):
+            return value
+        if id(value) not in memo:
+            copy.deepcopy(value, memo)
+        return memo[id(value)]
+
+    for name, value in clone.__dict__.items():
+        if name == 'submobjects':
+            continue
+        if isinstance(value, Mobject):
+            setattr(clone, name, remap(value))
+        elif isinstance(value, (list, tuple)) and any(isinstance(v, Mobject) for v in value):
+            setattr(clone, name, type(value)(remap(v) for v in value))
+        elif isinstance(value, dict) and any(isinstance(v, Mobject) for v in value.values()):
+            setattr(clone, name, {k: remap(v) for k, v in value.items()})
+
+
+def transform_many(obj: Mobject, matrices) -> VGroup:
+    """
+    Create K transformed copies of an object, one per affine matrix.
+
+    The points of the whole family are concatenated and transformed by all
+    matrices in a single einsum; the copies are then assembled without a
+    deepcopy per copy (families with attributes that need a real deepcopy fall
+    back to copy()). Faster than calling rotated()/translated() in a loop for
+    tilings, kaleidoscopes and rotational-symmetry patterns.
+
+    Args:
+        obj: The Mobject to copy (never modified)
+        matrices: Array of shape (K, 3, 3) of 2D affine matrices (homogeneous),
+                  e.g. from rotation_matrices() or translation_matrices()
+
+    Returns:
+        VGroup of K transformed copies, in matrix order
+
+    Raises:
+        ValueError: If matrices does not have shape (K, 3, 3)
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import transform_many, rotation_matrices
+        >>>
+        >>> petal = Ellipse(width=2, height=0.6).shift(RIGHT)
+        >>> flower = transform_many(petal, rotation_matrices(np.arange(12) * 30))
+        >>>
+        >>> # Attributes pointing into the family (Arrow.tip) follow the copy
+        >>> a = Arrow(LEFT, RIGHT, buff=0)
+        >>> clone = transform_many(a, translation_matrices([(0, 4)]))[0]
+        >>> clone.tip is a.tip, clone.has_tip(), clone.get_end()
+        (False, True, array([1., 4., 0.]))
+        >>> arrows = VGroup(a, Arrow(UP, DOWN, buff=0))
+        >>> moved = transform_many(arrows, translation_matrices([(1, 0), (2, 0)]))
+        >>> all(c.tip in c.submobjects for copy_ in moved for c in copy_)
+        True
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    if matrices.ndim != 3 or matrices.shape[1:] != (3, 3):
+        raise ValueError(f"matrices must have shape (K, 3, 3), got {matrices.shape}")
+
+    family = [mob for mob in obj.get_family() if len(mob.points) > 0]
+    sizes = [len(mob.points) for mob in family]
+    copies = []
+    if family:
+        points = np.concatenate([mob.points for mob in family])
+        moved = np.repeat(points[None, :, :], len(matrices), axis=0)
+        moved[:, :, :2] = np.einsum('kij,nj->kni', matrices[:, :2, :2], points[:, :2]) + matrices[:, None, :2, 2]
+        bounds = np.cumsum([0] + sizes)
+        clonable = _clonable(obj)
+        for k in range(len(matrices)):
+            if clonable:
+                points_by_id = {id(mob): moved[k, bounds[i]:bounds[i + 1]] for i, mob in enumerate(family)}
+                copies.append(_clone(obj, points_by_id))
+            else:
+                # Attributes _clone cannot reproduce: deepcopy, then write the points
+                new_obj = obj.copy()
+                for i, mob in enumerate(m for m in new_obj.get_family() if len(m.points) > 0):
+                    mob.points = moved[k, bounds[i]:bounds[i + 1]]
+                copies.append(new_obj)
+    else:
+        copies = [obj.copy() for _ in range(len(matrices))]
+    return VGroup(*copies)
@@ -8,21 +8,11 @@ orthocenter, incenter) and altitude lines.
 import numpy as np
 from manim import Line, Dot
 from typing import Union
+from .coerce_utils import to_position
+from .value_types import point_result
 
 
-def _extract_position(obj):
-    """Extract position from Dot/object or np.array."""
-    if hasattr(obj, 'get_center'):
-        return obj.get_center()
-    elif isinstance(obj, np.ndarray):
-        return obj
-    elif isinstance(obj, (list, tuple)):
-        return np.array(obj if len(obj) == 3 else list(obj) + [0])
-    else:
-        raise TypeError(f"Expected Dot, np.array, or list, got {type(obj).__name__}")
-
-
-def centroid(A, B, C) -> Dot:
+def centroid(A, B, C, as_value: bool = False) -> Dot:
     """
     Calculate the centroid of a triangle.
 
@@ -32,6 +22,7 @@ def centroid(A, B, C) -> Dot:
         A: First vertex (Dot, np.array, or list)
         B: Second vertex (Dot, np.array, or list)
         C: Third vertex (Dot, np.array, or list)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the centroid position
@@ -41,15 +32,15 @@ def centroid(A, B, C) -> Dot:
         >>>
         >>> G = centroid([0, 0, 0], [3, 0, 0], [1.5, 2, 0])
     """
-    a = _extract_position(A)
-    b = _extract_position(B)
-    c = _extract_position(C)
+    a = to_position(A)
+    b = to_position(B)
+    c = to_position(C)
 
     center = (a + b + c) / 3
-    return Dot(center)
+    return point_result(center, as_value)
 
 
-def circumcenter(A, B, C) -> Dot:
+def circumcenter(A, B, C, as_value: bool = False) -> Dot:
     """
     Calculate the circumcenter of a triangle.
 
@@ -60,6 +51,7 @@ def circumcenter(A, B, C) -> Dot:
         A: First vertex (Dot, np.array, or list)
         B: Second vertex (Dot, np.array, or list)
         C: Third vertex (Dot, np.array, or list)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the circumcenter position
@@ -69,9 +61,9 @@ def circumcenter(A, B, C) -> Dot:
         >>>
         >>> O = circumcenter([0, 0, 0], [4, 0, 0], [2, 3, 0])
     """
-    a = _extract_position(A)
-    b = _extract_position(B)
-    c = _extract_position(C)
+    a = to_position(A)
+    b = to_position(B)
+    c = to_position(C)
 
     # Midpoints of AB and BC
     mid_AB = (a + b) / 2
@@ -98,13 +90,13 @@ def circumcenter(A, B, C) -> Dot:
     try:
         t, _ = np.linalg.solve(mat, rhs)
         center = mid_AB + t * perp_AB
-        return Dot(center)
+        return point_result(center, as_value)
     except np.linalg.LinAlgError:
         # Degenerate triangle (collinear points), return centroid as fallback
-        return centroid(A, B, C)
+        return centroid(A, B, C, as_value)
 
 
-def orthocenter(A, B, C) -> Dot:
+def orthocenter(A, B, C, as_value: bool = False) -> Dot:
     """
     Calculate the orthocenter of a triangle.
 
@@ -114,6 +106,7 @@ def orthocenter(A, B, C) -> Dot:
         A: First vertex (Dot, np.array, or list)
         B: Second vertex (Dot, np.array, or list)
         C: Third vertex (Dot, np.array, or list)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the orthocenter position
@@ -123,9 +116,9 @@ def orthocenter(A, B, C) -> Dot:
         >>>
         >>> H = orthocenter([0, 0, 0], [4, 0, 0], [2, 3, 0])
     """
-    a = _extract_position(A)
-    b = _extract_position(B)
-    c = _extract_position(C)
+    a = to_position(A)
+    b = to_position(B)
+    c = to_position(C)
 
     # Altitude from A perpendicular to BC
     BC = c - b
@@ -150,13 +143,13 @@ def orthocenter(A, B, C) -> Dot:
     try:
         t, _ = np.linalg.solve(mat, rhs)
         center = a + t * perp_BC
-        return Dot(center)
+        return point_result(center, as_value)
     except np.linalg.LinAlgError:
         # Degenerate triangle, return centroid as fallback
-        return centroid(A, B, C)
+        return centroid(A, B, C, as_value)
 
 
-def incenter(A, B, C) -> Dot:
+def incenter(A, B, C, as_value: bool = False) -> Dot:
     """
     Calculate the incenter of a triangle.
 
@@ -167,6 +160,7 @@ def incenter(A, B, C) -> Dot:
         A: First vertex (Dot, np.array, or list)
         B: Second vertex (Dot, np.array, or list)
         C: Third vertex (Dot, np.array, or list)
+        as_value: Return a P2 value instead of a Dot (default False)
 
     Returns:
         Dot at the incenter position
@@ -176,9 +170,9 @@ def incenter(A, B, C) -> Dot:
         >>>
         >>> I = incenter([0, 0, 0], [4, 0, 0], [2, 3, 0])
     """
-    a = _extract_position(A)
-    b = _extract_position(B)
-    c = _extract_position(C)
+    a = to_position(A)
+    b = to_position(B)
+    c = to_position(C)
 
     # Side lengths
     len_a = np.linalg.norm(c - b)  # opposite to A
@@ -188,10 +182,10 @@ def incenter(A, B, C) -> Dot:
     # Incenter formula: weighted average by opposite side lengths
     total = len_a + len_b + len_c
     if total == 0:
-        return centroid(A, B, C)
+        return centroid(A, B, C, as_value)
 
     center = (len_a * a + len_b * b + len_c * c) / total
-    return Dot(center)
+    return point_result(center, as_value)
 
 
 def altitude(vertex, *args) -> Line:
@@ -218,7 +212,7 @@ def altitude(vertex, *args) -> Line:
         >>> # With two points
         >>> alt = altitude([0, 0, 0], [3, 0, 0], [1, 2, 0])
     """
-    v = _extract_position(vertex)
+    v = to_position(vertex)
 
     if len(args) == 1:
         # Single argument: Line object
@@ -227,8 +221,8 @@ def altitude(vertex, *args) -> Line:
         line_end = opposite_side.get_end()
     elif len(args) == 2:
         # Two arguments: two points
-        line_start = _extract_position(args[0])
-        line_end = _extract_position(args[1])
+        line_start = to_position(args[0])
+        line_end = to_position(args[1])
     else:
         raise ValueError("altitude() takes 2 or 3 arguments: (vertex, line) or (vertex, p1, p2)")
 
@@ -248,3 +242,146 @@ def altitude(vertex, *args) -> Line:
     foot = line_start + t * line_vec
 
     return Line(v, foot)
+
+
+# ============================================================================
+# Batch versions on (N, 3, 3) vertex arrays
+# ============================================================================
+
+def _as_triangles(triangles) -> np.ndarray:
+    """Validate an (N, 3, 2) or (N, 3, 3) vertex array and return it as (N, 3, 3) floats."""
+    tris = np.asarray(triangles, dtype=float)
+    if tris.ndim != 3 or tris.shape[1] != 3 or tris.shape[2] not in (2, 3):
+        raise ValueError(f"Expected an (N, 3, 3) vertex array, got shape {tris.shape}")
+    if tris.shape[2] == 2:
+        tris = np.concatenate([tris, np.zeros(tris.shape[:2] + (1,))], axis=2)
+    return tris
+
+
+def _degenerate_mask(tris: np.ndarray, tolerance: float) -> tuple:
+    """Twice the signed area of each triangle and a mask of (near) collinear ones."""
+    ab = tris[:, 1] - tris[:, 0]
+    ac = tris[:, 2] - tris[:, 0]
+    cross = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+    scale = np.einsum('ij,ij->i', ab, ab) + np.einsum('ij,ij->i', ac, ac)
+    return cross, np.abs(cross) <= tolerance * scale
+
+
+def centroid_many(triangles) -> np.ndarray:
+    """
+    Calculate the centroids of many triangles at once.
+
+    Args:
+        triangles: Array (N, 3, 3) of triangle vertices (N, 3, 2 is padded with z = 0)
+
+    Returns:
+        Array (N, 3) of centroids
+
+    Example:
+        >>> from robo_manim_add_ons import centroid_many
+        >>>
+        >>> tris = np.random.rand(1000, 3, 3)
+        >>> G = centroid_many(tris)
+    """
+    return _as_triangles(triangles).mean(axis=1)
+
+
+def circumcenter_many(triangles, tolerance: float = 1e-12) -> tuple:
+    """
+    Calculate the circumcenters of many triangles with the closed-form formula.
+
+    Args:
+        triangles: Array (N, 3, 3) of triangle vertices (N, 3, 2 is padded with z = 0)
+        tolerance: Relative area tolerance below which a triangle counts as degenerate (default 1e-12)
+
+    Returns:
+        Tuple (centers, degenerate):
+            centers: Array (N, 3) of circumcenters; degenerate rows hold the centroid
+            degenerate: Boolean array (N,), True for collinear vertices
+
+    Example:
+        >>> from robo_manim_add_ons import circumcenter_many
+        >>>
+        >>> O, degenerate = circumcenter_many(tris)
+        >>> O = O[~degenerate]
+    """
+    tris = _as_triangles(triangles)
+    a = tris[:, 0]
+    ab = tris[:, 1] - a
+    ac = tris[:, 2] - a
+    cross, degenerate = _degenerate_mask(tris, tolerance)
+
+    ab_sq = ab[:, 0] ** 2 + ab[:, 1] ** 2
+    ac_sq = ac[:, 0] ** 2 + ac[:, 1] ** 2
+    d = 2 * np.where(degenerate, 1, cross)
+
+    centers = np.empty_like(a)
+    centers[:, 0] = a[:, 0] + (ac[:, 1] * ab_sq - ab[:, 1] * ac_sq) / d
+    centers[:, 1] = a[:, 1] + (ab[:, 0] * ac_sq - ac[:, 0] * ab_sq) / d
+    centers[:, 2] = (tris[:, 0, 2] + tris[:, 1, 2]) / 2
+
+    centers[degenerate] = tris[degenerate].mean(axis=1)
+    return centers, degenerate
+
+
+def orthocenter_many(triangles, tolerance: float = 1e-12) -> tuple:
+    """
+    Calculate the orthocenters of many triangles with the closed-form formula.
+
+    Uses the Euler line relation H = A + B + C - 2O with the circumcenter O.
+
+    Args:
+        triangles: Array (N, 3, 3) of triangle vertices (N, 3, 2 is padded with z = 0)
+        tolerance: Relative area tolerance below which a triangle counts as degenerate (default 1e-12)
+
+    Returns:
+        Tuple (centers, degenerate):
+            centers: Array (N, 3) of orthocenters; degenerate rows hold the centroid
+            degenerate: Boolean array (N,), True for collinear vertices
+
+    Example:
+        >>> from robo_manim_add_ons import orthocenter_many
+        >>>
+        >>> H, degenerate = orthocenter_many(tris)
+    """
+    tris = _as_triangles(triangles)
+    circumcenters, degenerate = circumcenter_many(tris, tolerance)
+
+    centers = tris.sum(axis=1) - 2 * circumcenters
+    centers[:, 2] = tris[:, 0, 2]
+    centers[degenerate] = tris[degenerate].mean(axis=1)
+    return centers, degenerate
+
+
+def incenter_many(triangles, tolerance: float = 1e-12) -> tuple:
+    """
+    Calculate the incenters of many triangles at once.
+
+    Args:
+        triangles: Array (N, 3, 3) of triangle vertices (N, 3, 2 is padded with z = 0)
+        tolerance: Relative area tolerance below which a triangle counts as degenerate (default 1e-12)
+
+    Returns:
+        Tuple (centers, degenerate):
+            centers: Array (N, 3) of incenters; rows with zero perimeter hold the centroid
+            degenerate: Boolean array (N,), True for collinear vertices
+
+    Example:
+        >>> from robo_manim_add_ons import incenter_many
+        >>>
+        >>> I, degenerate = incenter_many(tris)
+    """
+    tris = _as_triangles(triangles)
+    a, b, c = tris[:, 0], tris[:, 1], tris[:, 2]
+    _, degenerate = _degenerate_mask(tris, tolerance)
+
+    # Side lengths opposite to each vertex
+    len_a = np.linalg.norm(c - b, axis=1)
+    len_b = np.linalg.norm(c - a, axis=1)
+    len_c = np.linalg.norm(b - a, axis=1)
+    total = len_a + len_b + len_c
+
+    safe_total = np.where(total == 0, 1, total)
+    centers = (len_a[:, None] * a + len_b[:, None] * b + len_c[:, None] * c) / safe_total[:, None]
+    centers[total == 0] = tris[total == 0].mean(axis=1)
+    return centers, degenerate
@@ -0,0 +1,216 @@
+"""
+Lightweight value types for computation-only construction steps.
+
+P2, Seg and Circ hold just the numbers of a point, segment or circle. They expose
+the same accessors the helpers read from Dots, Lines and Circles (get_center,
+get_start, get_end, width, ...), so every helper accepts them, and helpers called
+with as_value=True return them instead of allocating mobjects. Call .to_mobject()
+to materialize the result once it should be drawn.
+"""
+
+import numpy as np
+from manim import Dot, Line, Circle
+from .coerce_utils import to_position
+
+
+class P2:
+    """
+    A point as three floats.
+
+    Example:
+        >>> from robo_manim_add_ons import P2, mid, project
+        >>>
+        >>> m = mid([0, 0, 0], [4, 0, 0], as_value=True)   # P2(2.0, 0.0, 0.0)
+        >>> foot = project(line, m, as_value=True)
+        >>> dot = foot.to_mobject(color=RED)
+    """
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y=None, z=0.0):
+        """
+        Initialize a point.
+
+        Args:
+            x: x-coordinate, or a point-like (np.array, list, tuple) when y is None
+            y: y-coordinate (default None)
+            z: z-coordinate (default 0.0)
+        """
+        if y is None:
+            coords = np.asarray(x, dtype=float).ravel()
+            self.x = float(coords[0])
+            self.y = float(coords[1])
+            self.z = float(coords[2]) if coords.size > 2 else 0.0
+        else:
+            self.x = float(x)
+            self.y = float(y)
+            self.z = float(z)
+
+    def get_center(self) -> np.ndarray:
+        """Position as a numpy array."""
+        return np.array([self.x, self.y, self.z])
+
+    # A point starts and ends at itself, like arrays in st() / ed()
+    get_start = get_center
+    get_end = get_center
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array([self.x, self.y, self.z], dtype=dtype)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __repr__(self):
+        return f"P2({self.x}, {self.y}, {self.z})"
+
+    def to_mobject(self, **kwargs) -> Dot:
+        """
+        Materialize as a Dot.
+
+        Args:
+            **kwargs: Additional arguments passed to Dot (color, radius, ...)
+
+        Returns:
+            Dot at this position
+        """
+        return Dot(self.get_center(), **kwargs)
+
+
+class Seg:
+    """
+    A segment given by its two endpoints.
+
+    Example:
+        >>> from robo_manim_add_ons import Seg, intersect_lines
+        >>>
+        >>> p = intersect_lines(Seg([-1, 0, 0], [1, 0, 0]), Seg([0, -1, 0], [0, 1, 0]), as_value=True)
+        >>> line = Seg(p, [2, 2, 0]).to_mobject(color=BLUE)
+    """
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start, end):
+        """
+        Initialize a segment.
+
+        Args:
+            start: Start point (P2, Dot, np.array, or list)
+            end: End point (P2, Dot, np.array, or list)
+        """
+        self.start = np.asarray(to_position(start), dtype=float)
+        self.end = np.asarray(to_position(end), dtype=float)
+
+    def get_start(self) -> np.ndarray:
+        return self.start.copy()
+
+    def get_end(self) -> np.ndarray:
+        return self.end.copy()
+
+    def get_start_and_end(self) -> tuple:
+        return self.get_start(), self.get_end()
+
+    def get_center(self) -> np.ndarray:
+        return (self.start + self.end) / 2
+
+    def get_vector(self) -> np.ndarray:
+        return self.end - self.start
+
+    def get_length(self) -> float:
+        return float(np.linalg.norm(self.end - self.start))
+
+    def get_unit_vector(self) -> np.ndarray:
+        vector = self.end - self.start
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else np.zeros(3)
+
+    def get_angle(self) -> float:
+        vector = self.end - self.start
+        return float(np.arctan2(vector[1], vector[0]))
+
+    def get_slope(self) -> float:
+        return float(np.tan(self.get_angle()))
+
+    def __repr__(self):
+        return f"Seg({self.start.tolist()}, {self.end.tolist()})"
+
+    def to_mobject(self, **kwargs) -> Line:
+        """
+        Materialize as a Line.
+
+        Args:
+            **kwargs: Additional arguments passed to Line (color, stroke_width, ...)
+
+        Returns:
+            Line between the two endpoints
+        """
+        return Line(self.start, self.end, **kwargs)
+
+
+class Circ:
+    """
+    A circle given by center and radius.
+
+    Example:
+        >>> from robo_manim_add_ons import Circ, icc
+        >>>
+        >>> points = icc(Circ([-1, 0, 0], 2), Circ([1, 0, 0], 2), as_value=True)
+        >>> circle = Circ(points[0], 1).to_mobject(color=GREEN)
+    """
+
+    __slots__ = ('center', 'radius')
+
+    def __init__(self, center, radius: float):
+        """
+        Initialize a circle.
+
+        Args:
+            center: Center point (P2, Dot, np.array, or list)
+            radius: Circle radius
+        """
+        self.center = np.asarray(to_position(center), dtype=float)
+        self.radius = float(radius)
+
+    def get_center(self) -> np.ndarray:
+        return self.center.copy()
+
+    def get_radius(self) -> float:
+        return self.radius
+
+    @property
+    def width(self) -> float:
+        return 2 * self.radius
+
+    @property
+    def height(self) -> float:
+        return 2 * self.radius
+
+    def __repr__(self):
+        return f"Circ({self.center.tolist()}, {self.radius})"
+
+    def to_mobject(self, **kwargs) -> Circle:
+        """
+        Materialize as a Circle.
+
+        Args:
+            **kwargs: Additional arguments passed to Circle (color, stroke_width, ...)
+
+        Returns:
+            Circle with this center and radius
+        """
+        return Circle(radius=self.radius, **kwargs).move_to(self.center)
+
+
+def point_result(position, as_value: bool = False):
+    """
+    Wrap a computed position as a P2 or a Dot.
+
+    Args:
+        position: Computed position
+        as_value: Return a P2 instead of a Dot (default False)
+
+    Returns:
+        P2 if as_value else Dot
+    """
+    if as_value:
+        return P2(position)
+    return Dot(position)
@@ -0,0 +1,310 @@
+"""
+3D vector operations on numpy arrays.
+
+Python counterparts of the 3D operations in docs/3d-vector-operations-design.md
+(pll3d, perp3d, perpshift3d, vecsum3d, vecdiff3d, vecproject3d, chain3d,
+placeat3d, decompose3d, forward3d, backward3d, reverse3d) plus cross product,
+triple product and skew-line distance kernels.
+
+Vectors are segments in the vector_core layout: (2, 3) arrays [start, end], or
+(N, 2, 3) for N vectors at once; Arrow3D/Line3D mobjects are accepted as input
+and read once. Results stay arrays until to_arrow3d() / to_line3d() /
+materialize3d() is called, so problem catalogs can be generated in bulk.
+"""
+
+import numpy as np
+from manim import Arrow3D, Line3D, VGroup
+from .coerce_utils import to_position
+from . import vector_core as vc
+
+
+def _seg(obj) -> np.ndarray:
+    """Segment array for a segment array, Arrow3D/Line3D or any object with get_start/get_end."""
+    if isinstance(obj, np.ndarray) and obj.ndim >= 2 and obj.shape[-2:] == (2, 3):
+        return obj.astype(float, copy=False)
+    return vc.segment(obj)
+
+
+def _point(obj) -> np.ndarray:
+    """Point (3,) or points (N, 3) from a Dot/array/list."""
+    if isinstance(obj, np.ndarray):
+        return obj.astype(float, copy=False)
+    return np.asarray(to_position(obj), dtype=float)
+
+
+def _direction(obj) -> np.ndarray:
+    """Direction arrays (3,) / (N, 3) as-is; end - start for vector mobjects."""
+    if isinstance(obj, np.ndarray):
+        return obj.astype(float, copy=False)
+    if isinstance(obj, (list, tuple)):
+        return np.asarray(obj, dtype=float)
+    return vc.direction(vc.segment(obj))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norm, out=np.zeros_like(vectors), where=norm > 0)
+
+
+def _centered(center: np.ndarray, unit: np.ndarray, length) -> np.ndarray:
+    half = unit * (np.asarray(length, dtype=float)[..., None] / 2)
+    return np.stack(np.broadcast_arrays(center - half, center + half), axis=-2)
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+
+def cross_product(a, b) -> np.ndarray:
+    """
+    Cross products of vectors.
+
+    Args:
+        a: Vectors (3,) / (N, 3), or a vector mobject
+        b: Vectors (3,) / (N, 3), or a vector mobject
+
+    Returns:
+        Array (3,) or (N, 3) of a x b
+
+    Example:
+        >>> from robo_manim_add_ons import cross_product
+        >>>
+        >>> cross_product(np.array([1, 0, 0]), np.array([0, 1, 0]))   # [0, 0, 1]
+    """
+    return np.cross(_direction(a), _direction(b))
+
+
+def triple_product(a, b, c) -> np.ndarray:
+    """
+    Scalar triple products a . (b x c), the signed volume of the parallelepiped.
+
+    Args:
+        a, b, c: Vectors (3,) / (N, 3), or vector mobjects
+
+    Returns:
+        Float or array (N,)
+
+    Example:
+        >>> from robo_manim_add_ons import triple_product
+        >>>
+        >>> triple_product(np.eye(3)[0], np.eye(3)[1], np.eye(3)[2])   # 1.0
+    """
+    return np.sum(_direction(a) * np.cross(_direction(b), _direction(c)), axis=-1)
+
+
+def skew_line_closest_points(line_a, line_b) -> tuple:
+    """
+    Closest points between two (infinite) lines.
+
+    Args:
+        line_a: Segment(s) (2, 3) / (N, 2, 3) or Line3D/Arrow3D
+        line_b: Segment(s) (2, 3) / (N, 2, 3) or Line3D/Arrow3D
+
+    Returns:
+        Tuple (points_on_a, points_on_b). For parallel lines the start of line_a
+        and its foot on line_b are returned.
+    """
+    a, b = _seg(line_a), _seg(line_b)
+    p, q = a[..., 0, :], b[..., 0, :]
+    u, v = vc.direction(a), vc.direction(b)
+    w = p - q
+    uu, uv, vv = np.sum(u * u, -1), np.sum(u * v, -1), np.sum(v * v, -1)
+    uw, vw = np.sum(u * w, -1), np.sum(v * w, -1)
+    denom = uu * vv - uv * uv
+    parallel = denom <= 1e-12 * uu * vv
+    safe = np.where(parallel, 1.0, denom)
+    s = np.where(parallel, 0.0, (uv * vw - vv * uw) / safe)
+    t = np.where(parallel, vw / np.where(vv > 0, vv, 1.0), (uu * vw - uv * uw) / safe)
+    return p + s[..., None] * u, q + t[..., None] * v
+
+
+def skew_line_distance(line_a, line_b) -> np.ndarray:
+    """
+    Distance between two (infinite) lines, skew or parallel.
+
+    Args:
+        line_a: Segment(s) (2, 3) / (N, 2, 3) or Line3D/Arrow3D
+        line_b: Segment(s) (2, 3) / (N, 2, 3) or Line3D/Arrow3D
+
+    Returns:
+        Float or array (N,)
+
+    Example:
+        >>> from robo_manim_add_ons import skew_line_distance
+        >>>
+        >>> a = np.array([[0, 0, 0], [1, 0, 0]])
+        >>> b = np.array([[0, 0, 2], [0, 1, 2]])
+        >>> skew_line_distance(a, b)   # 2.0
+    """
+    on_a, on_b = skew_line_closest_points(line_a, line_b)
+    return np.linalg.norm(on_a - on_b, axis=-1)
+
+
+# ============================================================================
+# Operations (see docs/3d-vector-operations-design.md)
+# ============================================================================
+
+def forward3d(vec, distance) -> np.ndarray:
+    """Vector slid forward along its own direction by distance."""
+    return vc.forward(_seg(vec), distance)
+
+
+def backward3d(vec, distance) -> np.ndarray:
+    """Vector slid backward against its own direction by distance."""
+    return vc.backward(_seg(vec), distance)
+
+
+def shift_to3d(vec, point) -> np.ndarray:
+    """Vector moved so it starts at point (same as placeat3d)."""
+    return vc.copy_at(_seg(vec), _point(point))
+
+
+def reverse3d(vec, point=None) -> np.ndarray:
+    """Reversed vector starting at point (default: the vector's own start)."""
+    seg = _seg(vec)
+    return vc.reverse_at(seg, seg[..., 0, :] if point is None else _point(point))
+
+
+def pll3d(vec, point, length=None) -> np.ndarray:
+    """
+    Parallel through a point, centered at the point.
+
+    Args:
+        vec: Reference vector(s) (segment array or Arrow3D/Line3D)
+        point: Center point(s)
+        length: Result length (default: the reference length)
+
+    Returns:
+        Segment array
+    """
+    seg = _seg(vec)
+    return _centered(_point(point), vc.unit(seg), vc.length(seg) if length is None else length)
+
+
+def perp3d(vec, point, axis, length=None) -> np.ndarray:
+    """
+    Perpendicular through a point, in the direction normalize(vec x axis).
+
+    Args:
+        vec: Reference vector(s) (segment array or Arrow3D/Line3D)
+        point: Center point(s)
+        axis: Axis resolving the perpendicular plane (direction array or vector mobject)
+        length: Result length (default: the reference length)
+
+    Returns:
+        Segment array (zero-length where vec and axis are parallel)
+    """
+    seg = _seg(vec)
+    unit = _normalize(np.cross(vc.unit(seg), _normalize(_direction(axis))))
+    return _centered(_point(point), unit, vc.length(seg) if length is None else length)
+
+
+def perpshift3d(vec, distance, axis) -> np.ndarray:
+    """Vector shifted by distance along normalize(vec x axis)."""
+    seg = _seg(vec)
+    unit = _normalize(np.cross(vc.unit(seg), _normalize(_direction(axis))))
+    return vc.shifted(seg, unit * np.asarray(distance, dtype=float)[..., None])
+
+
+def vecsum3d(vec_a, vec_b, point=None) -> np.ndarray:
+    """a + b, starting at point (default ORIGIN)."""
+    return vc.add(_seg(vec_a), _seg(vec_b), np.zeros(3) if point is None else _point(point))
+
+
+def vecdiff3d(vec_a, vec_b, point=None) -> np.ndarray:
+    """a - b, starting at point (default ORIGIN)."""
+    return vc.subtract(_seg(vec_a), _seg(vec_b), np.zeros(3) if point is None else _point(point))
+
+
+def vecproject3d(vec_to_project, vec_target) -> np.ndarray:
+    """Projection ((a . b) / (b . b)) b, starting at the target's start."""
+    return vc.project_onto(_seg(vec_to_project), _seg(vec_target))
+
+
+def chain3d(vec_a, vec_b) -> np.ndarray:
+    """vec_b moved so its tail sits at vec_a's tip."""
+    return vc.tail_at_tip(_seg(vec_a), _seg(vec_b))
+
+
+def placeat3d(vec, point) -> np.ndarray:
+    """Copy of the vector starting at point."""
+    return vc.copy_at(_seg(vec), _point(point))
+
+
+def decompose3d(vec) -> np.ndarray:
+    """
+    Axis components of a vector, all starting at its start.
+
+    Args:
+        vec: Vector(s) (segment array or Arrow3D/Line3D)
+
+    Returns:
+        Array (3, 2, 3), or (N, 3, 2, 3): the x, y and z component segments
+    """
+    seg = _seg(vec)
+    start = seg[..., 0, :]
+    ends = start[..., None, :] + np.eye(3) * vc.direction(seg)[..., None, :]
+    return np.stack(np.broadcast_arrays(start[..., None, :], ends), axis=-2)
+
+
+# ============================================================================
+# Materialization
+# ============================================================================
+
+def to_arrow3d(seg: np.ndarray, **kwargs):
+    """
+    Build Arrow3D mobjects from a segment array.
+
+    Args:
+        seg: Array (2, 3) or (..., 2, 3)
+        **kwargs: Additional arguments passed to Arrow3D (color, thickness, ...)
+
+    Returns:
+        Arrow3D for a single segment, VGroup of Arrow3D otherwise
+    """
+    seg = np.asarray(seg, dtype=float)
+    if seg.ndim == 2:
+        return Arrow3D(seg[0], seg[1], **kwargs)
+    return VGroup(*[Arrow3D(s[0], s[1], **kwargs) for s in seg.reshape(-1, 2, 3)])
+
+
+def to_line3d(seg: np.ndarray, **kwargs):
+    """
+    Build Line3D mobjects from a segment array.
+
+    Args:
+        seg: Array (2, 3) or (..., 2, 3)
+        **kwargs: Additional arguments passed to Line3D (color, thickness, ...)
+
+    Returns:
+        Line3D for a single segment, VGroup of Line3D otherwise
+    """
+    seg = np.asarray(seg, dtype=float)
+    if seg.ndim == 2:
+        return Line3D(seg[0], seg[1], **kwargs)
+    return VGroup(*[Line3D(s[0], s[1], **kwargs) for s in seg.reshape(-1, 2, 3)])
+
+
+def materialize3d(seg: np.ndarray, like=None, **kwargs):
+    """
+    Build the result with the same kind as the input: Line3D for a Line3D source,
+    Arrow3D otherwise (vector3d in, vector3d out; line3d in, line3d out).
+
+    Args:
+        seg: Array (2, 3) or (..., 2, 3)
+        like: The source mobject (default None, Arrow3D)
+        **kwargs: Additional arguments passed to the mobject
+
+    Returns:
+        Arrow3D/Line3D, or a VGroup of them for batched input
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import perp3d, materialize3d
+        >>>
+        >>> edge = Line3D(ORIGIN, RIGHT * 2)
+        >>> normal = materialize3d(perp3d(edge, RIGHT, OUT), like=edge, color=RED)   # a Line3D
+    """
+    if isinstance(like, Line3D) and not isinstance(like, Arrow3D):
+        return to_line3d(seg, **kwargs)
+    return to_arrow3d(seg, **kwargs)
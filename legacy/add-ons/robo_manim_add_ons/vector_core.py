@@ -0,0 +1,169 @@
+"""
+Numpy-only vector algebra on start/end arrays.
+
+A segment is an array of shape (2, 3) holding [start, end], or (N, 2, 3) for
+N segments at once; every function broadcasts over the leading dimensions.
+VectorUtils reads each mobject once with segment(), does all the algebra here
+and only builds Arrows/Lines for the final result, so chained operations never
+re-read or allocate intermediate mobjects.
+
+Example:
+    >>> from robo_manim_add_ons import vector_core as vc
+    >>>
+    >>> a = vc.segment([0, 0, 0], [3, 0, 0])
+    >>> b = vc.segment([0, 0, 0], [2, 1.5, 0])
+    >>> par, perp = vc.decompose(b, a), vc.decompose(b, a, perp=True)
+    >>> vc.add(par, perp)   # back to b: [[0, 0, 0], [2, 1.5, 0]]
+"""
+
+import numpy as np
+from .coerce_utils import to_position
+
+
+def segment(start, end=None) -> np.ndarray:
+    """
+    Build a segment array.
+
+    Args:
+        start: Start point, or a single vector object (Arrow/Line, anything with
+               get_start/get_end, or a (2, 3) / (N, 2, 3) array) when end is None
+        end: End point (default None)
+
+    Returns:
+        Array of shape (2, 3), or (N, 2, 3) for batched input
+
+    Raises:
+        TypeError: If start cannot be read as a vector
+    """
+    if end is not None:
+        return np.stack([np.asarray(to_position(start), dtype=float), np.asarray(to_position(end), dtype=float)])
+    if hasattr(start, 'get_start') and hasattr(start, 'get_end'):
+        return np.stack([np.asarray(start.get_start(), dtype=float), np.asarray(start.get_end(), dtype=float)])
+    arr = np.asarray(start, dtype=float)
+    if arr.ndim < 2 or arr.shape[-2] != 2:
+        raise TypeError(f"Expected a vector mobject or a (2, 3) array, got {type(start).__name__}")
+    if arr.shape[-1] == 2:
+        arr = np.concatenate([arr, np.zeros(arr.shape[:-1] + (1,))], axis=-1)
+    return arr
+
+
+def _pair(start, end) -> np.ndarray:
+    return np.stack(np.broadcast_arrays(start, end), axis=-2)
+
+
+def direction(seg: np.ndarray) -> np.ndarray:
+    """End minus start."""
+    return seg[..., 1, :] - seg[..., 0, :]
+
+
+def length(seg: np.ndarray) -> np.ndarray:
+    """Segment length."""
+    return np.linalg.norm(direction(seg), axis=-1)
+
+
+def unit(seg: np.ndarray) -> np.ndarray:
+    """Unit direction (zero for zero-length segments)."""
+    d = direction(seg)
+    norm = np.linalg.norm(d, axis=-1, keepdims=True)
+    return np.divide(d, norm, out=np.zeros_like(d), where=norm > 0)
+
+
+def perp_unit(seg: np.ndarray) -> np.ndarray:
+    """Unit direction rotated 90 degrees counterclockwise."""
+    u = unit(seg)
+    return np.stack([-u[..., 1], u[..., 0], np.zeros_like(u[..., 0])], axis=-1)
+
+
+def shifted(seg: np.ndarray, offset) -> np.ndarray:
+    """Segment moved by offset."""
+    return seg + np.asarray(offset, dtype=float)[..., None, :]
+
+
+def forward(seg: np.ndarray, distance) -> np.ndarray:
+    """Segment moved along its own direction by distance."""
+    return shifted(seg, unit(seg) * np.asarray(distance, dtype=float)[..., None])
+
+
+def backward(seg: np.ndarray, distance) -> np.ndarray:
+    """Segment moved against its own direction by distance."""
+    return forward(seg, -np.asarray(distance, dtype=float))
+
+
+def perp_move(seg: np.ndarray, distance) -> np.ndarray:
+    """Segment moved perpendicular to itself (positive = counterclockwise)."""
+    return shifted(seg, perp_unit(seg) * np.asarray(distance, dtype=float)[..., None])
+
+
+def shift_amount(target: np.ndarray, source: np.ndarray) -> np.ndarray:
+    """Offset that moves source's start onto target's end."""
+    return target[..., 1, :] - source[..., 0, :]
+
+
+def tail_at_tip(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Segment b moved so it starts at the end of a."""
+    return shifted(b, shift_amount(a, b))
+
+
+def copy_at(seg: np.ndarray, start) -> np.ndarray:
+    """Same direction and length, starting at start."""
+    start = np.asarray(start, dtype=float)
+    return _pair(start, start + direction(seg))
+
+
+def reverse_at(seg: np.ndarray, start) -> np.ndarray:
+    """Opposite direction, same length, starting at start."""
+    start = np.asarray(start, dtype=float)
+    return _pair(start, start - direction(seg))
+
+
+def projection_length(seg: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Signed length of seg's projection onto target's direction."""
+    return np.sum(direction(seg) * unit(target), axis=-1)
+
+
+def project_onto(seg: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Projection of seg onto target, starting at target's start."""
+    start = target[..., 0, :]
+    return _pair(start, start + projection_length(seg, target)[..., None] * unit(target))
+
+
+def decompose(seg: np.ndarray, against: np.ndarray, perp: bool = False) -> np.ndarray:
+    """
+    Parallel (default) or perpendicular component of seg relative to against.
+
+    The parallel component starts at seg's start; the perpendicular one starts
+    where the parallel component ends and finishes at seg's end.
+    """
+    start = seg[..., 0, :]
+    parallel_end = start + projection_length(seg, against)[..., None] * unit(against)
+    if perp:
+        return _pair(parallel_end, seg[..., 1, :])
+    return _pair(start, parallel_end)
+
+
+def projection_line(seg: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Segment from the projection endpoint to seg's end."""
+    return _pair(project_onto(seg, target)[..., 1, :], seg[..., 1, :])
+
+
+def projection_region(seg: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Triangle vertices (3, 3): target start, projection endpoint, seg end."""
+    return np.stack([target[..., 0, :], project_onto(seg, target)[..., 1, :], seg[..., 1, :]], axis=-2)
+
+
+def add(a: np.ndarray, b: np.ndarray, start=None) -> np.ndarray:
+    """a + b, starting at start (default a's start)."""
+    start = a[..., 0, :] if start is None else np.asarray(start, dtype=float)
+    return _pair(start, start + direction(a) + direction(b))
+
+
+def subtract(a: np.ndarray, b: np.ndarray, start=None) -> np.ndarray:
+    """a - b, starting at start (default a's start)."""
+    start = a[..., 0, :] if start is None else np.asarray(start, dtype=float)
+    return _pair(start, start + direction(a) - direction(b))
+
+
+def scalar_multiply(seg: np.ndarray, scalar, start=None) -> np.ndarray:
+    """scalar * seg, starting at start (default seg's start)."""
+    start = seg[..., 0, :] if start is None else np.asarray(start, dtype=float)
+    return _pair(start, start + direction(seg) * np.asarray(scalar, dtype=float)[..., None])
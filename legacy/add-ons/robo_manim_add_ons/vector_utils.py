@@ -2,16 +2,161 @@
 Vector utilities for Manim objects.
 
 Provides helper class for vector operations like forward projection.
+The algebra itself lives in vector_core (numpy start/end arrays); each method
+reads its input mobjects once and only materializes the final result. Result
+arrows are produced by an ArrowFactory that clones a prototype per style
+instead of building every Arrow (and its tip) from scratch.
 """
 
 import numpy as np
-from manim import Mobject, Arrow, Line, Polygon
-from manim.utils.space_ops import normalize
+from manim import Mobject, Arrow, Line, Polygon, VMobject, VGroup, WHITE, YELLOW, BLUE, RED, GREEN, ORANGE, PURPLE
+from .arrow_tips import segments_to_points
+from .field_utils import vector_field, arrow_segments
+from .coerce_utils import to_vectors
+from . import vector_core as vc
+
+
+class ArrowFactory:
+    """
+    Create Arrows by copying a cached prototype per style.
+
+    Arrow() regenerates its tip and initializes its style on every call. The
+    factory builds one prototype Arrow per distinct set of keyword arguments
+    and produces new arrows by copying it, setting the line between the new
+    endpoints and resizing the copied tip, the same way Arrow sizes it.
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import ArrowFactory
+        >>>
+        >>> factory = ArrowFactory()
+        >>> arrows = [factory.arrow(ORIGIN, [np.cos(a), np.sin(a), 0], buff=0, color=BLUE)
+        ...           for a in np.linspace(0, TAU, 100)]
+    """
+
+    def __init__(self, max_prototypes: int = 64):
+        """
+        Initialize an empty factory.
+
+        Args:
+            max_prototypes: Number of styles kept before the oldest is dropped (default 64)
+        """
+        self.max_prototypes = max_prototypes
+        self._prototypes = {}
+
+    @staticmethod
+    def _key(kwargs: dict) -> tuple:
+        """Hashable key for a set of Arrow keyword arguments."""
+        items = []
+        for name, value in sorted(kwargs.items()):
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+            items.append((name, value))
+        return tuple(items)
+
+    def prototype(self, **kwargs) -> Arrow:
+        """
+        Return the cached prototype Arrow for a style, creating it on first use.
+
+        Args:
+            **kwargs: Arrow keyword arguments (buff, color, tip_length, ...)
+
+        Returns:
+            The prototype (do not modify it; arrow() copies it)
+        """
+        key = self._key(kwargs)
+        proto = self._prototypes.get(key)
+        if proto is None:
+            buff = kwargs.get('buff', 0)
+            proto = Arrow(np.zeros(3), np.array([1.0 + 2 * buff, 0, 0]), **kwargs)
+            if len(self._prototypes) >= self.max_prototypes:
+                self._prototypes.pop(next(iter(self._prototypes)))
+            self._prototypes[key] = proto
+        return proto
+
+    def arrow(self, start: np.ndarray, end: np.ndarray, **kwargs) -> Arrow:
+        """
+        Create an Arrow from start to end, like Arrow(start, end, **kwargs).
+
+        Args:
+            start: Starting point of the arrow
+            end: Ending point of the arrow
+            **kwargs: Arrow keyword arguments (buff, color, tip_length, ...)
+
+        Returns:
+            New Arrow
+        """
+        start = np.array(start, dtype=float)
+        end = np.array(end, dtype=float)
+        if kwargs.get('path_arc', 0) or np.allclose(start, end):
+            return Arrow(start, end, **kwargs)
+
+        arrow = self.prototype(**kwargs).copy()
+        tip = arrow.pop_tips()[0]
+        arrow.start, arrow.end = start, end
+        arrow.set_points_by_ends(start, end, buff=arrow.buff)
+        tip.scale(arrow.get_default_tip_length() / tip.length)
+        arrow.add_tip(tip=tip)
+        arrow._set_stroke_width_from_length()
+        return arrow
+
+    def clear(self):
+        """Drop all cached prototypes."""
+        self._prototypes.clear()
+
+
+_arrow_factory = ArrowFactory()
+
+# Cubic bezier approximation of a unit circle (4 quarter arcs)
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+_UNIT_CIRCLE = np.array([
+    [1, 0, 0], [1, _KAPPA, 0], [_KAPPA, 1, 0], [0, 1, 0],
+    [0, 1, 0], [-_KAPPA, 1, 0], [-1, _KAPPA, 0], [-1, 0, 0],
+    [-1, 0, 0], [-1, -_KAPPA, 0], [-_KAPPA, -1, 0], [0, -1, 0],
+    [0, -1, 0], [_KAPPA, -1, 0], [1, -_KAPPA, 0], [1, 0, 0],
+], dtype=float)
+
+_CHAIN_COLORS = [BLUE, RED, GREEN, ORANGE, PURPLE]
+
+# Open-tipped textbook arrows for every result vector
+_ARROW_DEFAULTS = {
+    'buff': 0,
+    'fill_opacity': 0,
+    'max_tip_length_to_length_ratio': 0.15,
+    'tip_length': 0.2,
+}
+
+
+def _source_style(source: Mobject, arrow_kwargs: dict) -> dict:
+    """Arrow defaults with the source's color and stroke width, overridden by arrow_kwargs."""
+    style = dict(_ARROW_DEFAULTS)
+    if 'color' not in arrow_kwargs:
+        style['color'] = source.get_color()
+    if 'stroke_width' not in arrow_kwargs:
+        style['stroke_width'] = source.get_stroke_width()
+    style.update(arrow_kwargs)
+    return style
+
+
+def _arrows_mobject(starts: np.ndarray, vectors: np.ndarray, color, stroke_width: float,
+                    tip_length: float) -> VMobject:
+    """One VMobject holding open-tipped arrows for all non-zero vectors."""
+    keep = np.linalg.norm(vectors, axis=1) > 1e-8
+    mob = VMobject(stroke_color=color, stroke_width=stroke_width, fill_opacity=0)
+    if keep.any():
+        seg_starts, seg_ends = arrow_segments(starts[keep], vectors[keep], tip_length)
+        mob.set_points(segments_to_points(seg_starts.reshape(-1, 3), seg_ends.reshape(-1, 3)))
+    return mob
 
 
 class VectorUtils:
     """Utility class for vector operations on Manim objects."""
 
+    # Shared factory that builds the result arrows from cached prototypes
+    arrow_factory = _arrow_factory
+
     @staticmethod
     def create_vector(start: np.ndarray, end: np.ndarray, **kwargs) -> Arrow:
         """
@@ -31,14 +176,7 @@ class VectorUtils:
             >>>
             >>> vec = VectorUtils.create_vector(ORIGIN, RIGHT * 2, color=BLUE)
         """
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(kwargs)
-        return Arrow(start, end, **default_kwargs)
+        return _arrow_factory.arrow(start, end, **dict(_ARROW_DEFAULTS, **kwargs))
 
     @staticmethod
     def forward(source: Mobject, distance: float) -> Mobject:
@@ -64,14 +202,8 @@ class VectorUtils:
             >>> shifted_vector = VectorUtils.forward(source_vector, 1.5)
             >>> # Creates a copy of the arrow shifted 1.5 units to the right
         """
-        # Calculate shift direction
-        direction = source.get_end() - source.get_start()
-        direction_unit = direction / np.linalg.norm(direction)
-        shift_vector = direction_unit * distance
-        shifted_vector = source.copy()
-        shifted_vector.shift(shift_vector)
-
-        return shifted_vector
+        seg = vc.segment(source)
+        return source.copy().shift(vc.forward(seg, distance)[0] - seg[0])
 
     @staticmethod
     def backward(source: Mobject, distance: float) -> Mobject:
@@ -97,14 +229,8 @@ class VectorUtils:
             >>> shifted_vector = VectorUtils.backward(source_vector, 1.5)
             >>> # Creates a copy of the arrow shifted 1.5 units to the left
         """
-        # Calculate shift direction
-        direction = source.get_end() - source.get_start()
-        direction_unit = direction / np.linalg.norm(direction)
-        shift_vector = direction_unit * -distance
-        shifted_vector = source.copy()
-        shifted_vector.shift(shift_vector)
-
-        return shifted_vector
+        seg = vc.segment(source)
+        return source.copy().shift(vc.backward(seg, distance)[0] - seg[0])
 
     @staticmethod
     def perp_move(source: Mobject, distance: float) -> Mobject:
@@ -131,16 +257,8 @@ class VectorUtils:
             >>> shifted_vector = VectorUtils.perp_move(source_vector, 1.5)
             >>> # Creates a copy of the arrow shifted 1.5 units upward (perpendicular)
         """
-        # Calculate shift direction
-        direction = source.get_end() - source.get_start()
-        direction_unit = direction / np.linalg.norm(direction)
-        # Perpendicular: rotate direction by 90° counterclockwise: (x,y) -> (-y,x)
-        perp_direction = np.array([-direction_unit[1], direction_unit[0], 0])
-        shift_vector = perp_direction * distance
-        shifted_vector = source.copy()
-        shifted_vector.shift(shift_vector)
-
-        return shifted_vector
+        seg = vc.segment(source)
+        return source.copy().shift(vc.perp_move(seg, distance)[0] - seg[0])
 
     @staticmethod
     def tail_at_tip(vector_a: Mobject, vector_b: Mobject) -> Mobject:
@@ -166,17 +284,8 @@ class VectorUtils:
             >>> vector_b_shifted = VectorUtils.tail_at_tip(vector_a, vector_b)
             >>> # Creates a copy of vector_b starting at the tip of vector_a
         """
-        # Calculate direction of vector B
-        vec_b_direction = vector_b.get_end() - vector_b.get_start()
-
-        # Create a copy of vector_b positioned at tip of vector_a
-        shifted_vector = vector_b.copy()
-
-        # Calculate the shift needed: from vector_b's current start to vector_a's tip
-        shift_amount = vector_a.get_end() - vector_b.get_start()
-        shifted_vector.shift(shift_amount)
-
-        return shifted_vector
+        # Shift needed: from vector_b's current start to vector_a's tip
+        return vector_b.copy().shift(vc.shift_amount(vc.segment(vector_a), vc.segment(vector_b)))
 
     @staticmethod
     def shift_amount(vector_target: Mobject, vector_source: Mobject) -> np.ndarray:
@@ -203,9 +312,7 @@ class VectorUtils:
             >>> shift_vector = VectorUtils.shift_amount(vector_a, vector_b)
             >>> # In animation: self.play(vector_b.animate.shift(shift_vector))
         """
-        # Calculate shift needed: from source's start to target's end
-        shift_vector = vector_target.get_end() - vector_source.get_start()
-        return shift_vector
+        return vc.shift_amount(vc.segment(vector_target), vc.segment(vector_source))
 
     @staticmethod
     def copy_at(source: Mobject, start_point: np.ndarray, **arrow_kwargs) -> Mobject:
@@ -239,27 +346,8 @@ class VectorUtils:
             >>> side_a = VectorUtils.copy_at(vector_a, vector_b.get_end())
             >>> side_b = VectorUtils.copy_at(vector_b, vector_a.get_end())
         """
-        # Extract direction from source vector
-        direction = source.get_end() - source.get_start()
-
-        # Calculate end point
-        end_point = start_point + direction
-
-        # Get source properties as defaults
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,  # Open arrow tips (textbook style)
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2,
-            'color': source.get_color() if not 'color' in arrow_kwargs else arrow_kwargs['color'],
-            'stroke_width': source.get_stroke_width() if not 'stroke_width' in arrow_kwargs else arrow_kwargs['stroke_width'],
-        }
-
-        # Merge with provided kwargs (provided kwargs override defaults)
-        default_kwargs.update(arrow_kwargs)
-
-        # Create and return new arrow
-        return Arrow(start_point, end_point, **default_kwargs)
+        result = vc.copy_at(vc.segment(source), start_point)
+        return _arrow_factory.arrow(result[0], result[1], **_source_style(source, arrow_kwargs))
 
     @staticmethod
     def reverse_at(source: Mobject, start_point: np.ndarray, **arrow_kwargs) -> Mobject:
@@ -297,28 +385,8 @@ class VectorUtils:
             >>> # Step 2: Move -b to tip of a
             >>> neg_b_at_tip = VectorUtils.reverse_at(vector_b, vector_a.get_end(), color=PURPLE)
         """
-        # Extract direction from source vector and negate it
-        direction = source.get_end() - source.get_start()
-        reversed_direction = -direction
-
-        # Calculate end point
-        end_point = start_point + reversed_direction
-
-        # Get source properties as defaults
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,  # Open arrow tips (textbook style)
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2,
-            'color': source.get_color() if not 'color' in arrow_kwargs else arrow_kwargs['color'],
-            'stroke_width': source.get_stroke_width() if not 'stroke_width' in arrow_kwargs else arrow_kwargs['stroke_width'],
-        }
-
-        # Merge with provided kwargs (provided kwargs override defaults)
-        default_kwargs.update(arrow_kwargs)
-
-        # Create and return new arrow
-        return Arrow(start_point, end_point, **default_kwargs)
+        result = vc.reverse_at(vc.segment(source), start_point)
+        return _arrow_factory.arrow(result[0], result[1], **_source_style(source, arrow_kwargs))
 
     @staticmethod
     def project_onto(vector_to_project: Mobject, vector_target: Mobject, **arrow_kwargs) -> Mobject:
@@ -346,27 +414,8 @@ class VectorUtils:
             >>> projection = VectorUtils.project_onto(vector_b, vector_a)
             >>> # Creates arrow showing component of vector_b along vector_a
         """
-        # Extract direction vectors
-        target_direction = vector_target.get_end() - vector_target.get_start()
-        to_project_direction = vector_to_project.get_end() - vector_to_project.get_start()
-
-        # Calculate projection using dot product
-        target_unit = normalize(target_direction)
-        proj_length = np.dot(to_project_direction, target_unit)
-
-        # Calculate projection endpoint
-        proj_endpoint = vector_target.get_start() + proj_length * target_unit
-
-        # Create projection arrow
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(arrow_kwargs)
-
-        return Arrow(vector_target.get_start(), proj_endpoint, **default_kwargs)
+        result = vc.project_onto(vc.segment(vector_to_project), vc.segment(vector_target))
+        return _arrow_factory.arrow(result[0], result[1], **dict(_ARROW_DEFAULTS, **arrow_kwargs))
 
     @staticmethod
     def decompose(source: Mobject, decompose_against: Mobject, perp: bool = False, **arrow_kwargs) -> Mobject:
@@ -405,33 +454,8 @@ class VectorUtils:
             >>> perp = VectorUtils.decompose(vector_a, vector_b, perp=True, color=ORANGE)
             >>> # Now: vector_a = parallel + perp (visually)
         """
-        # Calculate vector directions
-        vec_source_direction = source.get_end() - source.get_start()
-        vec_against_direction = decompose_against.get_end() - decompose_against.get_start()
-
-        # Calculate parallel component (projection of source onto decompose_against)
-        against_unit = normalize(vec_against_direction)
-        parallel_magnitude = np.dot(vec_source_direction, against_unit)
-        parallel_component = parallel_magnitude * against_unit
-
-        # Create arrow with styling
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(arrow_kwargs)
-
-        if not perp:
-            # Return parallel component
-            parallel_endpoint = source.get_start() + parallel_component
-            return Arrow(source.get_start(), parallel_endpoint, **default_kwargs)
-        else:
-            # Return perpendicular component
-            perp_start_point = source.get_start() + parallel_component
-            perp_endpoint = source.get_end()
-            return Arrow(perp_start_point, perp_endpoint, **default_kwargs)
+        result = vc.decompose(vc.segment(source), vc.segment(decompose_against), perp=perp)
+        return _arrow_factory.arrow(result[0], result[1], **dict(_ARROW_DEFAULTS, **arrow_kwargs))
 
     @staticmethod
     def projection_line(vector_to_project: Mobject, vector_target: Mobject, **line_kwargs) -> Mobject:
@@ -459,17 +483,8 @@ class VectorUtils:
             >>> proj_line = VectorUtils.projection_line(vector_b, vector_a)
             >>> # Creates line showing perpendicular component
         """
-        # Extract direction vectors
-        target_direction = vector_target.get_end() - vector_target.get_start()
-        to_project_direction = vector_to_project.get_end() - vector_to_project.get_start()
-
-        # Calculate projection endpoint
-        target_unit = normalize(target_direction)
-        proj_length = np.dot(to_project_direction, target_unit)
-        proj_endpoint = vector_target.get_start() + proj_length * target_unit
-
-        # Create line from projection endpoint to original vector tip
-        return Line(proj_endpoint, vector_to_project.get_end(), **line_kwargs)
+        result = vc.projection_line(vc.segment(vector_to_project), vc.segment(vector_target))
+        return Line(result[0], result[1], **line_kwargs)
 
     @staticmethod
     def projection_region(vector_to_project: Mobject, vector_target: Mobject, **polygon_kwargs) -> Mobject:
@@ -501,22 +516,9 @@ class VectorUtils:
             >>> region = VectorUtils.projection_region(vector_b, vector_a, fill_opacity=0.3)
             >>> # Creates shaded triangle showing projection relationship
         """
-        # Extract direction vectors
-        target_direction = vector_target.get_end() - vector_target.get_start()
-        to_project_direction = vector_to_project.get_end() - vector_to_project.get_start()
-
-        # Calculate projection endpoint
-        target_unit = normalize(target_direction)
-        proj_length = np.dot(to_project_direction, target_unit)
-        proj_endpoint = vector_target.get_start() + proj_length * target_unit
-
-        # Create triangle: origin -> projection endpoint -> vector tip -> origin
-        return Polygon(
-            vector_target.get_start(),
-            proj_endpoint,
-            vector_to_project.get_end(),
-            **polygon_kwargs
-        )
+        # Triangle: origin -> projection endpoint -> vector tip -> origin
+        return Polygon(*vc.projection_region(vc.segment(vector_to_project), vc.segment(vector_target)),
+                       **polygon_kwargs)
 
     @staticmethod
     def add(vector_a: Mobject, vector_b: Mobject, start_point: np.ndarray = None, **arrow_kwargs) -> Mobject:
@@ -547,23 +549,8 @@ class VectorUtils:
             >>> result = VectorUtils.add(vector_a, vector_b, color=GREEN)
             >>> # Creates green arrow from ORIGIN to (2, 1.5, 0)
         """
-        vec_a_dir = vector_a.get_end() - vector_a.get_start()
-        vec_b_dir = vector_b.get_end() - vector_b.get_start()
-
-        if start_point is None:
-            start_point = vector_a.get_start()
-
-        result_end = start_point + vec_a_dir + vec_b_dir
-
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(arrow_kwargs)
-
-        return Arrow(start_point, result_end, **default_kwargs)
+        result = vc.add(vc.segment(vector_a), vc.segment(vector_b), start_point)
+        return _arrow_factory.arrow(result[0], result[1], **dict(_ARROW_DEFAULTS, **arrow_kwargs))
 
     @staticmethod
     def subtract(vector_a: Mobject, vector_b: Mobject, start_point: np.ndarray = None, **arrow_kwargs) -> Mobject:
@@ -606,23 +593,8 @@ class VectorUtils:
             >>> result = VectorUtils.subtract(vector_a, vector_b, color=GREEN)
             >>> self.play(GrowArrow(result))
         """
-        vec_a_dir = vector_a.get_end() - vector_a.get_start()
-        vec_b_dir = vector_b.get_end() - vector_b.get_start()
-
-        if start_point is None:
-            start_point = vector_a.get_start()
-
-        result_end = start_point + vec_a_dir - vec_b_dir
-
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(arrow_kwargs)
-
-        return Arrow(start_point, result_end, **default_kwargs)
+        result = vc.subtract(vc.segment(vector_a), vc.segment(vector_b), start_point)
+        return _arrow_factory.arrow(result[0], result[1], **dict(_ARROW_DEFAULTS, **arrow_kwargs))
 
     @staticmethod
     def scalar_multiply(vector: Mobject, scalar: float, start_point: np.ndarray = None, **arrow_kwargs) -> Mobject:
@@ -660,23 +632,190 @@ class VectorUtils:
             >>> reversed_vec = VectorUtils.scalar_multiply(vector_a, -1, color=RED)
             >>> # Creates red arrow from ORIGIN to (-2, 0, 0)
         """
-        vec_dir = vector.get_end() - vector.get_start()
-        scaled_dir = vec_dir * scalar
+        result = vc.scalar_multiply(vc.segment(vector), scalar, start_point)
+        return _arrow_factory.arrow(result[0], result[1], **dict(_ARROW_DEFAULTS, **arrow_kwargs))
+
+    # ============================================================================
+    # Linear Combinations, Spans and Lattices (batched)
+    # ============================================================================
+
+    @staticmethod
+    def coefficient_grid(*ranges) -> np.ndarray:
+        """
+        All coefficient combinations for the given per-basis ranges.
+
+        Args:
+            *ranges: One entry per basis vector: a tuple (min, max) for integers
+                     min..max or (min, max, step), or a list/array of explicit values
+
+        Returns:
+            Array (N, k) with one row per combination
+
+        Example:
+            >>> from robo_manim_add_ons.vector_utils import VectorUtils
+            >>>
+            >>> coeffs = VectorUtils.coefficient_grid((-2, 2), (-2, 2))   # 25 integer pairs
+            >>> coeffs = VectorUtils.coefficient_grid([0, 1, 2], (0, 1, 0.5))   # 3 x 3 combinations
+        """
+        axes = []
+        for r in ranges:
+            if isinstance(r, tuple):
+                step = r[2] if len(r) > 2 else 1
+                axes.append(np.arange(r[0], r[1] + step / 2, step, dtype=float))
+            else:
+                axes.append(np.asarray(r, dtype=float).ravel())
+        mesh = np.meshgrid(*axes, indexing='ij')
+        return np.stack([m.ravel() for m in mesh], axis=1)
 
-        if start_point is None:
-            start_point = vector.get_start()
+    @staticmethod
+    def combination_points(basis, coefficients, origin: np.ndarray = None) -> np.ndarray:
+        """
+        Endpoints of many linear combinations, computed in one matrix product.
 
-        end_point = start_point + scaled_dir
+        Args:
+            basis: k basis vectors (Arrows/Lines, arrays, or a (k, 2|3) array)
+            coefficients: Array (N, k) of coefficients (e.g. from coefficient_grid)
+            origin: Point the combinations start from (default ORIGIN)
 
-        default_kwargs = {
-            'buff': 0,
-            'fill_opacity': 0,
-            'max_tip_length_to_length_ratio': 0.15,
-            'tip_length': 0.2
-        }
-        default_kwargs.update(arrow_kwargs)
+        Returns:
+            Array (N, 3) of origin + sum_i c_i * b_i
 
-        return Arrow(start_point, end_point, **default_kwargs)
+        Example:
+            >>> from manim import *
+            >>> from robo_manim_add_ons.vector_utils import VectorUtils
+            >>>
+            >>> points = VectorUtils.combination_points([RIGHT, UP + RIGHT], [[1, 1], [2, -1]])
+        """
+        vectors = to_vectors(basis)
+        coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+        if coefficients.shape[1] != len(vectors):
+            raise ValueError(f"Expected {len(vectors)} coefficients per row, got {coefficients.shape[1]}")
+        start = np.zeros(3) if origin is None else np.asarray(origin, dtype=float)
+        return start + coefficients @ vectors
+
+    @staticmethod
+    def lattice(basis, coefficients=None, origin: np.ndarray = None, radius: float = 0.04,
+                color=WHITE, **kwargs) -> VMobject:
+        """
+        Lattice of combination points drawn as one VMobject of filled discs.
+
+        Args:
+            basis: k basis vectors (Arrows/Lines, arrays, or a (k, 2|3) array)
+            coefficients: Array (N, k) of coefficients (default: integers -3..3 for every basis vector)
+            origin: Point the combinations start from (default ORIGIN)
+            radius: Disc radius (default 0.04)
+            color: Disc color (default WHITE)
+            **kwargs: Additional arguments passed to VMobject
+
+        Returns:
+            VMobject with one circular subpath per lattice point
+
+        Example:
+            >>> from manim import *
+            >>> from robo_manim_add_ons.vector_utils import VectorUtils
+            >>>
+            >>> skewed = VectorUtils.lattice([RIGHT, 0.5 * RIGHT + UP], color=YELLOW)
+        """
+        if coefficients is None:
+            coefficients = VectorUtils.coefficient_grid(*[(-3, 3)] * len(to_vectors(basis)))
+        centers = VectorUtils.combination_points(basis, coefficients, origin)
+        points = centers[:, None, :] + radius * _UNIT_CIRCLE[None, :, :]
+        mob = VMobject(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+        mob.set_points(points.reshape(-1, 3))
+        return mob
+
+    @staticmethod
+    def span_grid(basis, coefficient_range=(-3, 3), origin: np.ndarray = None, color=BLUE,
+                  stroke_width: float = 1, **kwargs) -> VMobject:
+        """
+        Grid lines of the span of two basis vectors as one VMobject.
+
+        Draws the lines c1 = const and c2 = const for every integer in coefficient_range,
+        the skewed grid of a basis-change lesson.
+
+        Args:
+            basis: Two basis vectors (Arrows/Lines, arrays, or a (2, 2|3) array)
+            coefficient_range: (min, max) integer range for both coefficients (default (-3, 3))
+            origin: Point the grid is anchored at (default ORIGIN)
+            color: Line color (default BLUE)
+            stroke_width: Line width (default 1)
+            **kwargs: Additional arguments passed to VMobject
+
+        Returns:
+            VMobject with one straight subpath per grid line
+
+        Example:
+            >>> from manim import *
+            >>> from robo_manim_add_ons.vector_utils import VectorUtils
+            >>>
+            >>> grid = VectorUtils.span_grid([RIGHT + 0.5 * UP, UP], color=TEAL)
+        """
+        b1, b2 = to_vectors(basis)[:2]
+        low, high = coefficient_range
+        values = np.arange(low, high + 1, dtype=float)
+        start = np.zeros(3) if origin is None else np.asarray(origin, dtype=float)
+        starts = np.concatenate([start + values[:, None] * b1 + low * b2, start + low * b1 + values[:, None] * b2])
+        ends = np.concatenate([start + values[:, None] * b1 + high * b2, start + high * b1 + values[:, None] * b2])
+        mob = VMobject(stroke_color=color, stroke_width=stroke_width, **kwargs)
+        mob.set_points(segments_to_points(starts, ends))
+        return mob
+
+    @staticmethod
+    def combination_chains(basis, coefficients, origin: np.ndarray = None, colors=None,
+                           show_result: bool = True, result_color=YELLOW, stroke_width: float = 3,
+                           tip_length: float = 0.2) -> VGroup:
+        """
+        Tip-to-tail chains c_1 b_1 + c_2 b_2 + ... for many coefficient rows at once.
+
+        All chain positions come from one cumulative sum; the arrows for basis vector i
+        across every chain are a single VMobject, so N chains of k vectors cost k
+        (+1 for the results) VMobjects instead of N * k Arrows.
+
+        Args:
+            basis: k basis vectors (Arrows/Lines, arrays, or a (k, 2|3) array)
+            coefficients: Array (N, k) of coefficients
+            origin: Point every chain starts from (default ORIGIN)
+            colors: One color per basis vector (default: the basis Arrows' colors, else a fixed cycle)
+            show_result: Also draw origin -> combination arrows (default True)
+            result_color: Color of the result arrows (default YELLOW)
+            stroke_width: Arrow stroke width (default 3)
+            tip_length: Open tip length (default 0.2)
+
+        Returns:
+            VGroup of k VMobjects (one per basis vector), plus the result VMobject if show_result
+
+        Example:
+            >>> from manim import *
+            >>> from robo_manim_add_ons.vector_utils import VectorUtils
+            >>>
+            >>> a = Arrow(ORIGIN, RIGHT * 2, buff=0, color=BLUE)
+            >>> b = Arrow(ORIGIN, UP, buff=0, color=RED)
+            >>> chains = VectorUtils.combination_chains([a, b], [[1, 1], [0.5, 2], [-1, 1.5]])
+        """
+        vectors = to_vectors(basis)
+        coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+        if coefficients.shape[1] != len(vectors):
+            raise ValueError(f"Expected {len(vectors)} coefficients per row, got {coefficients.shape[1]}")
+        if colors is None:
+            colors = [b.get_color() if isinstance(b, Mobject) else _CHAIN_COLORS[i % len(_CHAIN_COLORS)]
+                      for i, b in enumerate(basis)]
+
+        start = np.zeros(3) if origin is None else np.asarray(origin, dtype=float)
+        terms = coefficients[:, :, None] * vectors[None, :, :]          # (N, k, 3)
+        positions = start + np.cumsum(terms, axis=1) - terms           # start of each term
+
+        group = VGroup(*[
+            _arrows_mobject(positions[:, i], terms[:, i], colors[i], stroke_width, tip_length)
+            for i in range(len(vectors))
+        ])
+        if show_result:
+            results = terms.sum(axis=1)
+            group.add(_arrows_mobject(np.broadcast_to(start, results.shape), results, result_color,
+                                      stroke_width, tip_length))
+        return group
+
+    # Batched vector field renderer (see field_utils.vector_field)
+    vector_field = staticmethod(vector_field)
 
     # ============================================================================
     # 2-Letter Aliases for Common Methods